@@ -0,0 +1,73 @@
+"""
+Benchmark: tarfile "w:gz" versus Archiver's parallel gzip
+
+Usage:
+    python benchmarks/bench_archive.py [PATH] [--workers 1,4,8]
+
+Archives PATH (default: the Python standard library) as tar.gz with
+tarfile's single-threaded gzip and with Archiver at each worker count,
+checks that the output decompresses, and reports time, throughput and
+compressed size. The speedup scales with the number of cores.
+"""
+
+import argparse
+import gzip
+import os
+import shutil
+import sys
+import tarfile
+import tempfile
+import time
+
+# Add parent directory to path so 'src' can be imported
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.archive import Archiver
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("path", nargs="?", default=os.path.dirname(os.__file__))
+    parser.add_argument("--workers", default=f"1,{os.cpu_count() or 1}",
+                        help="Comma-separated worker counts")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="bench_archive_")
+    source = os.path.abspath(args.path)
+    try:
+        destination = os.path.join(workdir, "baseline.tar.gz")
+
+        def baseline():
+            with tarfile.open(destination, "w:gz", compresslevel=6) as tar:
+                tar.add(source, os.path.basename(source))
+
+        elapsed, _ = timed(baseline)
+        with tarfile.open(destination) as tar:
+            size_in = sum(member.size for member in tar)
+        print(f"{source}: {size_in / 2**20:.0f} MB\n")
+        print(f"  {'tarfile w:gz':<24} {elapsed * 1000:9.1f} ms  "
+              f"{size_in / 2**20 / elapsed:8.0f} MB/s  {os.path.getsize(destination) / 2**20:7.1f} MB")
+
+        for workers in (int(w) for w in args.workers.split(",")):
+            destination = os.path.join(workdir, f"parallel_{workers}.tar.gz")
+            archiver = Archiver(max_workers=workers)
+            # Default excludes would skip __pycache__, which the baseline includes
+            elapsed, result = timed(lambda: archiver.compress(
+                source, destination, use_default_excludes=False))
+            with gzip.open(destination) as f:
+                while f.read(1024 * 1024):
+                    pass  # Raises if the stream is corrupt
+            print(f"  {f'Archiver x{workers}':<24} {elapsed * 1000:9.1f} ms  "
+                  f"{result['bytes_in'] / 2**20 / elapsed:8.0f} MB/s  {result['bytes_out'] / 2**20:7.1f} MB")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
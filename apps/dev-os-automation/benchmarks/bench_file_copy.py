@@ -0,0 +1,70 @@
+"""
+Benchmark: shutil.copy2 versus ChunkedCopier
+
+Usage:
+    python benchmarks/bench_file_copy.py [--sizes 1,64,512] [--buffer-mb 8] [--dir PATH]
+
+Copies files of each size (in MB) with shutil.copy2, with ChunkedCopier
+using kernel copy (copy_file_range/sendfile) and with ChunkedCopier in
+buffered mode, and reports wall-clock time and throughput. --dir selects
+the filesystem to test on; copy_file_range only helps where the kernel
+and filesystem support it.
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+# Add parent directory to path so 'src' can be imported
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.file_copy import ChunkedCopier
+
+
+def make_file(path: str, size_mb: int) -> None:
+    block = os.urandom(1024 * 1024)
+    with open(path, "wb") as f:
+        for _ in range(size_mb):
+            f.write(block)
+
+
+def timed(func) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--sizes", default="1,64,512", help="Comma-separated sizes in MB")
+    parser.add_argument("--buffer-mb", type=int, default=8)
+    parser.add_argument("--dir", help="Directory to benchmark in (default: system temp)")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="bench_copy_", dir=args.dir)
+    buffer_size = args.buffer_mb * 1024 * 1024
+    contenders = [
+        ("shutil.copy2", lambda src, dst: shutil.copy2(src, dst)),
+        ("ChunkedCopier", ChunkedCopier(buffer_size).copy),
+        ("ChunkedCopier buffered", ChunkedCopier(buffer_size, use_kernel_copy=False).copy),
+    ]
+    try:
+        for size_mb in (int(s) for s in args.sizes.split(",")):
+            source = os.path.join(workdir, f"src_{size_mb}.bin")
+            make_file(source, size_mb)
+            print(f"\n{size_mb} MB")
+            for label, copy in contenders:
+                destination = os.path.join(workdir, "dst.bin")
+                elapsed = min(timed(lambda: copy(source, destination)) for _ in range(3))
+                os.remove(destination)
+                print(f"  {label:<24} {elapsed * 1000:9.1f} ms  {size_mb / elapsed:8.0f} MB/s")
+            os.remove(source)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
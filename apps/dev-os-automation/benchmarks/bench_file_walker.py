@@ -0,0 +1,116 @@
+"""
+Benchmark: Path.rglob + is_file + stat versus the shared FileWalker
+
+Usage:
+    python benchmarks/bench_file_walker.py [--dirs 400] [--files 50] [--root PATH]
+
+Builds a synthetic tree (unless --root is given), then runs a name search
+both ways and reports wall-clock time and the number of Python-level
+os.stat/os.lstat/os.scandir calls. DirEntry.stat() is counted separately
+because it happens in C and cannot be intercepted.
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add parent directory to path so 'src' can be imported
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.file_walker import FileWalker
+
+
+class SyscallCounter:
+    """Counts calls to os.stat, os.lstat and os.scandir while active"""
+
+    NAMES = ("stat", "lstat", "scandir")
+
+    def __enter__(self):
+        self.counts = {name: 0 for name in self.NAMES}
+        self._originals = {name: getattr(os, name) for name in self.NAMES}
+        for name, original in self._originals.items():
+            setattr(os, name, self._wrap(name, original))
+        return self
+
+    def _wrap(self, name, original):
+        def counted(*args, **kwargs):
+            self.counts[name] += 1
+            return original(*args, **kwargs)
+        return counted
+
+    def __exit__(self, *exc):
+        for name, original in self._originals.items():
+            setattr(os, name, original)
+
+
+def build_tree(root: Path, dirs: int, files: int) -> None:
+    for d in range(dirs):
+        directory = root / f"pkg{d % 20}" / f"mod{d}"
+        directory.mkdir(parents=True, exist_ok=True)
+        for f in range(files):
+            suffix = ".py" if f % 5 == 0 else ".txt"
+            (directory / f"file{f}{suffix}").write_bytes(b"x" * (f * 10))
+
+
+def rglob_search(root: Path, pattern: str) -> int:
+    matches = 0
+    for item in root.rglob(pattern):
+        if item.is_file():
+            item.stat()
+            matches += 1
+    return matches
+
+
+def walker_search(root: Path, pattern: str) -> int:
+    import fnmatch
+    matches = 0
+    for entry in FileWalker().walk(str(root)):
+        if fnmatch.fnmatch(entry.name, pattern):
+            entry.stat()
+            matches += 1
+    return matches
+
+
+def run(label: str, func, root: Path, pattern: str) -> None:
+    with SyscallCounter() as counter:
+        start = time.perf_counter()
+        matches = func(root, pattern)
+        elapsed = (time.perf_counter() - start) * 1000
+    calls = ", ".join(f"{name}={count}" for name, count in counter.counts.items())
+    print(f"{label:<18} {elapsed:9.1f} ms  matches={matches}  {calls}")
+    if func is walker_search:
+        print(f"{'':<18} DirEntry.stat calls={matches}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--dirs", type=int, default=400)
+    parser.add_argument("--files", type=int, default=50)
+    parser.add_argument("--pattern", default="*.py")
+    parser.add_argument("--root", help="Benchmark an existing tree instead of a synthetic one")
+    args = parser.parse_args()
+
+    tmp = None
+    if args.root:
+        root = Path(args.root)
+    else:
+        tmp = tempfile.mkdtemp(prefix="bench_walker_")
+        root = Path(tmp)
+        build_tree(root, args.dirs, args.files)
+        print(f"Synthetic tree: {args.dirs} dirs x {args.files} files in {root}")
+
+    try:
+        for _ in range(2):  # Second round runs with a warm dentry cache
+            run("rglob+is_file+stat", rglob_search, root, args.pattern)
+            run("FileWalker", walker_search, root, args.pattern)
+    finally:
+        if tmp:
+            shutil.rmtree(tmp, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Load test: event-loop latency while large file jobs run
+
+Usage:
+    python benchmarks/load_test_event_loop.py [--port 8765] [--copy-mb 512] [--search-root PATH]
+
+Starts the server in a subprocess, then measures GET / and /ws ack
+round-trip latency while idle and again while a large background copy
+and a content search stream run. With file I/O on the dedicated pool the
+two latency profiles should be close.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+import requests
+from websockets.sync.client import connect
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def wait_for_server(base: str, timeout: float = 20.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            requests.get(base + "/", timeout=0.5)
+            return
+        except requests.RequestException:
+            time.sleep(0.2)
+    raise RuntimeError("Server did not start")
+
+
+def sample_latency(base: str, ws_url: str, seconds: float) -> dict:
+    http, ws = [], []
+    deadline = time.monotonic() + seconds
+    with connect(ws_url) as socket:
+        while time.monotonic() < deadline:
+            start = time.perf_counter()
+            requests.get(base + "/", timeout=10)
+            http.append((time.perf_counter() - start) * 1000)
+
+            start = time.perf_counter()
+            socket.send(json.dumps({"type": "ping"}))
+            while json.loads(socket.recv()).get("type") != "ack":
+                pass  # Skip activity broadcasts from the running jobs
+            ws.append((time.perf_counter() - start) * 1000)
+            time.sleep(0.02)
+    return {"http": http, "ws": ws}
+
+
+def summarize(label: str, samples: dict) -> None:
+    for kind, values in samples.items():
+        values = sorted(values)
+        p99 = values[min(len(values) - 1, int(len(values) * 0.99))]
+        print(f"{label:<10} {kind:<5} n={len(values):4d}  p50={statistics.median(values):7.2f} ms"
+              f"  p99={p99:7.2f} ms  max={values[-1]:7.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--copy-mb", type=int, default=512)
+    parser.add_argument("--search-root", default=os.path.expanduser("~"))
+    parser.add_argument("--seconds", type=float, default=5.0)
+    args = parser.parse_args()
+
+    base = f"http://127.0.0.1:{args.port}"
+    ws_url = f"ws://127.0.0.1:{args.port}/ws"
+    workdir = tempfile.mkdtemp(prefix="load_test_")
+    source = os.path.join(workdir, "source.bin")
+    with open(source, "wb") as f:
+        block = os.urandom(1024 * 1024)
+        for _ in range(args.copy_mb):
+            f.write(block)
+
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "src.server:app", "--port", str(args.port),
+         "--log-level", "warning"],
+        cwd=APP_DIR)
+    try:
+        wait_for_server(base)
+        summarize("idle", sample_latency(base, ws_url, args.seconds))
+
+        def search():
+            params = {"directory": args.search_root, "pattern": "import", "search_type": "content"}
+            with requests.get(base + "/files/search", params=params, stream=True) as response:
+                for _ in response.iter_lines():
+                    pass
+
+        requests.post(base + "/execute", json={"action": "copy_file", "params": {
+            "source": source, "destination": os.path.join(workdir, "copy.bin")}})
+        searcher = threading.Thread(target=search, daemon=True)
+        searcher.start()
+        summarize("loaded", sample_latency(base, ws_url, args.seconds))
+    finally:
+        server.terminate()
+        server.wait()
+        for name in os.listdir(workdir):
+            os.remove(os.path.join(workdir, name))
+        os.rmdir(workdir)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,10 +3,16 @@ Application Controller - Application Control Operations
 Requirements 2.1-2.5: Application management
 """
 
+import os
 import subprocess
 import platform
 from typing import List, Optional
 from src.models import AppInfo, ActionResult
+from src.process_snapshot import ProcessSnapshotService
+from src.process_metrics import SORT_KEYS, ProcessMetricsService
+from src.executable_index import ExecutableIndex
+from src.spawner import ProcessSpawner
+from src.app_index import AMBIGUITY_MARGIN, DEFAULT_BUDGET_MS, AppMatch, AppMatcher, normalize
 
 
 class AppController:
@@ -15,8 +21,14 @@ class AppController:
     Requirement 2.1-2.5: Application control
     """
     
-    def __init__(self):
+    def __init__(self, processes: Optional[ProcessSnapshotService] = None,
+                 metrics: Optional[ProcessMetricsService] = None):
         self.os_type = platform.system()
+        self.processes = processes or ProcessSnapshotService()
+        self.metrics = metrics or ProcessMetricsService(self.processes)
+        self.executables = ExecutableIndex()
+        self.spawner = ProcessSpawner()
+        self.app_matcher = AppMatcher()
     
     def launch(self, app_name: str, app_path: str = None) -> ActionResult:
         """
@@ -24,27 +36,26 @@ class AppController:
         Requirement 2.1: Launch the application by name or path
         """
         try:
-            if self.os_type == "Windows":
-                if app_path:
-                    subprocess.Popen(app_path)
-                else:
-                    # Search in common paths
-                    subprocess.Popen(f"start {app_name}", shell=True)
-            
-            elif self.os_type == "Darwin":  # macOS
-                if app_path:
-                    subprocess.run(['open', app_path])
-                else:
-                    subprocess.run(['open', '-a', app_name])
+            target = app_path or app_name
+            argv = self.executables.resolve(target)
+            if argv is None:
+                # Fail before forking anything
+                return ActionResult(
+                    success=False,
+                    action="launch_app",
+                    message=f"Application not found: {target}",
+                    error="AppNotFoundError"
+                )
             
-            else:  # Linux
-                subprocess.Popen([app_name])
+            # Spawned directly, without a shell, and reaped in the background when it exits
+            process = self.spawner.spawn(argv)
             
             return ActionResult(
                 success=True,
                 action="launch_app",
                 message=f"Application launched: {app_name}",
-                output={"app_name": app_name}
+                output={"app_name": app_name, "argv": argv, "pid": process.pid,
+                        "spawn_ms": round(process.spawn_ms, 3)}
             )
         except Exception as e:
             return ActionResult(
@@ -54,37 +65,96 @@ class AppController:
                 error=str(e)
             )
     
-    def close(self, app_name: str, graceful: bool = True) -> ActionResult:
+    def launch_stats(self) -> ActionResult:
+        """Launched processes still running, and spawn latency percentiles"""
+        return ActionResult(
+            success=True,
+            action="launch_stats",
+            message="Launched process statistics",
+            output={**self.spawner.stats(),
+                    "processes": [process.to_dict() for process in self.spawner.running()]}
+        )
+    
+    def close(self, app_name: str, graceful: bool = True, timeout: float = 5.0) -> ActionResult:
         """
         Close an application gracefully
         Requirement 2.2: Terminate the application gracefully
+        
+        graceful=True asks first: SIGTERM, or on Windows taskkill without /F,
+        which posts WM_CLOSE to the app's windows. Processes still running
+        after timeout seconds are killed.
         """
         try:
-            if self.os_type == "Windows":
-                if graceful:
-                    subprocess.run(['taskkill', '/IM', f"{app_name}.exe"], 
-                                 check=False)
-                else:
-                    subprocess.run(['taskkill', '/F', '/IM', f"{app_name}.exe"], 
-                                 check=False)
+            try:
+                import psutil
+                snapshot = self.processes.snapshot()
+            except ImportError:
+                return self._close_by_name(app_name, graceful)
             
-            elif self.os_type == "Darwin":
-                if graceful:
-                    subprocess.run(['killall', app_name], check=False)
-                else:
-                    subprocess.run(['killall', '-9', app_name], check=False)
+            # Same matching as killall/taskkill /IM: every process with this name
+            key = normalize(app_name)[0]
+            targets = [info for info in snapshot.processes.values()
+                       if info.name and normalize(info.name)[0] == key and info.pid != os.getpid()]
+            if not targets:
+                return ActionResult(
+                    success=False,
+                    action="close_app",
+                    message=f"No running application found: {app_name}",
+                    error="AppNotFoundError"
+                )
             
-            else:  # Linux
-                if graceful:
-                    subprocess.run(['killall', app_name], check=False)
-                else:
-                    subprocess.run(['killall', '-9', app_name], check=False)
+            outcomes = {}
+            procs = []
+            for info in targets:
+                outcome = {"pid": info.pid, "name": info.name, "outcome": None, "returncode": None}
+                outcomes[info.pid] = outcome
+                try:
+                    proc = psutil.Process(info.pid)
+                    if info.create_time is not None and proc.create_time() != info.create_time:
+                        outcome["outcome"] = "already_exited"  # PID reused by another process
+                        continue
+                    if not graceful:
+                        proc.kill()
+                    elif self.os_type != "Windows":
+                        proc.terminate()
+                    procs.append(proc)
+                except psutil.NoSuchProcess:
+                    outcome["outcome"] = "already_exited"
+                except psutil.AccessDenied:
+                    outcome["outcome"] = "access_denied"
+            if graceful and self.os_type == "Windows" and procs:
+                # psutil's terminate() is TerminateProcess, i.e. a kill
+                self._request_close([proc.pid for proc in procs])
             
+            # One bounded wait for the whole app, then force only the survivors
+            gone, alive = psutil.wait_procs(procs, timeout=timeout)
+            for proc in gone:
+                outcomes[proc.pid].update(outcome="terminated" if graceful else "killed",
+                                          returncode=self._returncode(proc))
+            if alive:
+                for proc in alive:
+                    try:
+                        proc.kill()
+                    except psutil.NoSuchProcess:
+                        pass
+                    except psutil.AccessDenied:
+                        outcomes[proc.pid]["outcome"] = "access_denied"
+                killed, alive = psutil.wait_procs(alive, timeout=timeout)
+                for proc in killed:
+                    outcomes[proc.pid].update(outcome="killed", returncode=self._returncode(proc))
+                for proc in alive:
+                    outcomes[proc.pid]["outcome"] = outcomes[proc.pid]["outcome"] or "survived"
+            
+            results = list(outcomes.values())
+            failed = [r for r in results if r["outcome"] in ("access_denied", "survived")]
+            closed = len(results) - len(failed)
             return ActionResult(
-                success=True,
+                success=not failed,
                 action="close_app",
-                message=f"Application closed: {app_name}",
-                output={"app_name": app_name}
+                message=(f"Application closed: {app_name} ({closed} processes)" if not failed else
+                         f"Closed {closed} of {len(results)} processes of {app_name}"),
+                output={"app_name": app_name, "processes": results},
+                error="CloseFailedError" if failed else None
             )
         except Exception as e:
             return ActionResult(
@@ -94,6 +164,46 @@ class AppController:
                 error=str(e)
             )
     
+    @staticmethod
+    def _returncode(proc) -> Optional[int]:
+        """Exit code set by wait_procs; only known for our own children"""
+        return int(proc.returncode) if proc.returncode is not None else None
+    
+    @staticmethod
+    def _request_close(pids: List[int]) -> None:
+        """Ask Windows processes to close their windows; ones without a window ignore it"""
+        argv = ["taskkill"]
+        for pid in pids:
+            argv += ["/PID", str(pid)]
+        try:
+            subprocess.run(argv, capture_output=True, check=False, timeout=10,
+                           creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0))
+        except (OSError, subprocess.SubprocessError):
+            pass  # The wait below forces whatever is still running
+    
+    def _close_by_name(self, app_name: str, graceful: bool) -> ActionResult:
+        """Signal processes by name with the OS tools when psutil is unavailable"""
+        if self.os_type == "Windows":
+            if graceful:
+                subprocess.run(['taskkill', '/IM', f"{app_name}.exe"], 
+                             check=False)
+            else:
+                subprocess.run(['taskkill', '/F', '/IM', f"{app_name}.exe"], 
+                             check=False)
+        
+        else:  # macOS and Linux
+            if graceful:
+                subprocess.run(['killall', app_name], check=False)
+            else:
+                subprocess.run(['killall', '-9', app_name], check=False)
+        
+        return ActionResult(
+            success=True,
+            action="close_app",
+            message=f"Application closed: {app_name}",
+            output={"app_name": app_name}
+        )
+    
     def focus(self, app_name: str) -> ActionResult:
         """
         Bring application window to foreground
@@ -140,19 +250,17 @@ class AppController:
         try:
             apps = []
             
-            if self.os_type == "Windows":
-                try:
-                    import psutil
-                    for proc in psutil.process_iter(['pid', 'name']):
-                        try:
-                            apps.append({
-                                "pid": proc.info['pid'],
-                                "name": proc.info['name'],
-                                "title": proc.info['name']
-                            })
-                        except:
-                            pass
-                except:
+            try:
+                # Served from the background-sampled process table and metrics
+                for app in self.processes.snapshot().apps:
+                    sample = self.metrics.latest(app["pid"])
+                    apps.append({
+                        **app,
+                        "memory_mb": round(sample.memory_mb, 1) if sample else 0,
+                        "cpu_percent": round(sample.cpu_percent, 1) if sample else 0
+                    })
+            except ImportError:
+                if self.os_type == "Windows":
                     # Fallback using tasklist
                     result = subprocess.run(['tasklist'], capture_output=True, text=True)
                     for line in result.stdout.split('\n')[3:]:
@@ -165,36 +273,6 @@ class AppController:
                                     "title": parts[0]
                                 })
             
-            elif self.os_type == "Darwin":
-                try:
-                    import psutil
-                    for proc in psutil.process_iter(['pid', 'name']):
-                        try:
-                            apps.append({
-                                "pid": proc.info['pid'],
-                                "name": proc.info['name'],
-                                "title": proc.info['name']
-                            })
-                        except:
-                            pass
-                except:
-                    pass
-            
-            else:  # Linux
-                try:
-                    import psutil
-                    for proc in psutil.process_iter(['pid', 'name']):
-                        try:
-                            apps.append({
-                                "pid": proc.info['pid'],
-                                "name": proc.info['name'],
-                                "title": proc.info['name']
-                            })
-                        except:
-                            pass
-                except:
-                    pass
-            
             return ActionResult(
                 success=True,
                 action="list_apps",
@@ -209,20 +287,60 @@ class AppController:
                 error=str(e)
             )
     
-    def find_app(self, app_name: str) -> ActionResult:
+    def top_processes(self, limit: int = 10, sort_by: str = "cpu", history: bool = False) -> ActionResult:
         """
-        Find running application by name
-        Requirement 2.5: Detect when name matches multiple apps
+        Processes using the most CPU or memory, from the latest metrics sample
+        Requirement 2.4: Report resource usage of running applications
         """
         try:
-            # Get all running apps
-            result = self.list_running_apps()
+            if sort_by not in SORT_KEYS:
+                raise ValueError(f"sort_by must be one of {', '.join(SORT_KEYS)}")
             
-            if not result.success:
-                return result
+            processes = self.processes.snapshot().processes
+            top = []
+            for pid, sample in self.metrics.top(limit, sort_by):
+                info = processes.get(pid)
+                entry = {
+                    "pid": pid,
+                    "name": info.name if info else None,
+                    "cpu_percent": round(sample.cpu_percent, 1),
+                    "memory_mb": round(sample.memory_mb, 1)
+                }
+                if history:
+                    entry["history"] = [
+                        {"timestamp": s.timestamp, "cpu_percent": round(s.cpu_percent, 1),
+                         "memory_mb": round(s.memory_mb, 1)}
+                        for s in self.metrics.history_for(pid)
+                    ]
+                top.append(entry)
+            
+            return ActionResult(
+                success=True,
+                action="top_processes",
+                message=f"Top {len(top)} processes by {sort_by}",
+                output={"processes": top, "sort_by": sort_by, "interval": self.metrics.interval}
+            )
+        except Exception as e:
+            return ActionResult(
+                success=False,
+                action="top_processes",
+                message="Failed to read process metrics",
+                error=str(e)
+            )
+    
+    def find_app(self, app_name: str, budget_ms: float = DEFAULT_BUDGET_MS) -> ActionResult:
+        """
+        Find running application by name, best match first
+        Requirement 2.5: Detect when name matches multiple apps
+        """
+        try:
+            try:
+                snapshot = self.processes.snapshot()
+            except ImportError:
+                return self._find_app_by_substring(app_name)
             
-            apps = result.output.get('apps', [])
-            matches = [app for app in apps if app_name.lower() in app['name'].lower()]
+            ranked, partial = self.app_matcher.find(snapshot, app_name, budget_ms=budget_ms)
+            matches = [self._match_to_dict(match) for match in ranked]
             
             if len(matches) == 0:
                 return ActionResult(
@@ -232,21 +350,23 @@ class AppController:
                     error="AppNotFoundError"
                 )
             
-            elif len(matches) > 1:
+            # Ambiguous only when other apps score about as well as the best one
+            contenders = [match for match in matches
+                          if ranked[0].score - match["score"] < AMBIGUITY_MARGIN]
+            if len(contenders) > 1:
                 return ActionResult(
                     success=True,
                     action="find_app",
-                    message=f"Multiple applications match '{app_name}': {len(matches)} found. Please clarify which one.",
-                    output={"matches": matches, "ambiguous": True}
+                    message=f"Multiple applications match '{app_name}': {len(contenders)} found. Please clarify which one.",
+                    output={"matches": contenders, "ambiguous": True, "partial": partial}
                 )
             
-            else:
-                return ActionResult(
-                    success=True,
-                    action="find_app",
-                    message=f"Found application: {matches[0]['name']}",
-                    output={"app": matches[0], "ambiguous": False}
-                )
+            return ActionResult(
+                success=True,
+                action="find_app",
+                message=f"Found application: {matches[0]['name']}",
+                output={"app": matches[0], "matches": matches, "ambiguous": False, "partial": partial}
+            )
         except Exception as e:
             return ActionResult(
                 success=False,
@@ -254,3 +374,45 @@ class AppController:
                 message="Failed to find application",
                 error=str(e)
             )
+    
+    @staticmethod
+    def _match_to_dict(match: AppMatch) -> dict:
+        return {
+            "pid": match.pid,
+            "name": match.name,
+            "title": match.name,
+            "score": match.score,
+            "pids": list(match.pids),
+            "has_window": match.has_window,
+            "match": match.match,
+        }
+    
+    def _find_app_by_substring(self, app_name: str) -> ActionResult:
+        """Unranked fallback when the process table is unavailable (no psutil)"""
+        result = self.list_running_apps()
+        if not result.success:
+            return result
+        
+        apps = result.output.get('apps', [])
+        matches = [app for app in apps if app_name.lower() in (app['name'] or '').lower()]
+        
+        if len(matches) == 0:
+            return ActionResult(
+                success=False,
+                action="find_app",
+                message=f"No running application found: {app_name}",
+                error="AppNotFoundError"
+            )
+        if len(matches) > 1:
+            return ActionResult(
+                success=True,
+                action="find_app",
+                message=f"Multiple applications match '{app_name}': {len(matches)} found. Please clarify which one.",
+                output={"matches": matches, "ambiguous": True}
+            )
+        return ActionResult(
+            success=True,
+            action="find_app",
+            message=f"Found application: {matches[0]['name']}",
+            output={"app": matches[0], "ambiguous": False}
+        )
@@ -0,0 +1,358 @@
+"""
+App Index - Ranked fuzzy lookup of running applications
+Requirement 2.5: Resolve an app name to the process the user means
+"""
+
+import ctypes
+import functools
+import os
+import re
+import shutil
+import subprocess
+import sys
+import threading
+import time
+from typing import Dict, FrozenSet, List, Mapping, NamedTuple, Optional, Set, Tuple
+from src.process_snapshot import ProcessInfo, ProcessSnapshot
+
+DEFAULT_BUDGET_MS = 50.0
+AMBIGUITY_MARGIN = 0.05  # Groups scoring this close to the best are reported as ambiguous
+WINDOW_CACHE_SECONDS = 2.0
+MAX_ROOT_DEPTH = 32
+STALE_NAME_SLACK = 256  # Names of exited processes kept in the trie before a rebuild
+RESOURCE_CANDIDATES = 20  # Groups whose memory use is looked up per query
+
+# Text match scores, best first
+SCORE_EXACT = 1.0
+SCORE_TOKEN = 0.9
+SCORE_PREFIX = 0.8
+SCORE_TOKEN_PREFIX = 0.7
+SCORE_FUZZY = 0.6  # Minus FUZZY_PENALTY per edit
+FUZZY_PENALTY = 0.15
+SCORE_SUBSTRING = 0.4
+# Boosts added to the best member score of a group
+BOOST_WINDOW = 0.25
+BOOST_ROOT = 0.1  # The matched process is the app itself, not one of its helpers
+BOOST_MEMORY = 0.04  # Scaled by memory use; below AMBIGUITY_MARGIN so it orders but never disambiguates
+
+_STRIP_SUFFIXES = (".exe", ".app", ".bin", ".appimage")
+_WORD = re.compile(r"[A-Za-z0-9]+")
+_CAMEL = re.compile(r"[A-Z]+(?![a-z])|[A-Z]?[a-z]+|\d+")
+
+
+@functools.lru_cache(maxsize=8192)
+def normalize(name: str) -> Tuple[str, FrozenSet[str]]:
+    """Lookup key (lowercase alphanumerics) and word tokens of an app name"""
+    lowered = name.lower()
+    for suffix in _STRIP_SUFFIXES:
+        if lowered.endswith(suffix):
+            name = name[:-len(suffix)]
+            break
+    words = _WORD.findall(name)
+    tokens = {word.lower() for word in words}
+    for word in words:
+        tokens.update(part.lower() for part in _CAMEL.findall(word))
+    return "".join(word.lower() for word in words), frozenset(tokens)
+
+
+def max_edits(word: str) -> int:
+    """Edit distance tolerated for a query word: none for very short ones"""
+    return 0 if len(word) <= 2 else 1 if len(word) <= 5 else 2
+
+
+class _TrieNode:
+    __slots__ = ("children", "names", "terminal")
+
+    def __init__(self):
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.names: Set[str] = set()  # Keys of every word below this node
+        self.terminal: Set[str] = set()  # Keys of the words ending here
+
+
+class AppMatch(NamedTuple):
+    pid: int  # The app's root process
+    name: str
+    score: float
+    pids: Tuple[int, ...]  # Root and matching helper processes
+    has_window: bool
+    match: str  # exact, token, prefix, token_prefix, fuzzy or substring
+
+
+class AppIndex:
+    """
+    Name index over the process table. Each distinct name is indexed by its
+    normalized key and its word tokens in a prefix trie; fuzzy matches are
+    found by walking the trie with an edit-distance row, which prunes whole
+    branches as soon as they cannot come within range. The trie is updated
+    incrementally as snapshots change: new names are inserted, names of
+    exited processes stay until enough of them pile up to warrant a rebuild.
+    """
+
+    def __init__(self):
+        self.snapshot: Optional[ProcessSnapshot] = None
+        self.root = _TrieNode()
+        self.pids_by_key: Dict[str, List[int]] = {}
+        self.names: Dict[str, str] = {}  # key -> display name, including stale keys
+
+    def update(self, snapshot: ProcessSnapshot) -> None:
+        """Re-point the index at snapshot, inserting names not seen before"""
+        pids_by_key: Dict[str, List[int]] = {}
+        for pid, info in snapshot.processes.items():
+            if not info.name:
+                continue
+            key, tokens = normalize(info.name)
+            if not key:
+                continue
+            pids = pids_by_key.get(key)
+            if pids is None:
+                pids = pids_by_key[key] = []
+                if key not in self.names:
+                    self.names[key] = info.name
+                    for word in tokens | {key}:
+                        self._insert(word, key)
+            pids.append(pid)
+        self.pids_by_key = pids_by_key
+        self.snapshot = snapshot
+        if len(self.names) > 2 * len(pids_by_key) + STALE_NAME_SLACK:
+            self.root = _TrieNode()
+            self.names = {}
+            self.update(snapshot)
+
+    def _insert(self, word: str, key: str) -> None:
+        node = self.root
+        node.names.add(key)
+        for char in word:
+            node = node.children.setdefault(char, _TrieNode())
+            node.names.add(key)
+        node.terminal.add(key)
+
+    def _node(self, prefix: str) -> Optional[_TrieNode]:
+        node = self.root
+        for char in prefix:
+            node = node.children.get(char)
+            if node is None:
+                return None
+        return node
+
+    def text_matches(self, query: str, deadline: float) -> Dict[str, Tuple[float, str]]:
+        """Best text score and match kind per name key"""
+        key, query_tokens = normalize(query)
+        scores: Dict[str, Tuple[float, str]] = {}
+        if not key:
+            return scores
+
+        def offer(name_key: str, score: float, kind: str) -> None:
+            if name_key in self.pids_by_key and score > scores.get(name_key, (0.0, ""))[0]:
+                scores[name_key] = (score, kind)
+
+        offer(key, SCORE_EXACT, "exact")
+        node = self._node(key)
+        if node is not None:
+            for name_key in node.terminal:
+                offer(name_key, SCORE_TOKEN, "token")
+            for name_key in node.names:
+                kind = "prefix" if name_key.startswith(key) else "token_prefix"
+                offer(name_key, SCORE_PREFIX if kind == "prefix" else SCORE_TOKEN_PREFIX, kind)
+        for token in query_tokens - {key}:
+            if len(token) < 3:
+                continue  # "3" in "python3" would prefix-match half the table
+            node = self._node(token)
+            if node is not None:
+                for name_key in node.names:
+                    offer(name_key, SCORE_TOKEN_PREFIX * 0.9, "token_prefix")
+        if scores and max(score for score, _ in scores.values()) >= SCORE_TOKEN_PREFIX:
+            return scores  # Good matches already; skip the fuzzy and substring passes
+
+        if time.monotonic() < deadline:
+            for name_key, edits in self._fuzzy(key, max_edits(key), deadline).items():
+                offer(name_key, SCORE_FUZZY - FUZZY_PENALTY * edits, "fuzzy")
+        if time.monotonic() < deadline and len(key) >= 3:
+            for name_key in self.pids_by_key:
+                if key in name_key:
+                    offer(name_key, SCORE_SUBSTRING, "substring")
+        return scores
+
+    def _fuzzy(self, word: str, limit: int, deadline: float) -> Dict[str, int]:
+        """
+        Name keys with a token or key within limit edits of word. Edits are
+        optimal string alignment: a swapped pair of letters counts as one.
+        """
+        found: Dict[str, int] = {}
+        if limit == 0:
+            return found
+        first_row = list(range(len(word) + 1))
+        stack = [(child, char, first_row, None, "") for char, child in self.root.children.items()]
+        visited = 0
+        while stack:
+            node, char, previous, before, previous_char = stack.pop()
+            visited += 1
+            if visited % 256 == 0 and time.monotonic() > deadline:
+                break
+            row = [previous[0] + 1]
+            for i in range(1, len(word) + 1):
+                cost = min(row[i - 1] + 1, previous[i] + 1,
+                           previous[i - 1] + (word[i - 1] != char))
+                if (before is not None and i > 1 and word[i - 1] == previous_char
+                        and word[i - 2] == char):
+                    cost = min(cost, before[i - 2] + 1)
+                row.append(cost)
+            if row[-1] <= limit:
+                for name_key in node.terminal:
+                    found[name_key] = min(found.get(name_key, limit), row[-1])
+            if min(row) <= limit:
+                stack.extend((child, next_char, row, previous, char)
+                             for next_char, child in node.children.items())
+        return found
+
+class AppMatcher:
+    """
+    Ranks running apps for a spoken or typed name. Helper processes are
+    folded into the app that spawned them, then groups are ranked by text
+    match, window ownership and memory use. Work stops at the latency
+    budget and the best ranking found so far is returned.
+    """
+
+    def __init__(self):
+        self.index = AppIndex()
+        self._index_lock = threading.Lock()  # Guards the trie while it is updated or read
+        self._lock = threading.Lock()
+        self._windows: Optional[Tuple[float, FrozenSet[int]]] = None
+        self._refreshing_windows = False
+
+    def find(self, snapshot: ProcessSnapshot, query: str,
+             budget_ms: float = DEFAULT_BUDGET_MS, limit: int = 10) -> Tuple[List[AppMatch], bool]:
+        """Ranked matches, best first, and whether the budget cut the search short"""
+        deadline = time.monotonic() + budget_ms / 1000
+        with self._index_lock:
+            index = self.index
+            if index.snapshot is None or index.snapshot.sequence != snapshot.sequence:
+                index.update(snapshot)
+            scores = index.text_matches(query, deadline)
+            pids_by_key = index.pids_by_key
+
+        # Fold matching processes into their apps
+        groups: Dict[int, dict] = {}
+        for name_key, (score, kind) in scores.items():
+            for pid in pids_by_key[name_key]:
+                root = self._app_root(snapshot.processes, pid, scores)
+                group = groups.setdefault(root, {"score": 0.0, "kind": kind, "pids": []})
+                group["pids"].append(pid)
+                member_score = score + (BOOST_ROOT if pid == root else 0.0)
+                if member_score > group["score"]:
+                    group["score"], group["kind"] = member_score, kind
+
+        windows = self.window_pids() if time.monotonic() < deadline else frozenset()
+        for root, group in groups.items():
+            group["has_window"] = root in windows or any(pid in windows for pid in group["pids"])
+            if group["has_window"]:
+                group["score"] += BOOST_WINDOW
+
+        ranked = sorted(groups.items(), key=lambda item: item[1]["score"], reverse=True)
+        self._boost_by_memory(ranked[:RESOURCE_CANDIDATES], deadline)
+        ranked.sort(key=lambda item: item[1]["score"], reverse=True)
+
+        matches = []
+        for root, group in ranked[:limit]:
+            matches.append(AppMatch(
+                pid=root,
+                name=snapshot.processes[root].name,
+                score=round(group["score"], 3),
+                pids=tuple(sorted(set(group["pids"]) | {root})),
+                has_window=group["has_window"],
+                match=group["kind"],
+            ))
+        return matches, time.monotonic() > deadline
+
+    @staticmethod
+    def _app_root(processes: Mapping[int, ProcessInfo], pid: int,
+                  matched: Dict[str, Tuple[float, str]]) -> int:
+        """
+        Topmost ancestor that is the same app as pid: it matched the query
+        too and shares a name token (chrome -> chrome, Code Helper -> Code).
+        """
+        root = pid
+        key, tokens = normalize(processes[pid].name)
+        for _ in range(MAX_ROOT_DEPTH):
+            parent = processes.get(processes[root].ppid or 0)
+            if parent is None or parent.pid == root or not parent.name:
+                break
+            parent_key, parent_tokens = normalize(parent.name)
+            if parent_key not in matched or not tokens & parent_tokens:
+                break
+            root = parent.pid
+        return root
+
+    @staticmethod
+    def _boost_by_memory(ranked: List[Tuple[int, dict]], deadline: float) -> None:
+        """Favour the heavier of otherwise similar apps (a real editor over a stray CLI)"""
+        if len(ranked) < 2:
+            return
+        import psutil
+
+        usage = {}
+        for root, group in ranked:
+            if time.monotonic() > deadline:
+                return
+            try:
+                usage[root] = psutil.Process(root).memory_info().rss
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                usage[root] = 0
+        largest = max(usage.values()) or 1
+        for root, group in ranked:
+            group["score"] += BOOST_MEMORY * usage.get(root, 0) / largest
+
+    def window_pids(self) -> FrozenSet[int]:
+        """
+        PIDs owning a visible top-level window. Only the first call waits for
+        the window list; once it is older than WINDOW_CACHE_SECONDS the cached
+        set is still returned while a background thread fetches a new one.
+        """
+        windows = self._windows
+        if windows is None:
+            with self._lock:
+                if self._windows is None:
+                    self._windows = (time.monotonic(), frozenset(window_owner_pids()))
+                return self._windows[1]
+        taken_at, pids = windows
+        if time.monotonic() - taken_at >= WINDOW_CACHE_SECONDS and not self._refreshing_windows:
+            with self._lock:
+                if not self._refreshing_windows:
+                    self._refreshing_windows = True
+                    threading.Thread(target=self._refresh_windows, name="window-pids",
+                                     daemon=True).start()
+        return pids
+
+    def _refresh_windows(self) -> None:
+        try:
+            self._windows = (time.monotonic(), frozenset(window_owner_pids()))
+        finally:
+            self._refreshing_windows = False
+
+
+def window_owner_pids() -> Set[int]:
+    """Best-effort set of PIDs with a visible top-level window; empty if unknown"""
+    pids: Set[int] = set()
+    try:
+        if sys.platform == "win32":
+            user32 = ctypes.windll.user32
+            pid = ctypes.c_ulong()
+
+            @ctypes.WINFUNCTYPE(ctypes.c_bool, ctypes.c_void_p, ctypes.c_void_p)
+            def collect(hwnd, _):
+                if user32.IsWindowVisible(hwnd) and user32.GetWindowTextLengthW(hwnd):
+                    user32.GetWindowThreadProcessId(hwnd, ctypes.byref(pid))
+                    pids.add(pid.value)
+                return True
+
+            user32.EnumWindows(collect, 0)
+        elif shutil.which("wmctrl") and os.environ.get("DISPLAY"):
+            # wmctrl -lp: window id, desktop, pid, host, title
+            output = subprocess.run(["wmctrl", "-lp"], capture_output=True, text=True,
+                                    timeout=1).stdout
+            for line in output.splitlines():
+                parts = line.split(None, 3)
+                if len(parts) >= 3 and parts[2].isdigit():
+                    pids.add(int(parts[2]))
+    except (OSError, AttributeError, subprocess.SubprocessError):
+        pass
+    return pids
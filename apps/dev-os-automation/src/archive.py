@@ -0,0 +1,478 @@
+"""
+Archive - Streaming compress/extract for zip, tar and tar.gz
+Requirement 1.3: Package and unpack files and folders
+"""
+
+import os
+import struct
+import tarfile
+import threading
+import time
+import zipfile
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, List, Optional, Tuple, Union
+from src.file_walker import FileWalker
+
+ARCHIVE_FORMATS = {".tar.gz": "tar.gz", ".tgz": "tar.gz", ".tar": "tar", ".zip": "zip"}
+DEFAULT_LEVEL = 6
+GZIP_BLOCK_SIZE = 1024 * 1024  # Uncompressed bytes deflated per worker task
+GZIP_WINDOW = 32 * 1024  # Deflate window; each block is primed with this much of the previous one
+PART_SUFFIX = ".part"
+ZIP64_THRESHOLD = 0x7FFFFFFF
+
+
+class ArchiveCancelled(Exception):
+    """Raised when compress/extract is cancelled"""
+
+    def __init__(self, bytes_done: int):
+        super().__init__(f"Archive operation cancelled after {bytes_done} bytes")
+        self.bytes_done = bytes_done
+
+
+def archive_format(path: str) -> Optional[str]:
+    """Archive format implied by a file name, or None"""
+    name = path.lower()
+    for suffix, fmt in ARCHIVE_FORMATS.items():
+        if name.endswith(suffix):
+            return fmt
+    return None
+
+
+def _deflate_block(block: bytes, previous: bytes, level: int, final: bool) -> bytes:
+    """Raw deflate one block so that the outputs of consecutive blocks concatenate"""
+    if previous:
+        compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS,
+                                      zlib.DEF_MEM_LEVEL, zlib.Z_DEFAULT_STRATEGY, previous)
+    else:
+        compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+    # A sync flush ends on a byte boundary without marking the last block
+    return compressor.compress(block) + compressor.flush(zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH)
+
+
+class ParallelGzipWriter:
+    """
+    Write-only file object producing a standard gzip stream whose blocks are
+    deflated in parallel, the way pigz does. zlib releases the GIL, so the
+    blocks compress on all cores. At most max_pending blocks are held in
+    memory; the CRC is computed in order on the writing thread.
+    """
+
+    def __init__(self, fileobj, executor: ThreadPoolExecutor, level: int = DEFAULT_LEVEL,
+                 block_size: int = GZIP_BLOCK_SIZE, max_pending: int = 16):
+        self.fileobj = fileobj
+        self.executor = executor
+        self.level = level
+        self.block_size = block_size
+        self.max_pending = max_pending
+        self._buffer = bytearray()
+        self._previous = b""
+        self._pending = deque()
+        self._crc = 0
+        self._size = 0
+        self.closed = False
+        # Magic, deflate, no flags, mtime, no extra flags, unknown OS
+        fileobj.write(b"\x1f\x8b\x08\x00" + struct.pack("<I", int(time.time())) + b"\x00\xff")
+
+    def write(self, data) -> int:
+        self._buffer += data
+        while len(self._buffer) >= self.block_size:
+            block = bytes(self._buffer[:self.block_size])
+            del self._buffer[:self.block_size]
+            self._submit(block, final=False)
+        return len(data)
+
+    def _submit(self, block: bytes, final: bool) -> None:
+        self._pending.append(self.executor.submit(
+            _deflate_block, block, self._previous, self.level, final))
+        self._previous = block[-GZIP_WINDOW:]
+        self._crc = zlib.crc32(block, self._crc)
+        self._size += len(block)
+        while len(self._pending) > self.max_pending:
+            self.fileobj.write(self._pending.popleft().result())
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        self.closed = True
+        self._submit(bytes(self._buffer), final=True)
+        self._buffer = bytearray()
+        while self._pending:
+            self.fileobj.write(self._pending.popleft().result())
+        self.fileobj.write(struct.pack("<II", self._crc, self._size & 0xFFFFFFFF))
+
+    def abort(self) -> None:
+        self.closed = True
+        for future in self._pending:
+            future.cancel()
+
+
+def _deflate_file(path: str, level: int) -> Tuple[bytes, int, int]:
+    """Whole file as one raw deflate stream, with its CRC-32 and size"""
+    with open(path, "rb") as f:
+        data = f.read()
+    return _deflate_block(data, b"", level, final=True), zlib.crc32(data), len(data)
+
+
+class _DeflatedZipMember:
+    """
+    Adds a member whose data is deflated elsewhere to a ZipFile writing to
+    a seekable file, the way ZipFile.open(..., "w") does: local header
+    first, then the data, then the header rewritten with CRC and sizes.
+    """
+
+    def __init__(self, zf: zipfile.ZipFile, info: zipfile.ZipInfo, zip64: bool):
+        self.zf = zf
+        self.info = info
+        self.zip64 = zip64
+        info.compress_type = zipfile.ZIP_DEFLATED
+        info.compress_size = info.CRC = info.file_size = 0
+        info.flag_bits = 0
+        info.header_offset = zf.fp.tell()
+        zf.fp.write(info.FileHeader(zip64))
+
+    def write(self, data: bytes) -> None:
+        self.zf.fp.write(data)
+        self.info.compress_size += len(data)
+
+    def close(self, crc: int, size: int) -> None:
+        self.info.CRC = crc
+        self.info.file_size = size
+        fp = self.zf.fp
+        self.zf.start_dir = fp.tell()
+        fp.seek(self.info.header_offset)
+        fp.write(self.info.FileHeader(self.zip64))
+        fp.seek(self.zf.start_dir)
+        self.zf.filelist.append(self.info)
+        self.zf.NameToInfo[self.info.filename] = self.info
+
+
+class _ProgressReader:
+    """File wrapper counting bytes read and checking for cancellation between reads"""
+
+    def __init__(self, fileobj, on_read: Callable[[int], None]):
+        self.fileobj = fileobj
+        self.on_read = on_read
+
+    def read(self, size: int = -1) -> bytes:
+        data = self.fileobj.read(size)
+        self.on_read(len(data))
+        return data
+
+
+class Archiver:
+    """
+    Creates and extracts zip, tar and tar.gz archives as streams: members
+    are copied in chunks, never read whole into memory. tar.gz output is
+    compressed in parallel blocks. zip members up to block_size are each
+    deflated whole on a worker, several at a time, and larger ones in
+    parallel blocks like tar.gz; either way they are written in order.
+    Trees are walked
+    with FileWalker, so default excludes (.git, node_modules, ...) and
+    extra exclude patterns prune whole subtrees.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, level: int = DEFAULT_LEVEL,
+                 block_size: int = GZIP_BLOCK_SIZE):
+        self.max_workers = max_workers or min(32, os.cpu_count() or 1)
+        self.level = level
+        self.block_size = block_size
+
+    def compress(self, sources: Union[str, Iterable[str]], destination: str,
+                 fmt: Optional[str] = None, exclude: Optional[List[str]] = None,
+                 use_default_excludes: bool = True,
+                 progress_callback: Optional[Callable[[dict], None]] = None,
+                 cancel_event: Optional[threading.Event] = None) -> dict:
+        """
+        Archive files and directories into destination. Each source is stored
+        under its own name, like "zip -r". progress_callback receives
+        {"completed", "total", "files", "files_total", "bytes_per_second"}
+        with sizes in uncompressed bytes. Raises ArchiveCancelled if
+        cancel_event is set; the partial archive is removed.
+        """
+        start = time.perf_counter()
+        fmt = fmt or archive_format(destination)
+        if fmt not in ARCHIVE_FORMATS.values():
+            raise ValueError(f"Unsupported archive format: {fmt or destination}")
+        sources = [sources] if isinstance(sources, str) else list(sources)
+        destination = os.path.abspath(destination)
+        part = destination + PART_SUFFIX
+        walker = FileWalker(ignore_patterns=exclude, use_default_excludes=use_default_excludes,
+                            use_gitignore=False)
+        members = self._collect(sources, walker, {destination, part})
+        total = sum(size for _, _, size, _ in members)
+        files_total = sum(not is_dir for _, _, _, is_dir in members)
+        state = {"completed": 0, "files": 0}
+
+        def on_read(count: int) -> None:
+            if cancel_event is not None and cancel_event.is_set():
+                raise ArchiveCancelled(state["completed"])
+            state["completed"] += count
+
+        def report() -> None:
+            if progress_callback:
+                elapsed = time.perf_counter() - start
+                progress_callback({
+                    "completed": state["completed"], "total": total,
+                    "files": state["files"], "files_total": files_total,
+                    "bytes_per_second": int(state["completed"] / elapsed) if elapsed else 0,
+                })
+
+        os.makedirs(os.path.dirname(destination), exist_ok=True)
+        try:
+            with open(part, "wb") as out:
+                if fmt == "zip":
+                    self._write_zip(out, members, on_read, state, report)
+                else:
+                    self._write_tar(out, members, fmt, on_read, state, report)
+                bytes_out = out.tell()
+            os.replace(part, destination)
+        except BaseException:
+            try:
+                os.remove(part)
+            except OSError:
+                pass
+            raise
+
+        elapsed = time.perf_counter() - start
+        return {
+            "archive": destination,
+            "format": fmt,
+            "files": state["files"],
+            "directories": len(members) - files_total,
+            "bytes_in": state["completed"],
+            "bytes_out": bytes_out,
+            "elapsed_ms": elapsed * 1000,
+            "bytes_per_second": int(state["completed"] / elapsed) if elapsed else 0,
+        }
+
+    @staticmethod
+    def _collect(sources: List[str], walker: FileWalker,
+                 skip: set) -> List[Tuple[str, str, int, bool]]:
+        """(path, arcname, size, is_dir) for everything to archive, parents first"""
+        members = []
+        for source in sources:
+            source = os.path.abspath(source)
+            base = os.path.dirname(source.rstrip(os.sep)) or source
+            if os.path.isdir(source):
+                members.append((source, os.path.relpath(source, base), 0, True))
+                for entry in walker.walk(source, include_dirs=True):
+                    if entry.path in skip:
+                        continue  # The archive being written
+                    try:
+                        is_dir = entry.is_dir(follow_symlinks=False)
+                        size = 0 if is_dir else entry.stat().st_size
+                    except OSError:
+                        continue
+                    members.append((entry.path, os.path.relpath(entry.path, base), size, is_dir))
+            elif os.path.exists(source):
+                members.append((source, os.path.basename(source), os.path.getsize(source), False))
+            else:
+                raise FileNotFoundError(f"Source not found: {source}")
+        # The walker yields a directory after its files; archives read better parents first
+        members.sort(key=lambda member: member[1].split(os.sep))
+        return members
+
+    def _write_tar(self, out, members, fmt: str, on_read, state: dict, report) -> None:
+        executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="archive")
+        stream = out
+        if fmt == "tar.gz":
+            stream = ParallelGzipWriter(out, executor, self.level, self.block_size,
+                                        max_pending=self.max_workers * 2)
+        try:
+            with tarfile.open(fileobj=stream, mode="w|", format=tarfile.PAX_FORMAT) as tar:
+                for path, arcname, _, is_dir in members:
+                    try:
+                        info = tar.gettarinfo(path, arcname)
+                    except OSError:
+                        continue  # Removed since the walk
+                    if info.isreg():
+                        try:
+                            f = open(path, "rb")
+                        except OSError:
+                            continue
+                        with f:
+                            tar.addfile(info, _ProgressReader(f, on_read))
+                        state["files"] += 1
+                        report()
+                    else:
+                        tar.addfile(info)
+            if stream is not out:
+                stream.close()
+        except BaseException:
+            if stream is not out:
+                stream.abort()
+            raise
+        finally:
+            executor.shutdown(wait=True)
+
+    def _write_zip(self, out, members, on_read, state: dict, report) -> None:
+        executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="archive")
+        pending = deque()  # (info, future deflating a small file, or None for a directory)
+
+        def write_pending(limit: int) -> None:
+            while len(pending) > limit:
+                info, future = pending.popleft()
+                if future is None:
+                    zf.writestr(info, b"")
+                    continue
+                try:
+                    data, crc, size = future.result()
+                except OSError:
+                    continue  # Removed or unreadable since the walk
+                on_read(size)
+                member = _DeflatedZipMember(zf, info, zip64=size > ZIP64_THRESHOLD)
+                member.write(data)
+                member.close(crc, size)
+                state["files"] += 1
+                report()
+
+        try:
+            with zipfile.ZipFile(out, "w", compression=zipfile.ZIP_DEFLATED,
+                                 compresslevel=self.level) as zf:
+                for path, arcname, size, is_dir in members:
+                    try:
+                        info = zipfile.ZipInfo.from_file(path, arcname)
+                    except OSError:
+                        continue
+                    if is_dir:
+                        pending.append((info, None))
+                    elif size <= self.block_size:
+                        pending.append((info, executor.submit(_deflate_file, path, self.level)))
+                        write_pending(self.max_workers * 2)
+                    else:
+                        write_pending(0)
+                        try:
+                            src = open(path, "rb")
+                        except OSError:
+                            continue
+                        with src:
+                            self._write_zip_blocks(zf, info, src, size, executor, on_read)
+                        state["files"] += 1
+                        report()
+                write_pending(0)
+        finally:
+            for _, future in pending:
+                if future is not None:
+                    future.cancel()
+            executor.shutdown(wait=True)
+
+    def _write_zip_blocks(self, zf: zipfile.ZipFile, info: zipfile.ZipInfo, src, size: int,
+                          executor: ThreadPoolExecutor, on_read) -> None:
+        """Deflate one large member in parallel blocks that concatenate, as for tar.gz"""
+        member = _DeflatedZipMember(zf, info, zip64=size > ZIP64_THRESHOLD)
+        blocks = deque()
+        previous = b""
+        crc = total = 0
+        while True:
+            block = src.read(self.block_size)
+            on_read(len(block))
+            blocks.append(executor.submit(_deflate_block, block, previous, self.level,
+                                          not block))
+            if not block:
+                break
+            previous = block[-GZIP_WINDOW:]
+            crc = zlib.crc32(block, crc)
+            total += len(block)
+            while len(blocks) > self.max_workers * 2:
+                member.write(blocks.popleft().result())
+        while blocks:
+            member.write(blocks.popleft().result())
+        member.close(crc, total)
+
+    def extract(self, archive: str, destination: str,
+                progress_callback: Optional[Callable[[dict], None]] = None,
+                cancel_event: Optional[threading.Event] = None) -> dict:
+        """
+        Extract archive into destination, member by member. Members that
+        would land outside destination (absolute paths, "..", unsafe links)
+        are skipped. progress_callback receives {"completed", "total",
+        "files", "bytes_per_second"}; for tar archives these count
+        compressed bytes read so the stream is only read once.
+        """
+        start = time.perf_counter()
+        os.makedirs(destination, exist_ok=True)
+        destination = os.path.realpath(destination)
+        if zipfile.is_zipfile(archive):
+            fmt, state = "zip", self._extract_zip(archive, destination, cancel_event,
+                                                  progress_callback, start)
+        else:
+            fmt, state = "tar", self._extract_tar(archive, destination, cancel_event,
+                                                  progress_callback, start)
+        elapsed = time.perf_counter() - start
+        return {
+            "archive": os.path.abspath(archive),
+            "destination": destination,
+            "format": fmt,
+            "files": state["files"],
+            "bytes_out": state["bytes_out"],
+            "skipped": state["skipped"],
+            "elapsed_ms": elapsed * 1000,
+            "bytes_per_second": int(state["bytes_out"] / elapsed) if elapsed else 0,
+        }
+
+    @staticmethod
+    def _progress(callback, completed: int, total: int, files: int, start: float) -> None:
+        if callback:
+            elapsed = time.perf_counter() - start
+            callback({"completed": completed, "total": total, "files": files,
+                      "bytes_per_second": int(completed / elapsed) if elapsed else 0})
+
+    def _extract_zip(self, archive, destination, cancel_event, progress_callback, start) -> dict:
+        state = {"files": 0, "bytes_out": 0, "skipped": []}
+        with zipfile.ZipFile(archive) as zf:
+            infos = zf.infolist()
+            total = sum(info.file_size for info in infos)
+            for info in infos:
+                if cancel_event is not None and cancel_event.is_set():
+                    raise ArchiveCancelled(state["bytes_out"])
+                target = os.path.realpath(os.path.join(destination, info.filename))
+                if os.path.commonpath([target, destination]) != destination:
+                    state["skipped"].append(info.filename)
+                    continue
+                zf.extract(info, destination)  # zipfile also strips ".." and drive letters
+                if not info.is_dir():
+                    state["files"] += 1
+                    state["bytes_out"] += info.file_size
+                    self._progress(progress_callback, state["bytes_out"], total,
+                                   state["files"], start)
+        return state
+
+    def _extract_tar(self, archive, destination, cancel_event, progress_callback, start) -> dict:
+        state = {"files": 0, "bytes_out": 0, "skipped": []}
+        total = os.path.getsize(archive)
+        with open(archive, "rb") as raw, tarfile.open(fileobj=raw, mode="r|*") as tar:
+            for member in tar:
+                if cancel_event is not None and cancel_event.is_set():
+                    raise ArchiveCancelled(state["bytes_out"])
+                if not self._tar_member_safe(member, destination):
+                    state["skipped"].append(member.name)
+                    continue
+                try:
+                    if hasattr(tarfile, "data_filter"):
+                        tar.extract(member, destination, filter="data")
+                    else:
+                        tar.extract(member, destination)
+                except tarfile.TarError:
+                    state["skipped"].append(member.name)
+                    continue
+                if member.isreg():
+                    state["files"] += 1
+                    state["bytes_out"] += member.size
+                    self._progress(progress_callback, raw.tell(), total, state["files"], start)
+        return state
+
+    @staticmethod
+    def _tar_member_safe(member: tarfile.TarInfo, destination: str) -> bool:
+        """Member stays inside destination; the data filter checks this too where available"""
+        if member.isdev():
+            return False
+        target = os.path.realpath(os.path.join(destination, member.name))
+        if os.path.commonpath([target, destination]) != destination:
+            return False
+        if member.issym() or member.islnk():
+            base = os.path.dirname(target) if member.issym() else destination
+            link = os.path.realpath(os.path.join(base, member.linkname))
+            return os.path.commonpath([link, destination]) == destination
+        return True
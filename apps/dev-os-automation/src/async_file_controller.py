@@ -0,0 +1,142 @@
+"""
+Async File Controller - Event-loop friendly wrapper around FileController
+Requirements 1.1-1.5: File system operations without blocking the server
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import AsyncIterator, Callable, Iterator, List, Optional, Tuple, Union
+from src.file_controller import FileController
+from src.models import ActionResult
+
+SEARCH_BATCH_SIZE = 64  # Items pulled per executor hop when streaming results
+SEARCH_BATCH_SECONDS = 0.05
+
+
+class AsyncFileController:
+    """
+    Async variant of FileController. Every call runs on a dedicated, bounded
+    thread pool so slow disks never stall the event loop; at most
+    max_pending calls are queued or running, further callers wait their turn.
+    """
+
+    def __init__(self, controller: Optional[FileController] = None,
+                 max_workers: int = 8, max_pending: int = 64):
+        self.controller = controller or FileController()
+        self.max_workers = max_workers
+        self.max_pending = max(max_pending, max_workers)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="file-io")
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    async def _run(self, func: Callable, *args, **kwargs):
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_pending)
+        async with self._semaphore:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, partial(func, *args, **kwargs))
+
+    async def open_file(self, file_path: str) -> ActionResult:
+        return await self._run(self.controller.open_file, file_path)
+
+    async def create_file(self, file_path: str, content: str = "") -> ActionResult:
+        return await self._run(self.controller.create_file, file_path, content)
+
+    async def create_directory(self, dir_path: str) -> ActionResult:
+        return await self._run(self.controller.create_directory, dir_path)
+
+    async def copy_file(self, source: str, destination: str, **kwargs) -> ActionResult:
+        return await self._run(self.controller.copy_file, source, destination, **kwargs)
+
+    async def move_file(self, source: str, destination: str) -> ActionResult:
+        return await self._run(self.controller.move_file, source, destination)
+
+    async def delete_file(self, file_path: str) -> ActionResult:
+        return await self._run(self.controller.delete_file, file_path)
+
+    async def batch_operations(self, operations: List[dict], **kwargs) -> ActionResult:
+        return await self._run(self.controller.batch_operations, operations, **kwargs)
+
+    async def search_files(self, directory: Union[str, List[str]],
+                           pattern: Union[str, List[str]] = "*",
+                           search_type: str = "name", **kwargs) -> ActionResult:
+        return await self._run(self.controller.search_files, directory, pattern,
+                               search_type, **kwargs)
+
+    async def compress(self, sources: Union[str, List[str]], destination: str,
+                       **kwargs) -> ActionResult:
+        return await self._run(self.controller.compress, sources, destination, **kwargs)
+
+    async def extract(self, archive: str, destination: str, **kwargs) -> ActionResult:
+        return await self._run(self.controller.extract, archive, destination, **kwargs)
+
+    async def find_duplicates(self, roots: Union[str, List[str]], min_size: int = 1,
+                              respect_ignore: bool = False) -> ActionResult:
+        return await self._run(self.controller.find_duplicates, roots, min_size, respect_ignore)
+
+    async def disk_usage(self, directory: str, top_n: int = 20, full: bool = False) -> ActionResult:
+        return await self._run(self.controller.disk_usage, directory, top_n, full)
+
+    async def list_directory(self, directory: str) -> ActionResult:
+        return await self._run(self.controller.list_directory, directory)
+
+    async def watch_directory(self, directory: str) -> ActionResult:
+        return await self._run(self.controller.watch_directory, directory)
+
+    async def index_directory(self, directory: str) -> ActionResult:
+        return await self._run(self.controller.index_directory, directory)
+
+    async def iter_search(self, directory: Union[str, List[str]],
+                          pattern: Union[str, List[str]] = "*", search_type: str = "name",
+                          offset: int = 0, regex: bool = False) -> AsyncIterator[dict]:
+        """Async version of FileController.iter_search; closing it closes the walk"""
+        results = self.controller.iter_search(directory, pattern, search_type, offset, regex)
+        async for item in self._iterate(results):
+            yield item
+
+    async def iter_disk_usage(self, directory: str, top_n: int = 20,
+                              full: bool = False) -> AsyncIterator[dict]:
+        """Async version of FileController.iter_disk_usage"""
+        async for item in self._iterate(self.controller.iter_disk_usage(directory, top_n, full)):
+            yield item
+
+    async def _iterate(self, results: Iterator[dict]) -> AsyncIterator[dict]:
+        """
+        Drive a blocking generator from the pool in small batches, handing
+        back early when items are sparse so the first ones are not held up.
+        Cancelling sets stopped, which ends a batch still running in a worker
+        at its next item; the generator is then closed from the pool.
+        """
+        stopped = threading.Event()
+
+        def next_batch() -> Tuple[List[dict], bool]:
+            batch = []
+            deadline = time.monotonic() + SEARCH_BATCH_SECONDS
+            for item in results:
+                if stopped.is_set():
+                    break
+                batch.append(item)
+                if len(batch) >= SEARCH_BATCH_SIZE or time.monotonic() > deadline:
+                    return batch, False
+            else:
+                return batch, True
+            results.close()
+            return batch, True
+
+        try:
+            done = False
+            while not done and not stopped.is_set():
+                batch, done = await self._run(next_batch)
+                for item in batch:
+                    yield item
+        finally:
+            stopped.set()
+            try:
+                await self._run(results.close)
+            except ValueError:
+                pass  # Still in next_batch; it closes the generator once it sees stopped
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait)
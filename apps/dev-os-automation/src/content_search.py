@@ -0,0 +1,293 @@
+"""
+Content Search - Parallel literal and regex search over file contents
+Requirement 1.5: Return matching files based on content
+"""
+
+import codecs
+import mmap
+import os
+import re
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+try:
+    from re import _parser as sre_parse  # Python 3.11+
+except ImportError:
+    import sre_parse
+
+try:
+    import ahocorasick  # Optional: pyahocorasick, faster prefilter for many patterns
+except ImportError:
+    ahocorasick = None
+
+DEFAULT_MAX_FILE_SIZE = 50 * 1024 * 1024  # 50 MB
+DEFAULT_BLOCK_SIZE = 64 * 1024  # 64 KB
+DEFAULT_MAX_MATCHES = 20  # Matches reported per file
+SNIPPET_CHARS = 200
+MAX_REQUIRED_LITERALS = 3  # Literal sets checked per regex before decoding a file
+AHOCORASICK_MIN_NEEDLES = 12  # Below this, one find() per literal is faster
+
+_BOMS = (  # UTF-32 LE first: its BOM starts with the UTF-16 LE one
+    (codecs.BOM_UTF32_LE, "utf-32-le"),
+    (codecs.BOM_UTF32_BE, "utf-32-be"),
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16-le"),
+    (codecs.BOM_UTF16_BE, "utf-16-be"),
+)
+
+
+def detect_encoding(head: bytes) -> Optional[str]:
+    """
+    Encoding of a file judged from its first block, or None for binary files.
+    A BOM wins; otherwise text is UTF-8 if the block decodes as such and latin-1 if not.
+    """
+    for bom, encoding in _BOMS:
+        if head.startswith(bom):
+            return encoding
+    if b"\0" in head:
+        return None
+    try:
+        codecs.getincrementaldecoder("utf-8")().decode(head)  # Tolerates a split final character
+        return "utf-8"
+    except UnicodeDecodeError:
+        return "latin-1"
+
+
+def _required_literals(pattern: str) -> Optional[List[List[str]]]:
+    """
+    Literal sets every match of a regex satisfies: each set has a member
+    occurring in the match. None when nothing can be derived (the pattern is
+    case-insensitive, or only classes and wildcards). Used to rule out files
+    without running the regex.
+    """
+    try:
+        parsed = sre_parse.parse(pattern)
+    except re.error:
+        return None
+    if parsed.state.flags & re.IGNORECASE:
+        return None
+    required = []
+    for alternatives in _sequence_literals(list(parsed)):
+        if alternatives not in required:
+            required.append(alternatives)
+    required.sort(key=_shortest, reverse=True)
+    return required[:MAX_REQUIRED_LITERALS] or None
+
+
+def _shortest(alternatives: List[str]) -> int:
+    return min(map(len, alternatives))
+
+
+def _sequence_literals(items: list) -> List[List[str]]:
+    """Literal sets required by a concatenation: its literal runs and those of required groups"""
+    required: List[List[str]] = []
+    run: List[str] = []
+    for op, av in items:
+        if op is sre_parse.LITERAL:
+            run.append(chr(av))
+            continue
+        if run:
+            required.append(["".join(run)])
+            run = []
+        if op is sre_parse.SUBPATTERN:
+            add_flags, body = av[1], av[3]
+            if not add_flags & re.IGNORECASE:
+                required.extend(_sequence_literals(list(body)))
+        elif op is sre_parse.BRANCH:
+            # Any one branch may match, so only the union of their literals is required
+            branches = [_sequence_literals(list(branch)) for branch in av[1]]
+            if all(branches):
+                required.append(sorted({literal for branch in branches
+                                        for literal in max(branch, key=_shortest)}))
+        elif op in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT) and av[0] >= 1:
+            required.extend(_sequence_literals(list(av[2])))
+    if run:
+        required.append(["".join(run)])
+    return required
+
+
+class ContentQuery:
+    """
+    One or more patterns compiled for content search. A file is a hit if
+    any pattern matches. Literal fragments every match must contain are
+    searched for in the raw bytes first, so most files are ruled out
+    without being decoded or touched by the regex engine.
+    """
+
+    def __init__(self, patterns: Union[str, Sequence[str]], regex: bool = False,
+                 max_matches: int = DEFAULT_MAX_MATCHES):
+        self.patterns = [patterns] if isinstance(patterns, str) else list(patterns)
+        if not self.patterns:
+            raise ValueError("At least one pattern is required")
+        self.regex = regex
+        self.max_matches = max_matches
+        self.compiled = [re.compile(p if regex else re.escape(p)) for p in self.patterns]
+
+        # Per pattern, literal sets that must all be present (any member of each)
+        self.requirements: Optional[List[List[List[str]]]] = []
+        for pattern in self.patterns:
+            required = _required_literals(pattern) if regex else [[pattern]]
+            if not required:
+                self.requirements = None  # Some pattern can match anything: no prefilter
+                break
+            self.requirements.append(required)
+        self._needles = {}
+        self._automata = {}
+
+    def _needles_for(self, encoding: str) -> List[List[List[bytes]]]:
+        """Requirements with literals as they appear on disk in encoding"""
+        needles = self._needles.get(encoding)
+        if needles is None:
+            codec = "utf-8" if encoding == "utf-8-sig" else encoding
+            needles = []
+            for required in self.requirements:
+                encoded = []
+                for alternatives in required:
+                    members = []
+                    for literal in alternatives:
+                        try:
+                            members.append(literal.encode(codec))
+                        except UnicodeEncodeError:
+                            continue  # Cannot occur in a file of this encoding
+                    encoded.append(members)
+                needles.append(encoded)
+            self._needles[encoding] = needles
+        return needles
+
+    def may_match(self, data: Union[bytes, mmap.mmap], encoding: str) -> bool:
+        """Cheap byte-level check; False means no pattern can match"""
+        if self.requirements is None:
+            return True
+        requirements = self._needles_for(encoding)
+        automaton = self._automaton_for(encoding) if ahocorasick is not None else None
+        if automaton is not None:
+            # One pass collects every literal present
+            present = {needle for _, needle in automaton.iter(data[:].decode("latin-1"))}
+            has = lambda needle: needle in present
+        else:
+            found = {}
+
+            def has(needle: bytes) -> bool:
+                if needle not in found:
+                    found[needle] = data.find(needle) != -1
+                return found[needle]
+
+        return any(all(any(has(needle) for needle in alternatives) for alternatives in required)
+                   for required in requirements)
+
+    def _automaton_for(self, encoding: str):
+        """Aho-Corasick automaton over all literals, or None when plain finds are faster"""
+        if encoding not in self._automata:
+            needles = {needle for required in self._needles_for(encoding)
+                       for alternatives in required for needle in alternatives}
+            automaton = None
+            if len(needles) >= AHOCORASICK_MIN_NEEDLES:
+                # latin-1 maps bytes 1:1 to code points, so the automaton scans raw bytes
+                automaton = ahocorasick.Automaton()
+                for needle in needles:
+                    automaton.add_word(needle.decode("latin-1"), needle)
+                automaton.make_automaton()
+            self._automata[encoding] = automaton
+        return self._automata[encoding]
+
+    def find(self, text: str) -> List[dict]:
+        """Matches in decoded text as {"line", "column", "text", "pattern"}, in file order"""
+        found: List[Tuple[int, int, str]] = []
+        for pattern, compiled in zip(self.patterns, self.compiled):
+            for count, match in enumerate(compiled.finditer(text)):
+                if count >= self.max_matches:
+                    break
+                found.append((match.start(), match.end(), pattern))
+        found.sort()
+
+        matches = []
+        line, counted_to = 1, 0
+        for start, end, pattern in found[:self.max_matches]:
+            line += text.count("\n", counted_to, start)
+            counted_to = start
+            line_start = text.rfind("\n", 0, start) + 1
+            line_end = text.find("\n", start)
+            if line_end == -1:
+                line_end = len(text)
+            snippet_start = max(line_start, min(start - SNIPPET_CHARS // 4, line_end - SNIPPET_CHARS))
+            matches.append({
+                "line": line,
+                "column": start - line_start + 1,
+                "text": text[snippet_start:min(line_end, snippet_start + SNIPPET_CHARS)].rstrip("\r"),
+                "pattern": pattern,
+            })
+        return matches
+
+
+class ContentSearcher:
+    """
+    Scans files for literal byte patterns or regexes on a thread pool.
+    Files are read as bytes: the first block doubles as the binary check
+    and encoding detection, and larger files are searched through mmap.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None,
+                 max_file_size: int = DEFAULT_MAX_FILE_SIZE,
+                 block_size: int = DEFAULT_BLOCK_SIZE):
+        self.max_workers = max_workers or min(32, (os.cpu_count() or 1) * 4)
+        self.max_file_size = max_file_size
+        self.block_size = block_size
+
+    def search_file(self, path: Path, query: ContentQuery) -> List[dict]:
+        """Matches of query in one file; binary, oversized and unreadable files have none"""
+        try:
+            with open(path, "rb") as f:
+                if os.fstat(f.fileno()).st_size > self.max_file_size:
+                    return []
+                head = f.read(self.block_size)
+                encoding = detect_encoding(head)
+                if encoding is None:
+                    return []  # Binary file
+                if len(head) < self.block_size:
+                    return self._search_bytes(head, encoding, query)
+                try:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        return self._search_bytes(mm, encoding, query)
+                except (OSError, ValueError):
+                    f.seek(0)
+                    return self._search_bytes(f.read(), encoding, query)
+        except OSError:
+            return []
+
+    @staticmethod
+    def _search_bytes(data: Union[bytes, mmap.mmap], encoding: str,
+                      query: ContentQuery) -> List[dict]:
+        if not query.may_match(data, encoding):
+            return []  # Ruled out without decoding
+        return query.find(data[:].decode(encoding, errors="replace").lstrip("\ufeff"))
+
+    def iter_matches(self, paths: Iterable[Path], pattern: Union[str, Sequence[str]],
+                     regex: bool = False) -> Iterator[Tuple[Path, List[dict]]]:
+        """
+        Yield (path, matches) for files where any pattern matches, in input order.
+        At most a few files per worker are in flight, so results start
+        arriving immediately and the caller may stop early.
+        """
+        query = pattern if isinstance(pattern, ContentQuery) else ContentQuery(pattern, regex)
+        window = self.max_workers * 4
+        with ThreadPoolExecutor(max_workers=self.max_workers,
+                                thread_name_prefix="content-search") as executor:
+            pending = deque()
+            try:
+                for path in paths:
+                    pending.append((path, executor.submit(self.search_file, path, query)))
+                    if len(pending) >= window:
+                        path, future = pending.popleft()
+                        matches = future.result()
+                        if matches:
+                            yield path, matches
+                while pending:
+                    path, future = pending.popleft()
+                    matches = future.result()
+                    if matches:
+                        yield path, matches
+            finally:
+                for _, future in pending:
+                    future.cancel()
@@ -0,0 +1,169 @@
+"""
+Disk Usage - du-style analyzer with cached subtree sizes
+Requirement 1.5: Report what is using disk space
+"""
+
+import heapq
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+CACHED_TOP_FILES = 100  # Largest files remembered per directory, caps top_n
+
+
+class DirRecord(NamedTuple):
+    """Direct contents of one directory as of mtime_ns"""
+    mtime_ns: int
+    own_bytes: int  # Files directly inside, not subdirectories
+    own_files: int
+    subdirs: Tuple[str, ...]
+    top_files: Tuple[Tuple[int, str], ...]  # (bytes, path), largest first
+    linked: Tuple[Tuple[int, int, int], ...]  # (dev, inode, bytes) of hard-linked files
+
+
+def _allocated(stat: os.stat_result) -> int:
+    """Bytes actually used on disk (sparse files count what is allocated)"""
+    blocks = getattr(stat, "st_blocks", None)
+    return blocks * 512 if blocks is not None else stat.st_size
+
+
+class DiskUsageAnalyzer:
+    """
+    Computes per-directory aggregate sizes with a breadth-first walk whose
+    levels are listed in parallel. Each directory's direct contents are
+    cached keyed by its mtime, so a re-scan costs one stat per unchanged
+    directory and only re-lists directories whose entries changed. Files
+    rewritten in place do not touch the directory mtime; pass full=True
+    to re-stat everything. Hard-linked files are counted once, like du.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self.max_workers = max_workers or min(32, (os.cpu_count() or 1) * 4)
+        self._records: Dict[str, DirRecord] = {}
+        self._lock = threading.Lock()
+
+    def _scan_dir(self, path: str, full: bool) -> Tuple[Optional[DirRecord], bool]:
+        """Record for one directory and whether it came from the cache"""
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            return None, False
+        with self._lock:
+            cached = self._records.get(path)
+        if cached is not None and cached.mtime_ns == mtime_ns and not full:
+            return cached, True
+
+        own_bytes = own_files = 0
+        subdirs = []
+        files = []
+        linked = []
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.name)
+                        elif entry.is_file(follow_symlinks=False):
+                            stat = entry.stat(follow_symlinks=False)
+                            size = _allocated(stat)
+                            own_files += 1
+                            files.append((size, entry.path))
+                            if stat.st_nlink > 1:
+                                # Counted once per scan, wherever the walk meets it first
+                                linked.append((stat.st_dev, stat.st_ino, size))
+                            else:
+                                own_bytes += size
+                    except OSError:
+                        continue
+        except OSError:
+            return None, False
+        record = DirRecord(mtime_ns, own_bytes, own_files, tuple(subdirs),
+                           tuple(heapq.nlargest(CACHED_TOP_FILES, files)), tuple(linked))
+        with self._lock:
+            self._records[path] = record
+        return record, False
+
+    def scan(self, root: str, top_n: int = 20, full: bool = False) -> Iterator[dict]:
+        """
+        Yield {"type": "progress", ...} after each directory level, then one
+        {"type": "result", ...} with totals and the top_n largest directories and files.
+        """
+        start = time.perf_counter()
+        root = os.path.abspath(root)
+        top_n = min(top_n, CACHED_TOP_FILES)
+        order: List[str] = []
+        records: Dict[str, DirRecord] = {}
+        reused = 0
+        scanned_bytes = 0
+        own_bytes: Dict[str, int] = {}
+        seen_links = set()
+        largest_files: List[Tuple[int, str]] = []
+
+        with ThreadPoolExecutor(max_workers=self.max_workers,
+                                thread_name_prefix="disk-usage") as executor:
+            frontier = [root]
+            while frontier:
+                next_frontier = []
+                results = executor.map(lambda p: self._scan_dir(p, full), frontier)
+                for path, (record, from_cache) in zip(frontier, results):
+                    if record is None:
+                        continue  # Unreadable or removed
+                    reused += from_cache
+                    records[path] = record
+                    order.append(path)
+                    size = record.own_bytes
+                    for dev, ino, link_bytes in record.linked:
+                        if (dev, ino) not in seen_links:
+                            seen_links.add((dev, ino))
+                            size += link_bytes
+                    own_bytes[path] = size
+                    scanned_bytes += size
+                    largest_files = heapq.nlargest(
+                        top_n, largest_files + list(record.top_files[:top_n]))
+                    next_frontier.extend(os.path.join(path, name) for name in record.subdirs)
+                frontier = next_frontier
+                yield {
+                    "type": "progress",
+                    "directories": len(order),
+                    "bytes": scanned_bytes,
+                    "largest_files": [{"path": p, "bytes": b} for b, p in largest_files],
+                }
+
+        # Children always come after their parent in BFS order, so sum bottom-up
+        totals: Dict[str, Tuple[int, int]] = {}
+        for path in reversed(order):
+            record = records[path]
+            total_bytes, total_files = own_bytes[path], record.own_files
+            for name in record.subdirs:
+                child = totals.get(os.path.join(path, name))
+                if child:
+                    total_bytes += child[0]
+                    total_files += child[1]
+            totals[path] = (total_bytes, total_files)
+
+        self._forget_missing(root, records)
+        largest_dirs = heapq.nlargest(
+            top_n, ((size, count, path) for path, (size, count) in totals.items() if path != root))
+        yield {
+            "type": "result",
+            "path": root,
+            "bytes": totals.get(root, (0, 0))[0],
+            "files": totals.get(root, (0, 0))[1],
+            "directories": len(order),
+            "directories_reused": reused,
+            "largest_directories": [
+                {"path": path, "bytes": size, "files": count} for size, count, path in largest_dirs],
+            "largest_files": [{"path": p, "bytes": b} for b, p in largest_files],
+            "elapsed_ms": (time.perf_counter() - start) * 1000,
+        }
+
+    def _forget_missing(self, root: str, seen: Dict[str, DirRecord]) -> None:
+        """Drop cached records below root that this scan no longer reached"""
+        prefix = root.rstrip(os.sep) + os.sep
+        with self._lock:
+            stale = [path for path in self._records
+                     if (path == root or path.startswith(prefix)) and path not in seen]
+            for path in stale:
+                del self._records[path]
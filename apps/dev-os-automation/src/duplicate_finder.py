@@ -0,0 +1,143 @@
+"""
+Duplicate Finder - Locate identical files to reclaim disk space
+Requirement 1.5: Search files by content
+"""
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+from src.file_walker import FileWalker
+
+DEFAULT_BLOCK_SIZE = 64 * 1024  # Bytes hashed from each end in the partial pass
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+class HashCache:
+    """Bounded LRU of file hashes keyed by (path, size, mtime_ns)"""
+
+    def __init__(self, max_entries: int = 200_000):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[tuple, str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple) -> Optional[str]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: tuple, value: str) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class DuplicateFinder:
+    """
+    Finds duplicate files in three passes: group by size, then by a hash of
+    the first and last blocks, then by a full-content hash for whatever still
+    collides. Hashing runs on a thread pool (hashlib releases the GIL) and
+    results are cached, so rescanning an unchanged tree re-reads nothing.
+    """
+
+    def __init__(self, walker: Optional[FileWalker] = None, max_workers: Optional[int] = None,
+                 block_size: int = DEFAULT_BLOCK_SIZE, cache: Optional[HashCache] = None):
+        self.walker = walker or FileWalker()
+        self.max_workers = max_workers or min(32, (os.cpu_count() or 1) * 2)
+        self.block_size = block_size
+        self.cache = cache or HashCache()
+
+    def find(self, roots: Union[str, Iterable[str]], min_size: int = 1,
+             respect_ignore: bool = False) -> List[Tuple[str, List[os.DirEntry]]]:
+        """
+        Groups of identical files as (content hash, entries), largest waste first.
+        Every file below the roots is considered, including node_modules, .git
+        and gitignored trees where duplicates often pile up; respect_ignore=True
+        skips whatever the walker's ignore rules exclude.
+        """
+        by_size: Dict[int, List[os.DirEntry]] = {}
+        seen_inodes = set()
+        for entry in self.walker.walk(roots, prune=respect_ignore):
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            if stat.st_size < min_size:
+                continue
+            # Hard links share storage, so only one link per inode counts
+            inode = (stat.st_dev, stat.st_ino)
+            if stat.st_ino and inode in seen_inodes:
+                continue
+            seen_inodes.add(inode)
+            by_size.setdefault(stat.st_size, []).append(entry)
+
+        candidates = [group for group in by_size.values() if len(group) > 1]
+        with ThreadPoolExecutor(max_workers=self.max_workers,
+                                thread_name_prefix="duplicate-hash") as executor:
+            partial_groups = self._regroup(candidates, executor, full=False)
+            # Small files were hashed whole in the partial pass
+            needs_full = [g for g in partial_groups if g[1][0].stat().st_size > 2 * self.block_size]
+            done = [g for g in partial_groups if g[1][0].stat().st_size <= 2 * self.block_size]
+            done += self._regroup([entries for _, entries in needs_full], executor, full=True)
+
+        done.sort(key=lambda g: g[1][0].stat().st_size * (len(g[1]) - 1), reverse=True)
+        return done
+
+    def _regroup(self, groups: List[List[os.DirEntry]], executor: ThreadPoolExecutor,
+                 full: bool) -> List[Tuple[str, List[os.DirEntry]]]:
+        """Split each group by hash, keeping only sub-groups that still collide"""
+        entries = [entry for group in groups for entry in group]
+        hash_func = self._full_hash if full else self._partial_hash
+        buckets: Dict[Tuple[int, str], List[os.DirEntry]] = {}
+        for entry, digest in zip(entries, executor.map(hash_func, entries)):
+            if digest is not None:
+                buckets.setdefault((entry.stat().st_size, digest), []).append(entry)
+        return [(digest, group) for (_, digest), group in buckets.items() if len(group) > 1]
+
+    def _cached(self, entry: os.DirEntry, kind: str, compute) -> Optional[str]:
+        stat = entry.stat()
+        key = (kind, entry.path, stat.st_size, stat.st_mtime_ns)
+        digest = self.cache.get(key)
+        if digest is None:
+            try:
+                digest = compute(entry.path, stat.st_size)
+            except OSError:
+                return None  # Unreadable or removed mid-scan
+            self.cache.put(key, digest)
+        return digest
+
+    def _partial_hash(self, entry: os.DirEntry) -> Optional[str]:
+        def compute(path: str, size: int) -> str:
+            h = hashlib.blake2b(digest_size=16)
+            with open(path, "rb") as f:
+                if size <= 2 * self.block_size:
+                    h.update(f.read())
+                else:
+                    h.update(f.read(self.block_size))
+                    f.seek(size - self.block_size)
+                    h.update(f.read(self.block_size))
+            return h.hexdigest()
+        return self._cached(entry, "partial", compute)
+
+    def _full_hash(self, entry: os.DirEntry) -> Optional[str]:
+        def compute(path: str, size: int) -> str:
+            h = hashlib.blake2b(digest_size=32)
+            buffer = bytearray(HASH_CHUNK_SIZE)
+            view = memoryview(buffer)
+            with open(path, "rb", buffering=0) as f:
+                while True:
+                    read = f.readinto(buffer)
+                    if not read:
+                        break
+                    h.update(view[:read])
+            return h.hexdigest()
+        return self._cached(entry, "full", compute)
@@ -0,0 +1,154 @@
+"""
+Event Bus - Topic subscriptions for /ws clients
+Requirement 3.3: Push activity to connected clients without blocking on them
+"""
+
+import asyncio
+import math
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from src.ws_fanout import WebSocketFanout, encode
+
+TOPICS = ("activity", "file", "process", "system", "voice")
+DEFAULT_TOPICS = ("activity", "file", "system", "voice")  # "process" needs the process sampler
+MAX_BATCH_WINDOW_MS = 1000
+DEFAULT_MAX_BATCH = 100  # Events per batch frame; a full batch is flushed early
+
+
+class _PendingBatch:
+    """Events held for every connection sharing one batch window"""
+
+    __slots__ = ("events", "timer")
+
+    def __init__(self):
+        self.events: List[Tuple[str, Set[Any]]] = []  # (encoded event, recipients)
+        self.timer: Optional[asyncio.TimerHandle] = None
+
+
+class EventBus:
+    """
+    Routes published events to the connections subscribed to their topic,
+    through the fan-out's per-client queues. Each event is tagged with its
+    topic and encoded once. Connections start subscribed to DEFAULT_TOPICS
+    and change that over /ws. A connection may ask for micro-batching: its
+    events are then held for up to batch_ms and delivered as one "batch"
+    frame, which cuts per-message overhead when events arrive in bursts.
+    Connections with the same window share one pending batch and timer, and
+    each distinct frame is built once per flush from the encoded events.
+    """
+
+    def __init__(self, fanout: WebSocketFanout, max_batch: int = DEFAULT_MAX_BATCH):
+        self.fanout = fanout
+        self.max_batch = max_batch
+        self.subscribers: Dict[str, Set[Any]] = {topic: set() for topic in TOPICS}
+        self.batch_windows: Dict[Any, float] = {}  # websocket -> seconds
+        self._pending: Dict[float, _PendingBatch] = {}  # window -> held events
+        self.published = 0
+        self.batches = 0
+
+    def connect(self, websocket) -> None:
+        for topic in DEFAULT_TOPICS:
+            self.subscribers[topic].add(websocket)
+
+    def disconnect(self, websocket) -> None:
+        for subscribers in self.subscribers.values():
+            subscribers.discard(websocket)
+        self.batch_windows.pop(websocket, None)  # Held events for it are dropped by the fan-out
+
+    def subscribe(self, websocket, topics: Iterable[str], batch_ms: Optional[float] = None) -> List[str]:
+        """
+        Replace websocket's topics; batch_ms > 0 turns on micro-batching, 0 turns it off.
+        Everything is validated first, so a rejected call changes nothing.
+        """
+        topics = _topic_list(topics)
+        if batch_ms is not None and (isinstance(batch_ms, bool) or not isinstance(batch_ms, (int, float))
+                                     or not math.isfinite(batch_ms) or batch_ms < 0):
+            raise ValueError(f"batch_ms must be a number of milliseconds >= 0, got {batch_ms!r}")
+        for topic, subscribers in self.subscribers.items():
+            if topic in topics:
+                subscribers.add(websocket)
+            else:
+                subscribers.discard(websocket)
+        if batch_ms is not None:
+            previous = self.batch_windows.pop(websocket, None)
+            if previous is not None:
+                self._flush(previous)  # Deliver what it holds before the window changes
+            if batch_ms > 0:
+                self.batch_windows[websocket] = min(batch_ms, MAX_BATCH_WINDOW_MS) / 1000
+        return self.topics_for(websocket)
+
+    def unsubscribe(self, websocket, topics: Optional[Iterable[str]] = None) -> List[str]:
+        """Drop the given topics (default: all); returns what is still subscribed"""
+        for topic in (TOPICS if topics is None else _topic_list(topics)):
+            self.subscribers.get(topic, set()).discard(websocket)
+        return self.topics_for(websocket)
+
+    def topics_for(self, websocket) -> List[str]:
+        return [topic for topic in TOPICS if websocket in self.subscribers[topic]]
+
+    def publish(self, topic: str, message: Dict[str, Any], connections: Optional[Iterable[Any]] = None) -> int:
+        """Deliver message to topic's subscribers (optionally only those in connections)"""
+        subscribers = self.subscribers[topic]
+        targets = subscribers if connections is None else [ws for ws in connections if ws in subscribers]
+        if not targets:
+            return 0
+        self.published += 1
+        text = encode({**message, "topic": topic})
+        immediate = []
+        held: Dict[float, Set[Any]] = {}
+        for ws in targets:
+            window = self.batch_windows.get(ws)
+            if window is None:
+                immediate.append(ws)
+            else:
+                held.setdefault(window, set()).add(ws)
+        if immediate:
+            self.fanout.publish_text(text, immediate)
+        for window, recipients in held.items():
+            self._hold(window, text, recipients)
+        return len(targets)
+
+    def _hold(self, window: float, text: str, recipients: Set[Any]) -> None:
+        batch = self._pending.get(window)
+        if batch is None:
+            batch = self._pending[window] = _PendingBatch()
+            batch.timer = asyncio.get_running_loop().call_later(window, self._flush, window)
+        batch.events.append((text, recipients))
+        if len(batch.events) >= self.max_batch:
+            self._flush(window)
+
+    def _flush(self, window: float) -> None:
+        batch = self._pending.pop(window, None)
+        if batch is None:
+            return
+        batch.timer.cancel()
+        # Connections that received the same events get the same frame
+        frames: Dict[Tuple[int, ...], List[Any]] = {}
+        for ws in set().union(*(recipients for _, recipients in batch.events)):
+            held = tuple(i for i, (_, recipients) in enumerate(batch.events) if ws in recipients)
+            frames.setdefault(held, []).append(ws)
+        for held, connections in frames.items():
+            if len(held) == 1:
+                text = batch.events[held[0]][0]
+            else:
+                self.batches += 1
+                text = '{"type":"batch","events":[' + ",".join(batch.events[i][0] for i in held) + "]}"
+            self.fanout.publish_text(text, connections)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "topics": {topic: len(subscribers) for topic, subscribers in self.subscribers.items()},
+            "batching_clients": len(self.batch_windows),
+            "published": self.published,
+            "batches": self.batches
+        }
+
+
+def _topic_list(topics: Iterable[str]) -> List[str]:
+    """topics as a list, rejecting a bare string and names that are not in TOPICS"""
+    if isinstance(topics, str) or not isinstance(topics, (list, tuple, set, frozenset)):
+        raise ValueError(f"topics must be a list of topic names, got {topics!r}")
+    topics = list(topics)
+    unknown = [str(topic) for topic in topics if topic not in TOPICS]
+    if unknown:
+        raise ValueError(f"Unknown topics: {', '.join(unknown)}; expected {', '.join(TOPICS)}")
+    return topics
@@ -0,0 +1,211 @@
+"""
+Executable Index - Resolve app names to launchable argv without a shell
+Requirement 2.1: Launch the application by name or path
+"""
+
+import os
+import platform
+import shlex
+import threading
+import time
+from configparser import ConfigParser, Error as ConfigParserError
+from typing import Dict, List, Optional, Tuple
+from src.app_index import normalize
+
+DEFAULT_CHECK_INTERVAL = 2.0  # Seconds between directory mtime checks
+# Desktop entry Exec field codes that expand to files, URLs or icons; dropped when launching by name
+_FIELD_CODES = {"%f", "%F", "%u", "%U", "%d", "%D", "%n", "%N", "%i", "%c", "%k", "%v", "%m"}
+
+
+def _path_dirs() -> List[str]:
+    dirs = []
+    for directory in os.environ.get("PATH", "").split(os.pathsep):
+        if directory and directory not in dirs:
+            dirs.append(directory)
+    return dirs
+
+
+def _desktop_dirs() -> List[str]:
+    """XDG application directories, highest precedence first"""
+    data_home = os.environ.get("XDG_DATA_HOME") or os.path.expanduser("~/.local/share")
+    data_dirs = (os.environ.get("XDG_DATA_DIRS") or "/usr/local/share:/usr/share").split(":")
+    dirs = [data_home] + [d for d in data_dirs if d] + ["/var/lib/flatpak/exports/share"]
+    return [os.path.join(d, "applications") for d in dirs]
+
+
+def _bundle_dirs() -> List[str]:
+    return ["/Applications", "/System/Applications", os.path.expanduser("~/Applications")]
+
+
+def _scan_path_dir(directory: str) -> Dict[str, List[str]]:
+    """Executables directly in a PATH directory, keyed by normalized name"""
+    windows = platform.system() == "Windows"
+    extensions = {ext.lower() for ext in os.environ.get("PATHEXT", ".EXE;.CMD;.BAT;.COM").split(";")}
+    entries = {}
+    with os.scandir(directory) as it:
+        for entry in it:
+            stem, ext = os.path.splitext(entry.name)
+            if windows:
+                if ext.lower() not in extensions:
+                    continue
+            elif not os.access(entry.path, os.X_OK):
+                continue
+            try:
+                if not entry.is_file():
+                    continue
+            except OSError:
+                continue
+            key = normalize(stem if windows else entry.name)[0]
+            if key:
+                entries.setdefault(key, [entry.path])
+    return entries
+
+
+def _scan_desktop_dir(directory: str) -> Dict[str, List[str]]:
+    """Launchable .desktop entries, keyed by display name, generic name and file id"""
+    entries = {}
+    with os.scandir(directory) as it:
+        for entry in it:
+            if not entry.name.endswith(".desktop"):
+                continue
+            argv, names = _parse_desktop_entry(entry.path)
+            if argv is None:
+                continue
+            for name in names + [entry.name[:-len(".desktop")]]:
+                key = normalize(name)[0]
+                if key:
+                    entries.setdefault(key, argv)
+    return entries
+
+
+def _parse_desktop_entry(path: str) -> Tuple[Optional[List[str]], List[str]]:
+    parser = ConfigParser(interpolation=None, strict=False)
+    parser.optionxform = str  # Keys are case-sensitive
+    try:
+        with open(path, encoding="utf-8", errors="replace") as f:
+            parser.read_file(f)
+        section = parser["Desktop Entry"]
+    except (OSError, KeyError, ConfigParserError):
+        return None, []
+    if (section.get("Type", "Application") != "Application"
+            or section.get("Hidden", "false") == "true"
+            or not section.get("Exec")):
+        return None, []
+    try_exec = section.get("TryExec")
+    if try_exec and not (os.path.isabs(try_exec) and os.access(try_exec, os.X_OK)) \
+            and not any(os.access(os.path.join(d, try_exec), os.X_OK) for d in _path_dirs()):
+        return None, []  # Entry for an uninstalled program
+    try:
+        argv = [arg.replace("%%", "%") for arg in shlex.split(section["Exec"])
+                if arg not in _FIELD_CODES]
+    except ValueError:
+        return None, []
+    names = [section[key] for key in ("Name", "GenericName") if section.get(key)]
+    return (argv or None), names
+
+
+def _scan_bundle_dir(directory: str) -> Dict[str, List[str]]:
+    """macOS .app bundles, launched through open -a"""
+    entries = {}
+    with os.scandir(directory) as it:
+        for entry in it:
+            if entry.name.endswith(".app"):
+                key = normalize(entry.name)[0]
+                if key:
+                    entries.setdefault(key, ["open", "-a", entry.path])
+    return entries
+
+
+class ExecutableIndex:
+    """
+    Maps friendly app names to argv lists, built from desktop entries (or
+    app bundles on macOS) and the executables on PATH. Each directory is
+    scanned once and cached with its mtime; lookups re-stat the directories
+    at most every check_interval seconds and rescan only those that changed,
+    so installs and uninstalls are picked up without walking PATH per launch.
+    """
+
+    def __init__(self, check_interval: float = DEFAULT_CHECK_INTERVAL):
+        self.check_interval = check_interval
+        self.system = platform.system()
+        self._scans: Dict[str, Tuple[Optional[int], Dict[str, List[str]]]] = {}  # dir -> (mtime_ns, entries)
+        self._entries: Dict[str, List[str]] = {}
+        self._sources: Tuple[str, ...] = ()
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+        self.rescans = 0
+
+    def resolve(self, name: str) -> Optional[List[str]]:
+        """argv that launches name, or None if nothing matches"""
+        if os.path.sep in name or (os.path.altsep and os.path.altsep in name):
+            if os.path.isfile(name) and os.access(name, os.X_OK):
+                return [name]
+            if self.system == "Darwin" and name.endswith(".app") and os.path.isdir(name):
+                return ["open", "-a", name]
+            return None
+        self.refresh()
+        argv = self._entries.get(normalize(name)[0])
+        if argv is None and self.system == "Windows":
+            argv = self._registered_app_path(name)
+        return list(argv) if argv is not None else None
+
+    def refresh(self, force: bool = False) -> None:
+        """Rescan directories whose mtime changed since the last check"""
+        if not force and time.monotonic() - self._checked_at < self.check_interval:
+            return
+        with self._lock:
+            if not force and time.monotonic() - self._checked_at < self.check_interval:
+                return
+            # Earlier sources win: friendly names first, then PATH in order
+            if self.system == "Darwin":
+                sources = [(d, _scan_bundle_dir) for d in _bundle_dirs()]
+            elif self.system == "Windows":
+                sources = []
+            else:
+                sources = [(d, _scan_desktop_dir) for d in _desktop_dirs()]
+            sources += [(d, _scan_path_dir) for d in _path_dirs()]
+            changed = tuple(d for d, _ in sources) != self._sources
+            scans = {}
+            for directory, scan in sources:
+                try:
+                    mtime = os.stat(directory).st_mtime_ns
+                except OSError:
+                    mtime = None
+                cached = self._scans.get(directory)
+                if cached is not None and cached[0] == mtime:
+                    scans[directory] = cached
+                    continue
+                changed = True
+                self.rescans += 1
+                try:
+                    scans[directory] = (mtime, scan(directory) if mtime is not None else {})
+                except OSError:
+                    scans[directory] = (mtime, {})
+            if changed:
+                entries: Dict[str, List[str]] = {}
+                for directory, _ in sources:
+                    for key, argv in scans[directory][1].items():
+                        entries.setdefault(key, argv)
+                self._entries = entries
+            self._scans = scans
+            self._sources = tuple(d for d, _ in sources)
+            self._checked_at = time.monotonic()
+
+    @staticmethod
+    def _registered_app_path(name: str) -> Optional[List[str]]:
+        """Windows App Paths registration (how 'start chrome' finds chrome.exe)"""
+        import winreg
+
+        exe = name if name.lower().endswith(".exe") else f"{name}.exe"
+        for hive in (winreg.HKEY_CURRENT_USER, winreg.HKEY_LOCAL_MACHINE):
+            try:
+                with winreg.OpenKey(hive, rf"SOFTWARE\Microsoft\Windows\CurrentVersion\App Paths\{exe}") as key:
+                    path = winreg.QueryValue(key, None)
+            except OSError:
+                continue
+            if path:
+                return [path.strip('"')]
+        return None
+
+    def stats(self) -> dict:
+        return {"names": len(self._entries), "directories": len(self._scans), "rescans": self.rescans}
@@ -5,19 +5,93 @@ Requirements 1.1-1.5: File system management
 
 import os
 import shutil
+import re
+import base64
+import fnmatch
+import itertools
 from pathlib import Path
-from typing import List, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterator, List, Optional, Union
 from src.models import FileInfo, ActionResult, Action
+from src.file_index import FileIndex
+from src.content_search import ContentSearcher
+from src.file_walker import FileWalker, distinct_roots
+from src.file_copy import ChunkedCopier, CopyCancelled
+from src.duplicate_finder import DuplicateFinder
+from src.disk_usage import DiskUsageAnalyzer
+from src.metadata_cache import FileMetadataCache
+from src.archive import Archiver, ArchiveCancelled
+from src.fs_watcher import FileChange, FileWatcher
 from datetime import datetime
 import json
 
 
+def _group_conflicting(operations: List[dict]) -> List[List[int]]:
+    """
+    Split operations into groups that are safe to run concurrently.
+    Operations sharing a path, or where one path contains the other,
+    end up in the same group in their original order.
+    """
+    parent = list(range(len(operations)))
+    
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+    
+    owners: Dict[str, int] = {}
+    op_paths = []
+    for i, op in enumerate(operations):
+        paths = [os.path.normcase(os.path.abspath(op[key]))
+                 for key in ("source", "destination") if op.get(key)]
+        op_paths.append(paths)
+        for path in paths:
+            if path in owners:
+                parent[find(i)] = find(owners[path])
+            else:
+                owners[path] = i
+    # Nested paths conflict too (moving a folder and a file inside it)
+    for i, paths in enumerate(op_paths):
+        for path in paths:
+            ancestor = os.path.dirname(path)
+            while ancestor and ancestor != os.path.dirname(ancestor):
+                if ancestor in owners:
+                    parent[find(i)] = find(owners[ancestor])
+                ancestor = os.path.dirname(ancestor)
+    
+    groups: Dict[int, List[int]] = {}
+    for i in range(len(operations)):
+        groups.setdefault(find(i), []).append(i)
+    return list(groups.values())
+
+
 class FileController:
     """
     Manages file operations with safety and verification
     Requirement 1.1-1.5: File system operations
     """
     
+    def __init__(self, index: Optional[FileIndex] = None,
+                 content_searcher: Optional[ContentSearcher] = None,
+                 walker: Optional[FileWalker] = None,
+                 copier: Optional[ChunkedCopier] = None,
+                 large_file_threshold: int = 64 * 1024 * 1024,
+                 metadata_cache: Optional[FileMetadataCache] = None,
+                 watcher: Optional[FileWatcher] = None):
+        self.walker = walker or FileWalker()
+        self.index = index if index is not None else FileIndex(rules_factory=self.walker.rules_for)
+        self.content_searcher = content_searcher or ContentSearcher()
+        self.copier = copier or ChunkedCopier()
+        self.large_file_threshold = large_file_threshold
+        self.duplicate_finder = DuplicateFinder(self.walker)
+        self.disk_usage_analyzer = DiskUsageAnalyzer()
+        self.metadata_cache = metadata_cache or FileMetadataCache()
+        self.archiver = Archiver()
+        self.watcher = watcher or FileWatcher(self.walker)
+        self.watcher.subscribe(self._apply_file_changes)
+    
     def open_file(self, file_path: str) -> ActionResult:
         """
         Open a file with default application
@@ -123,10 +197,16 @@ class FileController:
                 error=str(e)
             )
     
-    def copy_file(self, source: str, destination: str) -> ActionResult:
+    def copy_file(self, source: str, destination: str,
+                  progress_callback: Optional[Callable[[dict], None]] = None,
+                  cancel_event: Optional[threading.Event] = None) -> ActionResult:
         """
         Copy a file preserving source
         Requirement 1.3: Perform copy operation
+        
+        Files of large_file_threshold bytes or more, or any copy with a progress
+        callback or cancel event, go through the chunked copier, which reports
+        progress in bytes and resumes from a partial destination after a failure.
         """
         try:
             src_path = Path(source)
@@ -141,13 +221,32 @@ class FileController:
                 )
             
             dst_path.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(src_path, dst_path)
+            output = {"source": str(src_path.absolute()), "destination": str(dst_path.absolute())}
+            
+            chunked = progress_callback is not None or cancel_event is not None
+            if src_path.is_file() and (chunked or src_path.stat().st_size >= self.large_file_threshold):
+                if dst_path.is_dir():
+                    dst_path = dst_path / src_path.name
+                    output["destination"] = str(dst_path.absolute())
+                try:
+                    output.update(self.copier.copy(str(src_path), str(dst_path),
+                                                   progress_callback, cancel_event))
+                except CopyCancelled as e:
+                    return ActionResult(
+                        success=False,
+                        action="copy_file",
+                        message=f"Copy cancelled after {e.bytes_copied} bytes; it will resume from there",
+                        output=output,
+                        error="CopyCancelled"
+                    )
+            else:
+                shutil.copy2(src_path, dst_path)
             
             return ActionResult(
                 success=True,
                 action="copy_file",
                 message=f"File copied: {source} -> {destination}",
-                output={"source": str(src_path.absolute()), "destination": str(dst_path.absolute())}
+                output=output
             )
         except Exception as e:
             return ActionResult(
@@ -231,52 +330,171 @@ class FileController:
                 error=str(e)
             )
     
-    def search_files(self, directory: str, pattern: str = "*", 
-                     search_type: str = "name") -> ActionResult:
+    def batch_operations(self, operations: List[dict], max_workers: int = 8,
+                         atomic: bool = False,
+                         progress_callback: Optional[Callable[[dict], None]] = None) -> ActionResult:
+        """
+        Run a batch of copy/move/delete operations
+        Requirement 1.3-1.4: Bulk copy, move and safe delete
+        
+        Each operation is {"op": "copy"|"move"|"delete", "source": ..., "destination": ...}.
+        Operations touching the same path (or a parent of it) run in order;
+        independent ones run concurrently on up to max_workers threads.
+        With atomic=True (moves only) a single failure rolls back every completed move,
+        and a move onto a path that already exists counts as a failure.
+        progress_callback receives {"completed", "total", "index", "success"} per item.
+        """
+        try:
+            handlers = {"copy": self.copy_file, "move": self.move_file, "delete": self.delete_file}
+            for i, op in enumerate(operations):
+                if op.get("op") not in handlers:
+                    return ActionResult(
+                        success=False,
+                        action="batch_operations",
+                        message=f"Operation {i}: unknown op '{op.get('op')}'",
+                        error="InvalidOperationError"
+                    )
+                if not op.get("source") or (op["op"] != "delete" and not op.get("destination")):
+                    return ActionResult(
+                        success=False,
+                        action="batch_operations",
+                        message=f"Operation {i}: source and destination are required",
+                        error="InvalidOperationError"
+                    )
+            if atomic and any(op["op"] != "move" for op in operations):
+                return ActionResult(
+                    success=False,
+                    action="batch_operations",
+                    message="Atomic batches support move operations only",
+                    error="InvalidOperationError"
+                )
+            
+            total = len(operations)
+            results: List[Optional[dict]] = [None] * total
+            completed_moves = []  # (index, source, destination) in completion order
+            failed = threading.Event()
+            lock = threading.Lock()
+            progress = {"completed": 0}
+            
+            def run_group(indices: List[int]) -> None:
+                for i in indices:
+                    op = operations[i]
+                    item = {"index": i, "op": op["op"], "source": op["source"],
+                            "destination": op.get("destination")}
+                    if atomic and failed.is_set():
+                        item.update(success=False, status="skipped",
+                                    message="Skipped after an earlier failure")
+                    elif atomic and os.path.lexists(op["destination"]):
+                        # A replaced file could not be brought back on rollback
+                        item.update(success=False, status="failed",
+                                    message=f"Destination already exists: {op['destination']}",
+                                    error="FileExistsError")
+                        failed.set()
+                    else:
+                        if op["op"] == "delete":
+                            result = handlers["delete"](op["source"])
+                        else:
+                            result = handlers[op["op"]](op["source"], op["destination"])
+                        item.update(success=result.success, message=result.message,
+                                    error=result.error,
+                                    status="done" if result.success else "failed")
+                        if not result.success:
+                            failed.set()
+                        elif op["op"] == "move":
+                            with lock:
+                                completed_moves.append((i, op["source"], op["destination"]))
+                    results[i] = item
+                    if progress_callback:
+                        with lock:
+                            progress["completed"] += 1
+                            event = {"completed": progress["completed"], "total": total,
+                                     "index": i, "success": item["success"]}
+                        progress_callback(event)
+            
+            groups = _group_conflicting(operations)
+            with ThreadPoolExecutor(max_workers=max(1, max_workers),
+                                    thread_name_prefix="file-batch") as executor:
+                for future in [executor.submit(run_group, group) for group in groups]:
+                    future.result()
+            
+            rolled_back = False
+            if atomic and failed.is_set():
+                # Undo in reverse completion order so chained moves unwind correctly
+                for i, source, destination in reversed(completed_moves):
+                    undo = self.move_file(destination, source)
+                    results[i]["status"] = "rolled_back" if undo.success else "rollback_failed"
+                    if not undo.success:
+                        results[i]["error"] = undo.error
+                rolled_back = True
+            
+            succeeded = sum(1 for item in results if item["status"] == "done")
+            return ActionResult(
+                success=not failed.is_set(),
+                action="batch_operations",
+                message=(f"Batch rolled back after a failure ({succeeded} of {total} kept)"
+                         if rolled_back else f"Completed {succeeded} of {total} operations"),
+                output={"results": results, "total": total, "succeeded": succeeded,
+                        "rolled_back": rolled_back}
+            )
+        except Exception as e:
+            return ActionResult(
+                success=False,
+                action="batch_operations",
+                message="Failed to run batch operations",
+                error=str(e)
+            )
+    
+    def search_files(self, directory: Union[str, List[str]], pattern: Union[str, List[str]] = "*", 
+                     search_type: str = "name", limit: Optional[int] = None,
+                     offset: int = 0, cursor: Optional[str] = None,
+                     regex: bool = False) -> ActionResult:
         """
         Search for files by name, type, or content
         Requirement 1.5: Return matching files based on name, type, or content
+        
+        Results are paged with limit/offset or the opaque next_cursor returned
+        by a previous call; the walk stops as soon as the page is full.
+        directory may also be a list of roots searched in turn.
+        Content searches accept a list of patterns (any may match) and regexes
+        with regex=True; each result carries its matching lines under "matches".
         """
         try:
-            dir_path = Path(directory)
-            if not dir_path.exists():
+            roots = [directory] if isinstance(directory, str) else list(directory)
+            missing = [root for root in roots if not Path(root).exists()]
+            if missing or not roots:
                 return ActionResult(
                     success=False,
                     action="search_files",
-                    message=f"Directory not found: {directory}",
+                    message=f"Directory not found: {', '.join(missing) or directory}",
                     error="DirectoryNotFoundError"
                 )
             
-            results = []
+            if cursor:
+                try:
+                    offset = self.decode_search_cursor(cursor, directory, pattern, search_type,
+                                                       regex)
+                except ValueError as e:
+                    return ActionResult(
+                        success=False,
+                        action="search_files",
+                        message="Invalid search cursor",
+                        error=str(e)
+                    )
             
-            if search_type == "name":
-                # Search by filename pattern
-                for item in dir_path.rglob(pattern):
-                    if item.is_file():
-                        results.append(self._file_to_dict(item))
-            
-            elif search_type == "type":
-                # Search by file extension
-                ext = pattern if pattern.startswith('.') else f".{pattern}"
-                for item in dir_path.rglob(f"*{ext}"):
-                    if item.is_file():
-                        results.append(self._file_to_dict(item))
-            
-            elif search_type == "content":
-                # Search by file content
-                for item in dir_path.rglob("*"):
-                    if item.is_file():
-                        try:
-                            if pattern in item.read_text():
-                                results.append(self._file_to_dict(item))
-                        except:
-                            pass  # Skip binary files
+            results = []
+            next_cursor = None
+            for item in self.iter_search(directory, pattern, search_type, offset, regex):
+                if limit is not None and len(results) >= limit:
+                    next_cursor = self.encode_search_cursor(
+                        directory, pattern, search_type, offset + limit, regex)
+                    break
+                results.append(item)
             
             return ActionResult(
                 success=True,
                 action="search_files",
                 message=f"Found {len(results)} matching files",
-                output={"results": results, "count": len(results)}
+                output={"results": results, "count": len(results), "next_cursor": next_cursor}
             )
         except Exception as e:
             return ActionResult(
@@ -286,11 +504,423 @@ class FileController:
                 error=str(e)
             )
     
-    def _file_to_dict(self, path: Path) -> dict:
-        """Convert file to dictionary representation"""
-        stat = path.stat()
+    def iter_search(self, directory: Union[str, List[str]], pattern: Union[str, List[str]] = "*",
+                    search_type: str = "name", offset: int = 0,
+                    regex: bool = False) -> Iterator[dict]:
+        """
+        Yield matching files as they are found, skipping the first offset matches.
+        directory may be a list of roots (e.g. FileWalker.mount_points()), which
+        are walked in turn; roots nested inside another root are searched once.
+        Closing the generator stops the underlying walk.
+        """
+        roots = distinct_roots([directory] if isinstance(directory, str) else directory)
+        paths = itertools.islice(self._iter_search_paths(roots, pattern, search_type, regex),
+                                 offset, None)
+        for item in paths:
+            try:
+                if isinstance(item, tuple):
+                    entry, matches = item
+                    result = self._file_to_dict(entry.path, entry.stat())
+                    result["matches"] = matches
+                    yield result
+                elif isinstance(item, os.DirEntry):
+                    yield self._file_to_dict(item.path, item.stat())
+                else:
+                    yield self._file_to_dict(item)
+            except FileNotFoundError:
+                pass  # Removed while searching
+    
+    def _iter_search_paths(self, roots: List[str], pattern: Union[str, List[str]], search_type: str,
+                           regex: bool = False) -> Iterator[Union[os.DirEntry, str, tuple]]:
+        if search_type == "name":
+            # Search by filename pattern
+            indexed = self.index.search_name(roots[0], pattern) if len(roots) == 1 else None
+            if indexed is not None:
+                yield from indexed
+            elif os.sep in pattern or (os.altsep and os.altsep in pattern):
+                # Path-style globs keep pathlib semantics
+                for root in roots:
+                    yield from (str(item) for item in Path(root).rglob(pattern) if item.is_file())
+            else:
+                yield from self._walk_matching(roots, pattern)
+        
+        elif search_type == "type":
+            # Search by file extension
+            ext = pattern if pattern.startswith('.') else f".{pattern}"
+            indexed = self.index.search_extension(roots[0], ext) if len(roots) == 1 else None
+            if indexed is not None:
+                yield from indexed
+            else:
+                yield from self._walk_matching(roots, f"*{ext}")
+        
+        elif search_type == "content":
+            # Search by file content (binary and oversized files are skipped),
+            # yielding (entry, matching lines)
+            yield from self.content_searcher.iter_matches(self.walker.walk(roots), pattern, regex)
+    
+    def _walk_matching(self, roots: List[str], pattern: str) -> Iterator[os.DirEntry]:
+        """Walk roots yielding files whose name matches a glob"""
+        match = re.compile(fnmatch.translate(os.path.normcase(pattern))).match
+        normcase = os.path.normcase
+        for entry in self.walker.walk(roots):
+            if match(normcase(entry.name)):
+                yield entry
+    
+    @staticmethod
+    def encode_search_cursor(directory: Union[str, List[str]], pattern: Union[str, List[str]],
+                             search_type: str, offset: int, regex: bool = False) -> str:
+        """Opaque cursor pointing at the next page of a search"""
+        state = json.dumps({"d": directory, "p": pattern, "t": search_type, "o": offset,
+                            "r": regex})
+        return base64.urlsafe_b64encode(state.encode("utf-8")).decode("ascii")
+    
+    @staticmethod
+    def decode_search_cursor(cursor: str, directory: Union[str, List[str]],
+                             pattern: Union[str, List[str]], search_type: str,
+                             regex: bool = False) -> int:
+        """Offset stored in a cursor; raises ValueError if it belongs to another search"""
+        try:
+            state = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+            offset = int(state["o"])
+        except (ValueError, KeyError, TypeError) as e:
+            raise ValueError(f"Malformed cursor: {e}")
+        if ((state.get("d"), state.get("p"), state.get("t"), bool(state.get("r")))
+                != (directory, pattern, search_type, regex)):
+            raise ValueError("Cursor does not belong to this search")
+        return offset
+    
+    def find_duplicates(self, roots: Union[str, List[str]], min_size: int = 1,
+                        respect_ignore: bool = False) -> ActionResult:
+        """
+        Find groups of identical files below one or more roots
+        Requirement 1.5: Match files by content to reclaim disk space
+        
+        All files are scanned, ignored trees included, unless respect_ignore
+        is set, which applies the walker's excludes and .gitignore files.
+        """
+        try:
+            roots = [roots] if isinstance(roots, str) else list(roots)
+            missing = [root for root in roots if not Path(root).is_dir()]
+            if missing or not roots:
+                return ActionResult(
+                    success=False,
+                    action="find_duplicates",
+                    message=f"Directory not found: {', '.join(missing) or roots}",
+                    error="DirectoryNotFoundError"
+                )
+            
+            groups = []
+            reclaimable = 0
+            for digest, entries in self.duplicate_finder.find(roots, min_size, respect_ignore):
+                files = []
+                for entry in entries:
+                    try:
+                        files.append(self._file_to_dict(entry.path, entry.stat()))
+                    except FileNotFoundError:
+                        pass
+                if len(files) < 2:
+                    continue
+                wasted = files[0]["size"] * (len(files) - 1)
+                reclaimable += wasted
+                groups.append({"hash": digest, "size": files[0]["size"],
+                               "files": files, "reclaimable": wasted})
+            
+            return ActionResult(
+                success=True,
+                action="find_duplicates",
+                message=f"Found {len(groups)} groups of duplicate files ({reclaimable} bytes reclaimable)",
+                output={"groups": groups, "count": len(groups), "reclaimable_bytes": reclaimable}
+            )
+        except Exception as e:
+            return ActionResult(
+                success=False,
+                action="find_duplicates",
+                message="Failed to find duplicate files",
+                error=str(e)
+            )
+    
+    def compress(self, sources: Union[str, List[str]], destination: str,
+                 archive_format: Optional[str] = None, exclude: Optional[List[str]] = None,
+                 progress_callback: Optional[Callable[[dict], None]] = None,
+                 cancel_event: Optional[threading.Event] = None) -> ActionResult:
+        """
+        Pack files and folders into a zip, tar or tar.gz archive
+        Requirement 1.3: Package files and folders
+        
+        The format follows the destination suffix unless archive_format is given.
+        .git, node_modules and other default excludes are left out, as is
+        anything matching the exclude patterns (a single string is one pattern).
+        """
+        try:
+            sources = [sources] if isinstance(sources, str) else list(sources)
+            if isinstance(exclude, str):
+                exclude = [exclude]
+            missing = [source for source in sources if not Path(source).exists()]
+            if missing or not sources:
+                return ActionResult(
+                    success=False,
+                    action="compress",
+                    message=f"Source not found: {', '.join(missing) or sources}",
+                    error="FileNotFoundError"
+                )
+            
+            try:
+                output = self.archiver.compress(sources, destination, archive_format, exclude,
+                                                progress_callback=progress_callback,
+                                                cancel_event=cancel_event)
+            except ArchiveCancelled as e:
+                return ActionResult(
+                    success=False,
+                    action="compress",
+                    message=f"Compression cancelled after {e.bytes_done} bytes",
+                    error="ArchiveCancelled"
+                )
+            
+            return ActionResult(
+                success=True,
+                action="compress",
+                message=f"Archived {output['files']} files into {output['archive']}",
+                output=output
+            )
+        except Exception as e:
+            return ActionResult(
+                success=False,
+                action="compress",
+                message="Failed to create archive",
+                error=str(e)
+            )
+    
+    def extract(self, archive: str, destination: str,
+                progress_callback: Optional[Callable[[dict], None]] = None,
+                cancel_event: Optional[threading.Event] = None) -> ActionResult:
+        """
+        Unpack a zip or tar archive (gz, bz2 and xz compressed too)
+        Requirement 1.3: Unpack archives
+        
+        Members that would be written outside destination are skipped.
+        """
+        try:
+            if not Path(archive).is_file():
+                return ActionResult(
+                    success=False,
+                    action="extract",
+                    message=f"Archive not found: {archive}",
+                    error="FileNotFoundError"
+                )
+            
+            try:
+                output = self.archiver.extract(archive, destination, progress_callback, cancel_event)
+            except ArchiveCancelled as e:
+                return ActionResult(
+                    success=False,
+                    action="extract",
+                    message=f"Extraction cancelled after {e.bytes_done} bytes; extracted files were kept",
+                    error="ArchiveCancelled"
+                )
+            
+            return ActionResult(
+                success=True,
+                action="extract",
+                message=f"Extracted {output['files']} files into {output['destination']}",
+                output=output
+            )
+        except Exception as e:
+            return ActionResult(
+                success=False,
+                action="extract",
+                message="Failed to extract archive",
+                error=str(e)
+            )
+    
+    def disk_usage(self, directory: str, top_n: int = 20, full: bool = False) -> ActionResult:
+        """
+        Report the largest directories and files below a directory
+        Requirement 1.5: Show what is using disk space
+        """
+        try:
+            if not Path(directory).is_dir():
+                return ActionResult(
+                    success=False,
+                    action="disk_usage",
+                    message=f"Directory not found: {directory}",
+                    error="DirectoryNotFoundError"
+                )
+            
+            report = None
+            for report in self.iter_disk_usage(directory, top_n, full):
+                pass
+            
+            return ActionResult(
+                success=True,
+                action="disk_usage",
+                message=f"{directory} uses {report['bytes']} bytes in {report['files']} files",
+                output=report
+            )
+        except Exception as e:
+            return ActionResult(
+                success=False,
+                action="disk_usage",
+                message="Failed to analyze disk usage",
+                error=str(e)
+            )
+    
+    def iter_disk_usage(self, directory: str, top_n: int = 20,
+                        full: bool = False) -> Iterator[dict]:
+        """Progress events while scanning, then the final "result" report"""
+        return self.disk_usage_analyzer.scan(directory, top_n, full)
+    
+    def list_directory(self, directory: str) -> ActionResult:
+        """
+        List the files and folders directly inside a directory
+        Requirement 1.5: Return file information for a folder
+        """
+        try:
+            if not Path(directory).is_dir():
+                return ActionResult(
+                    success=False,
+                    action="list_directory",
+                    message=f"Directory not found: {directory}",
+                    error="DirectoryNotFoundError"
+                )
+            
+            files, directories = [], []
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir():
+                            directories.append({"path": os.path.abspath(entry.path),
+                                                "name": entry.name})
+                        else:
+                            files.append(self._file_to_dict(entry.path, entry.stat()))
+                    except FileNotFoundError:
+                        pass
+            
+            return ActionResult(
+                success=True,
+                action="list_directory",
+                message=f"{len(files)} files and {len(directories)} folders in {directory}",
+                output={"files": files, "directories": directories,
+                        "count": len(files) + len(directories)}
+            )
+        except Exception as e:
+            return ActionResult(
+                success=False,
+                action="list_directory",
+                message="Failed to list directory",
+                error=str(e)
+            )
+    
+    def metadata_cache_stats(self) -> ActionResult:
+        """Hit/miss counters of the shared file metadata cache, for sizing it"""
+        return ActionResult(
+            success=True,
+            action="metadata_cache_stats",
+            message="File metadata cache statistics",
+            output=self.metadata_cache.stats()
+        )
+    
+    def index_directory(self, directory: str) -> ActionResult:
+        """
+        Add a directory tree to the persistent filename index
+        Requirement 1.5: Name and type searches under it are answered from the index
+        """
+        try:
+            dir_path = Path(directory)
+            if not dir_path.is_dir():
+                return ActionResult(
+                    success=False,
+                    action="index_directory",
+                    message=f"Directory not found: {directory}",
+                    error="DirectoryNotFoundError"
+                )
+            
+            count = self.index.add_root(str(dir_path))
+            
+            return ActionResult(
+                success=True,
+                action="index_directory",
+                message=f"Indexed {count} files in {directory}",
+                output={"path": str(dir_path.resolve()), "count": count}
+            )
+        except Exception as e:
+            return ActionResult(
+                success=False,
+                action="index_directory",
+                message="Failed to index directory",
+                error=str(e)
+            )
+    
+    def watch_directory(self, directory: str) -> ActionResult:
+        """
+        Watch a directory tree for changes
+        Requirement 1.5: Keep file views current without re-running searches
+        
+        Changes are published to watcher subscribers in debounced batches.
+        """
+        try:
+            if not Path(directory).is_dir():
+                return ActionResult(
+                    success=False,
+                    action="watch_directory",
+                    message=f"Directory not found: {directory}",
+                    error="DirectoryNotFoundError"
+                )
+            
+            backend = self.watcher.watch(directory)
+            
+            return ActionResult(
+                success=True,
+                action="watch_directory",
+                message=f"Watching {directory} ({backend})",
+                output={"path": str(Path(directory).resolve()), "backend": backend,
+                        **self.watcher.stats()}
+            )
+        except Exception as e:
+            return ActionResult(
+                success=False,
+                action="watch_directory",
+                message="Failed to watch directory",
+                error=str(e)
+            )
+    
+    def unwatch_directory(self, directory: str) -> ActionResult:
+        """Stop watching a directory tree"""
+        if not self.watcher.unwatch(directory):
+            return ActionResult(
+                success=False,
+                action="unwatch_directory",
+                message=f"Not watching {directory}",
+                error="NotWatchedError"
+            )
+        return ActionResult(
+            success=True,
+            action="unwatch_directory",
+            message=f"Stopped watching {directory}",
+            output=self.watcher.stats()
+        )
+    
+    def _apply_file_changes(self, changes: List[FileChange]) -> None:
+        """Watcher subscriber: drop cached state for changed paths"""
+        for change in changes:
+            self.index.invalidate(change.path)
+            if change.kind != "created" and not change.is_dir:
+                self.metadata_cache.invalidate(change.path)
+    
+    def _file_to_dict(self, path: Union[Path, str],
+                      stat: Optional[os.stat_result] = None) -> dict:
+        """
+        Convert file to dictionary representation, reusing stat when the caller has it.
+        Served from the metadata cache while the file is unchanged.
+        """
+        path = os.path.abspath(path)
+        if stat is None:
+            stat = os.stat(path)
+        return self.metadata_cache.get_or_build(path, stat, lambda: self._build_file_dict(path, stat))
+    
+    def _build_file_dict(self, path: str, stat: os.stat_result) -> dict:
+        path = Path(path)
         return {
-            "path": str(path.absolute()),
+            "path": str(path),
             "name": path.name,
             "size": stat.st_size,
             "created_at": datetime.fromtimestamp(stat.st_ctime).isoformat(),
@@ -0,0 +1,421 @@
+"""
+File Index - Persistent filename/extension index
+Requirement 1.5: Return matching files based on name or type without re-walking the disk
+"""
+
+import fnmatch
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Set
+from src.ignore_rules import IgnoreRules, IGNORE_FILE
+
+INDEX_VERSION = 3
+DEFAULT_INDEX_DIR = Path.home() / ".dev-ai" / "file_index"
+GLOB_SPECIAL = "*?["
+# A directory modified this recently may change again within its mtime granularity
+# (up to 2 s on FAT), so its listing is not trusted until it has been quiet that long
+RACY_WINDOW_NS = 2_000_000_000
+
+
+def _trigrams(text: str) -> Set[str]:
+    """Lower-cased trigrams of a string"""
+    text = text.lower()
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def _pattern_trigrams(pattern: str) -> Set[str]:
+    """Trigrams every name matching a glob pattern must contain"""
+    grams: Set[str] = set()
+    literal = []
+    i = 0
+    while i < len(pattern):
+        ch = pattern[i]
+        i += 1
+        if ch not in GLOB_SPECIAL:
+            literal.append(ch)
+            continue
+        grams |= _trigrams("".join(literal))
+        literal = []
+        if ch == "[":
+            # Skip the character class; a leading "!" or "]" belongs to it
+            j = i + 1 if pattern[i:i + 1] == "!" else i
+            j = j + 1 if pattern[j:j + 1] == "]" else j
+            close = pattern.find("]", j)
+            if close == -1:
+                literal.append("[")  # fnmatch treats an unclosed "[" literally
+            else:
+                i = close + 1
+    grams |= _trigrams("".join(literal))
+    return grams
+
+
+def _suffix(name: str) -> str:
+    """Lower-cased text from the last dot, so ".py" and "a.py" share a key"""
+    dot = name.rfind(".")
+    return name[dot:].lower() if dot != -1 else ""
+
+
+def _within(path: str, directory: str) -> bool:
+    return path == directory or path.startswith(directory.rstrip(os.sep) + os.sep)
+
+
+def _ignore_mtime(directory: str) -> Optional[int]:
+    try:
+        return os.stat(os.path.join(directory, IGNORE_FILE)).st_mtime_ns
+    except OSError:
+        return None
+
+
+class _RootIndex:
+    """Index of every file below a single root directory"""
+
+    def __init__(self, root: str,
+                 rules_factory: Callable[[str], IgnoreRules] = IgnoreRules.for_root):
+        self.root = root
+        self.rules_factory = rules_factory
+        self.lock = threading.RLock()
+        self.refreshed_at = 0.0
+        # directory -> (mtime_ns, {file name: file id}, [subdirectory names], .gitignore mtime_ns)
+        self.dirs: Dict[str, tuple] = {}
+        self.files: Dict[int, tuple] = {}  # file id -> (directory, name)
+        self.trigrams: Dict[str, Set[int]] = {}
+        self.extensions: Dict[str, Set[int]] = {}
+        self._next_id = 0
+
+    def _add_file(self, directory: str, name: str) -> int:
+        file_id = self._next_id
+        self._next_id += 1
+        self.files[file_id] = (directory, name)
+        for gram in _trigrams(name):
+            self.trigrams.setdefault(gram, set()).add(file_id)
+        self.extensions.setdefault(_suffix(name), set()).add(file_id)
+        return file_id
+
+    def _remove_file(self, file_id: int) -> None:
+        directory, name = self.files.pop(file_id)
+        for gram in _trigrams(name):
+            postings = self.trigrams.get(gram)
+            if postings is not None:
+                postings.discard(file_id)
+                if not postings:
+                    del self.trigrams[gram]
+        postings = self.extensions.get(_suffix(name))
+        if postings is not None:
+            postings.discard(file_id)
+            if not postings:
+                del self.extensions[_suffix(name)]
+
+    def _set_dir(self, directory: str, mtime_ns: int, file_names: Iterable[str],
+                 subdirs: List[str], ignore_mtime_ns: Optional[int] = None) -> None:
+        """Replace one directory record, diffing its files against the old record"""
+        old = self.dirs.get(directory)
+        old_files = old[1] if old else {}
+        new_files = {}
+        for name in file_names:
+            if name in old_files:
+                new_files[name] = old_files[name]
+            else:
+                new_files[name] = self._add_file(directory, name)
+        for name, file_id in old_files.items():
+            if name not in new_files:
+                self._remove_file(file_id)
+        self.dirs[directory] = (mtime_ns, new_files, subdirs, ignore_mtime_ns)
+
+    def _drop_dir(self, directory: str) -> None:
+        record = self.dirs.pop(directory, None)
+        if record is None:
+            return
+        for file_id in record[1].values():
+            self._remove_file(file_id)
+        for sub in record[2]:
+            self._drop_dir(os.path.join(directory, sub))
+
+    def _start_at(self, directory: str) -> Optional[tuple]:
+        """
+        Stack item for refreshing only the subtree at directory: the rules in
+        effect above it and its depth. None when an ancestor changed since it
+        was listed (its rules may differ), so the whole root must be refreshed.
+        """
+        rules = self.rules_factory(self.root)
+        parts = os.path.relpath(directory, self.root).split(os.sep)
+        ancestor = self.root
+        for part in parts:
+            record = self.dirs.get(ancestor)
+            try:
+                mtime_ns = os.stat(ancestor).st_mtime_ns
+            except OSError:
+                return None
+            if record is None or record[0] != mtime_ns or \
+                    record[3] != (_ignore_mtime(ancestor) if IGNORE_FILE in record[1] else None):
+                return None
+            rules = rules.for_directory(ancestor, IGNORE_FILE in record[1])
+            ancestor = os.path.join(ancestor, part)
+        return directory, rules, len(parts), False
+
+    def refresh(self, directory: Optional[str] = None) -> int:
+        """
+        Bring the index up to date by diffing directory mtimes, below
+        directory if given (falling back to the whole root when one of its
+        ancestors changed). Unchanged directories cost one stat (two with a
+        .gitignore); only changed ones are re-listed. Editing a .gitignore
+        changes the rules below it, so its whole subtree is re-listed.
+        Returns the number of directories that were re-listed.
+        """
+        changed = 0
+        with self.lock:
+            start = self._start_at(directory) if directory and directory != self.root else None
+            full = start is None
+            stack = [(self.root, self.rules_factory(self.root), 0, False) if full else start]
+            while stack:
+                directory, rules, depth, rules_changed = stack.pop()
+                try:
+                    mtime_ns = os.stat(directory).st_mtime_ns
+                except OSError:
+                    self._drop_dir(directory)
+                    continue
+
+                record = self.dirs.get(directory)
+                unchanged = record is not None and record[0] == mtime_ns and not rules_changed
+                if unchanged and IGNORE_FILE in record[1]:
+                    # Editing .gitignore leaves the directory's own mtime alone
+                    unchanged = record[3] == _ignore_mtime(directory)
+                if unchanged:
+                    subdirs = record[2]
+                    rules = rules.for_directory(directory, IGNORE_FILE in record[1])
+                else:
+                    changed += 1
+                    file_names, subdirs = [], []
+                    try:
+                        with os.scandir(directory) as it:
+                            entries = list(it)
+                    except OSError:
+                        self._drop_dir(directory)
+                        continue
+                    has_ignore_file = any(entry.name == IGNORE_FILE for entry in entries)
+                    ignore_mtime_ns = _ignore_mtime(directory) if has_ignore_file else None
+                    if record is not None and record[3] != ignore_mtime_ns:
+                        rules_changed = True  # Cached listings below were filtered by the old rules
+                    rules = rules.for_directory(directory, has_ignore_file)
+                    for entry in entries:
+                        try:
+                            is_dir = entry.is_dir(follow_symlinks=False)
+                            if rules.is_ignored(entry.path, is_dir):
+                                continue
+                            if is_dir:
+                                subdirs.append(entry.name)
+                            elif entry.is_file():
+                                file_names.append(entry.name)
+                        except OSError:
+                            continue
+                    if record is not None:
+                        for sub in set(record[2]) - set(subdirs):
+                            self._drop_dir(os.path.join(directory, sub))
+                    if time.time_ns() - mtime_ns < RACY_WINDOW_NS:
+                        mtime_ns = None  # Re-list on the next refresh; see RACY_WINDOW_NS
+                    self._set_dir(directory, mtime_ns, file_names, subdirs, ignore_mtime_ns)
+
+                if rules.depth_allowed(depth + 1):
+                    stack.extend((os.path.join(directory, sub), rules, depth + 1, rules_changed)
+                                 for sub in subdirs)
+            if full:
+                self.refreshed_at = time.monotonic()
+        return changed
+
+    def covers(self, directory: str) -> bool:
+        """Whether directory was indexed (not pruned by ignore rules or the depth limit)"""
+        with self.lock:
+            return directory in self.dirs
+
+    def match(self, directory: str, pattern: str,
+              candidates: Optional[Set[int]]) -> List[str]:
+        """Paths under directory whose name matches a glob pattern, sorted so pages are stable"""
+        with self.lock:
+            if candidates is None:
+                ids = self.files.keys()
+            else:
+                ids = candidates
+            results = []
+            for file_id in ids:
+                entry = self.files.get(file_id)
+                if entry is None:
+                    continue  # Removed by a refresh since the candidates were taken
+                parent, name = entry
+                if _within(parent, directory) and fnmatch.fnmatch(name, pattern):
+                    results.append(os.path.join(parent, name))
+        results.sort()
+        return results
+
+    def name_candidates(self, pattern: str) -> Optional[Set[int]]:
+        """Intersect trigram postings for a glob, or None if it has no usable literal"""
+        grams = _pattern_trigrams(pattern)
+        if not grams:
+            return None
+        with self.lock:
+            postings = sorted((self.trigrams.get(g, set()) for g in grams), key=len)
+            result = set(postings[0])
+            for other in postings[1:]:
+                result &= other
+                if not result:
+                    break
+            return result
+
+    def extension_candidates(self, ext: str) -> Set[int]:
+        with self.lock:
+            return set(self.extensions.get(_suffix(ext), set()))
+
+    def to_json(self) -> dict:
+        with self.lock:
+            return {
+                "version": INDEX_VERSION,
+                "root": self.root,
+                "dirs": {
+                    directory: [mtime_ns, sorted(files), subdirs, ignore_mtime_ns]
+                    for directory, (mtime_ns, files, subdirs, ignore_mtime_ns) in self.dirs.items()
+                },
+            }
+
+    @classmethod
+    def from_json(cls, data: dict,
+                  rules_factory: Callable[[str], IgnoreRules] = IgnoreRules.for_root) -> "_RootIndex":
+        index = cls(data["root"], rules_factory)
+        for directory, (mtime_ns, file_names, subdirs, ignore_mtime_ns) in data["dirs"].items():
+            index._set_dir(directory, mtime_ns, file_names, subdirs, ignore_mtime_ns)
+        return index
+
+
+class FileIndex:
+    """
+    On-disk filename/extension index with trigram lookup.
+    Roots are refreshed incrementally by directory mtime diffing, and
+    pruned with the same ignore rules as FileWalker.
+    """
+
+    def __init__(self, index_dir: Optional[str] = None, refresh_interval: float = 30.0,
+                 rules_factory: Callable[[str], IgnoreRules] = IgnoreRules.for_root):
+        self.index_dir = Path(index_dir) if index_dir else DEFAULT_INDEX_DIR
+        self.refresh_interval = refresh_interval
+        self.rules_factory = rules_factory
+        self._roots: Dict[str, _RootIndex] = {}
+        self._lock = threading.Lock()
+        self._loaded = False
+
+    def _index_file(self, root: str) -> Path:
+        digest = hashlib.sha1(root.encode("utf-8", "surrogateescape")).hexdigest()
+        return self.index_dir / f"{digest}.json"
+
+    def _load(self) -> None:
+        """Load persisted roots on first use"""
+        with self._lock:
+            if self._loaded:
+                return
+            self._loaded = True
+            if not self.index_dir.is_dir():
+                return
+            for index_file in self.index_dir.glob("*.json"):
+                try:
+                    data = json.loads(index_file.read_text(encoding="utf-8"))
+                    if data.get("version") != INDEX_VERSION:
+                        continue
+                    root_index = _RootIndex.from_json(data, self.rules_factory)
+                    self._roots[root_index.root] = root_index
+                except (OSError, ValueError, KeyError, TypeError):
+                    continue  # Corrupt or foreign file, rebuilt on next add_root
+
+    def _save(self, root_index: _RootIndex) -> None:
+        self.index_dir.mkdir(parents=True, exist_ok=True)
+        index_file = self._index_file(root_index.root)
+        tmp_file = index_file.with_suffix(".tmp")
+        tmp_file.write_text(json.dumps(root_index.to_json()), encoding="utf-8")
+        os.replace(tmp_file, index_file)
+
+    def add_root(self, directory: str) -> int:
+        """Index a directory tree (or refresh it if already indexed); returns file count"""
+        self._load()
+        root = str(Path(directory).resolve())
+        with self._lock:
+            root_index = self._roots.get(root)
+            if root_index is None:
+                root_index = self._roots[root] = _RootIndex(root, self.rules_factory)
+        root_index.refresh()
+        self._save(root_index)
+        return len(root_index.files)
+
+    def remove_root(self, directory: str) -> bool:
+        self._load()
+        root = str(Path(directory).resolve())
+        with self._lock:
+            root_index = self._roots.pop(root, None)
+        if root_index is None:
+            return False
+        try:
+            self._index_file(root).unlink()
+        except OSError:
+            pass
+        return True
+
+    def roots(self) -> List[str]:
+        self._load()
+        return list(self._roots)
+
+    def _root_for(self, directory: str) -> Optional[_RootIndex]:
+        """
+        Indexed root containing directory, brought up to date below directory
+        (the whole root if it is older than refresh_interval or was invalidated),
+        so results never miss changes made since the last query.
+        None when no root covers it, or when it lies in a subtree the index pruned.
+        """
+        self._load()
+        with self._lock:
+            covering = [r for r in self._roots.values() if _within(directory, r.root)]
+        if not covering:
+            return None
+        root_index = max(covering, key=lambda r: len(r.root))
+        stale = time.monotonic() - root_index.refreshed_at > self.refresh_interval
+        if root_index.refresh(None if stale else directory):
+            self._save(root_index)
+        return root_index if root_index.covers(directory) else None
+
+    def invalidate(self, path: str) -> None:
+        """Mark roots containing path as stale so the next lookup refreshes them"""
+        self._load()
+        with self._lock:
+            for root_index in self._roots.values():
+                if _within(path, root_index.root):
+                    root_index.refreshed_at = 0.0
+
+    def search_name(self, directory: str, pattern: str) -> Optional[List[str]]:
+        """
+        Paths below directory whose name matches a glob pattern.
+        Returns None when directory is not covered by the index (including
+        directories pruned by ignore rules), so callers fall back to a live walk.
+        """
+        if os.sep in pattern or (os.altsep and os.altsep in pattern):
+            return None  # Path-style globs need a live walk
+        directory = str(Path(directory).resolve())
+        root_index = self._root_for(directory)
+        if root_index is None:
+            return None
+        return root_index.match(directory, pattern, root_index.name_candidates(pattern))
+
+    def search_extension(self, directory: str, ext: str) -> Optional[List[str]]:
+        """
+        Paths below directory ending with ext.
+        Returns None when directory is not covered by the index (including
+        directories pruned by ignore rules), so callers fall back to a live walk.
+        """
+        directory = str(Path(directory).resolve())
+        root_index = self._root_for(directory)
+        if root_index is None:
+            return None
+        return root_index.match(directory, f"*{ext}", root_index.extension_candidates(ext))
+
+    def stats(self) -> dict:
+        self._load()
+        return {
+            root: {"directories": len(r.dirs), "files": len(r.files)}
+            for root, r in self._roots.items()
+        }
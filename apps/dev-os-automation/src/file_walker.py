@@ -0,0 +1,137 @@
+"""
+File Walker - Shared os.scandir tree walker
+Requirement 1.5: Walk directory trees for search and other tree operations
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Iterator, List, Optional, Union
+from src.ignore_rules import IgnoreRules, IGNORE_FILE
+
+
+def _list_dir(path: str) -> List[os.DirEntry]:
+    """List one directory; unreadable directories are treated as empty"""
+    try:
+        with os.scandir(path) as entries:
+            return list(entries)
+    except OSError:
+        return []
+
+
+def distinct_roots(roots: Iterable[str]) -> List[str]:
+    """
+    Absolute roots in order, dropping duplicates and roots nested inside another
+    root. Roots are compared by their resolved path, so a symlink to a directory
+    that is already covered is dropped too.
+    """
+    roots = [os.path.abspath(os.fspath(root)) for root in roots]
+    resolved = [os.path.realpath(root) for root in roots]
+    distinct = []
+    for i, (root, path) in enumerate(zip(roots, resolved)):
+        if path in resolved[:i]:
+            continue
+        if any(other != path and path.startswith(other.rstrip(os.sep) + os.sep) for other in resolved):
+            continue
+        distinct.append(root)
+    return distinct
+
+
+class FileWalker:
+    """
+    Depth-first directory walker built on os.scandir.
+    Yields os.DirEntry objects so callers reuse the type information from
+    the directory listing and the entry's cached stat. Listings of upcoming
+    directories are prefetched on a thread pool, while output order stays
+    the same as a sequential walk.
+    
+    Ignore rules (default excludes such as node_modules and .git, .gitignore
+    files and ignore_patterns) are applied while walking, so pruned subtrees
+    are never listed.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, prefetch: int = 64,
+                 ignore_patterns: Optional[List[str]] = None,
+                 use_default_excludes: bool = True, use_gitignore: bool = True,
+                 max_depth: Optional[int] = None):
+        self.max_workers = max_workers or min(32, (os.cpu_count() or 1) * 4)
+        self.prefetch = max(1, prefetch)
+        self.ignore_patterns = list(ignore_patterns or [])
+        self.use_default_excludes = use_default_excludes
+        self.use_gitignore = use_gitignore
+        self.max_depth = max_depth
+
+    def rules_for(self, root: str, max_depth: Optional[int] = None) -> IgnoreRules:
+        """Compiled (and cached) ignore rules for a root"""
+        return IgnoreRules.for_root(
+            root, self.ignore_patterns, self.use_default_excludes, self.use_gitignore,
+            max_depth if max_depth is not None else self.max_depth)
+
+    def walk(self, roots: Union[str, Iterable[str]], include_dirs: bool = False,
+             prune: bool = True, max_depth: Optional[int] = None) -> Iterator[os.DirEntry]:
+        """
+        Yield file entries below one or more roots (directories too if include_dirs).
+        Roots are walked one after another; a root inside another one is walked
+        only once, as part of the outer root. Symlinked directories are not followed.
+        prune=False disables the ignore rules; max_depth overrides the walker default.
+        """
+        if isinstance(roots, (str, os.PathLike)):
+            roots = [roots]
+        roots = distinct_roots(roots)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers,
+                                thread_name_prefix="file-walker") as executor:
+            # Each stack item is [path, future or None, rules, depth]; the top is walked next
+            stack = [[root, None, self.rules_for(root, max_depth) if prune else None, 0]
+                     for root in reversed(roots)]
+            try:
+                while stack:
+                    self._fill_prefetch(stack, executor)
+                    path, future, rules, depth = stack.pop()
+                    entries = future.result() if future else _list_dir(path)
+                    if rules is not None:
+                        rules = rules.for_directory(
+                            path, any(entry.name == IGNORE_FILE for entry in entries))
+                    descend = rules is None or rules.depth_allowed(depth + 1)
+                    if max_depth is not None and rules is None:
+                        descend = depth + 1 <= max_depth
+
+                    subdirs = []
+                    for entry in entries:
+                        try:
+                            is_dir = entry.is_dir(follow_symlinks=False)
+                            if rules is not None and rules.is_ignored(entry.path, is_dir):
+                                continue
+                            if is_dir:
+                                subdirs.append(entry)
+                            elif entry.is_file():
+                                yield entry
+                        except OSError:
+                            continue
+                    if include_dirs:
+                        yield from subdirs
+                    if descend:
+                        stack.extend([entry.path, None, rules, depth + 1]
+                                     for entry in reversed(subdirs))
+            finally:
+                for item in stack:
+                    if item[1]:
+                        item[1].cancel()
+
+    def _fill_prefetch(self, stack: list, executor: ThreadPoolExecutor) -> None:
+        """Submit listings for the directories that will be walked next"""
+        in_flight = 0
+        for item in reversed(stack):
+            if in_flight >= self.prefetch:
+                break
+            if item[1] is None:
+                item[1] = executor.submit(_list_dir, item[0])
+            in_flight += 1
+
+    @staticmethod
+    def mount_points() -> List[str]:
+        """Mounted drives/volumes, for searching every disk at once"""
+        try:
+            import psutil
+            return [part.mountpoint for part in psutil.disk_partitions(all=False)]
+        except Exception:
+            return [os.path.abspath(os.sep)]
@@ -0,0 +1,446 @@
+"""
+File System Watcher - Debounced change feed for watched directories
+Requirement 1.5: Keep file views and indexes current without re-walking
+"""
+
+import ctypes
+import ctypes.util
+import errno
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+from src.file_walker import FileWalker
+from src.ignore_rules import IgnoreRules
+
+# inotify(7) constants
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_DONT_FOLLOW = 0x02000000
+IN_EXCL_UNLINK = 0x04000000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = os.O_NONBLOCK if hasattr(os, "O_NONBLOCK") else 0o4000
+IN_CLOEXEC = 0o2000000
+WATCH_MASK = (IN_MODIFY | IN_ATTRIB | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+              | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR | IN_DONT_FOLLOW | IN_EXCL_UNLINK)
+EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, name length
+
+DEFAULT_DEBOUNCE = 0.2  # Quiet period that ends a burst
+DEFAULT_MAX_DELAY = 1.0  # Longest a change is held back during a continuous burst
+DEFAULT_POLL_INTERVAL = 2.0
+
+# (previous kind, new kind) -> coalesced kind; None means the changes cancel out
+_MERGE = {
+    ("created", "modified"): "created",
+    ("created", "deleted"): None,
+    ("deleted", "created"): "modified",
+    ("modified", "created"): "modified",
+}
+
+
+class FileChange(NamedTuple):
+    """One coalesced change: kind is created, modified, deleted or rescan"""
+    kind: str
+    path: str
+    is_dir: bool
+
+
+class _InotifyBackend:
+    """Recursive watches via inotify; one watch per directory, pruned by ignore rules"""
+
+    name = "inotify"
+
+    def __init__(self, emit: Callable[[str, str, bool], None], walker: FileWalker):
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self._rm_watch = libc.inotify_rm_watch
+        self._rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+        self.fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.emit = emit
+        self.walker = walker
+        self._lock = threading.Lock()
+        self._paths: Dict[int, str] = {}  # watch descriptor -> directory
+        self._wds: Dict[str, int] = {}
+        self._roots: Dict[str, IgnoreRules] = {}
+        self._wake_r, self._wake_w = os.pipe()
+        self._thread = threading.Thread(target=self._read_loop, name="fs-watcher-inotify",
+                                        daemon=True)
+        self._thread.start()
+
+    @property
+    def watches(self) -> int:
+        return len(self._wds)
+
+    def add_root(self, root: str) -> None:
+        rules = self.walker.rules_for(root)
+        with self._lock:
+            self._roots[root] = rules
+        try:
+            self._watch_tree(root)
+        except OSError:
+            self.remove_root(root)
+            raise
+
+    def remove_root(self, root: str) -> None:
+        with self._lock:
+            self._roots.pop(root, None)
+            # Directories also below another watched root keep their watch
+            remaining = [other.rstrip(os.sep) + os.sep for other in self._roots]
+            prefix = root.rstrip(os.sep) + os.sep
+            stale = [path for path in self._wds
+                     if (path == root or path.startswith(prefix))
+                     and not any((path + os.sep).startswith(other) for other in remaining)]
+        self._remove_watches(stale)
+
+    def _watch_tree(self, directory: str, report: bool = False) -> None:
+        """Watch directory and everything below it; report=True emits what is already there"""
+        self._watch(directory)
+        for entry in self.walker.walk(directory, include_dirs=True):
+            is_dir = entry.is_dir(follow_symlinks=False)
+            if is_dir:
+                self._watch(entry.path)
+            if report:
+                # Created before its directory's watch existed
+                self.emit("created", entry.path, is_dir)
+
+    def _watch(self, directory: str) -> None:
+        wd = self._add_watch(self.fd, os.fsencode(directory), WATCH_MASK)
+        if wd < 0:
+            err = ctypes.get_errno()
+            if err in (errno.ENOENT, errno.ENOTDIR, errno.EACCES):
+                return  # Gone already, or unreadable
+            raise OSError(err, f"inotify_add_watch failed: {os.strerror(err)}", directory)
+        with self._lock:
+            self._paths[wd] = directory
+            self._wds[directory] = wd
+
+    def _unwatch(self, directory: str) -> None:
+        """Drop the watches on directory and every directory below it"""
+        prefix = directory.rstrip(os.sep) + os.sep
+        with self._lock:
+            stale = [path for path in self._wds if path == directory or path.startswith(prefix)]
+        self._remove_watches(stale)
+
+    def _remove_watches(self, directories: List[str]) -> None:
+        with self._lock:
+            wds = [self._wds.pop(path) for path in directories if path in self._wds]
+            for wd in wds:
+                self._paths.pop(wd, None)
+        for wd in wds:
+            self._rm_watch(self.fd, wd)
+
+    def _rules_for(self, path: str) -> Optional[IgnoreRules]:
+        with self._lock:
+            roots = [root for root in self._roots
+                     if path == root or path.startswith(root.rstrip(os.sep) + os.sep)]
+            return self._roots[max(roots, key=len)] if roots else None
+
+    def _read_loop(self) -> None:
+        while True:
+            ready, _, _ = select.select([self.fd, self._wake_r], [], [])
+            if self._wake_r in ready:
+                return
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                continue
+            except OSError:
+                return
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, length = EVENT_HEADER.unpack_from(data, offset)
+                offset += EVENT_HEADER.size
+                name = os.fsdecode(data[offset:offset + length].rstrip(b"\0"))
+                offset += length
+                self._handle(wd, mask, name)
+
+    def _handle(self, wd: int, mask: int, name: str) -> None:
+        if mask & IN_Q_OVERFLOW:
+            # The kernel dropped events; subscribers have to re-read their roots
+            with self._lock:
+                roots = list(self._roots)
+            for root in roots:
+                self.emit("rescan", root, True)
+            return
+        with self._lock:
+            directory = self._paths.get(wd)
+        if directory is None:
+            return
+        if mask & IN_IGNORED:
+            with self._lock:
+                self._paths.pop(wd, None)
+                if self._wds.get(directory) == wd:
+                    del self._wds[directory]
+            return
+        if not name:
+            return  # Events on the directory itself are reported by its parent
+
+        path = os.path.join(directory, name)
+        is_dir = bool(mask & IN_ISDIR)
+        rules = self._rules_for(path)
+        if rules is not None and rules.is_ignored(path, is_dir):
+            return
+        if mask & (IN_CREATE | IN_MOVED_TO):
+            self.emit("created", path, is_dir)
+            if is_dir:
+                try:
+                    self._watch_tree(path, report=True)
+                except OSError:
+                    self.emit("rescan", path, True)  # Out of watches: the subtree is unwatched
+        elif mask & (IN_DELETE | IN_MOVED_FROM):
+            self.emit("deleted", path, is_dir)
+            if is_dir:
+                self._unwatch(path)
+        elif mask & (IN_MODIFY | IN_ATTRIB):
+            self.emit("modified", path, is_dir)
+
+    def close(self) -> None:
+        os.write(self._wake_w, b"\0")
+        self._thread.join(timeout=5)
+        for fd in (self.fd, self._wake_r, self._wake_w):
+            os.close(fd)
+
+
+class _PollingBackend:
+    """Fallback that re-walks watched roots every interval and diffs (mtime, size)"""
+
+    name = "polling"
+
+    def __init__(self, emit: Callable[[str, str, bool], None], walker: FileWalker,
+                 interval: float = DEFAULT_POLL_INTERVAL):
+        self.emit = emit
+        self.walker = walker
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._snapshots: Dict[str, Dict[str, Tuple[bool, int, int]]] = {}
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._poll_loop, name="fs-watcher-poll",
+                                        daemon=True)
+        self._thread.start()
+
+    @property
+    def watches(self) -> int:
+        return len(self._snapshots)
+
+    def _snapshot(self, root: str) -> Dict[str, Tuple[bool, int, int]]:
+        snapshot = {}
+        for entry in self.walker.walk(root, include_dirs=True):
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+                stat = entry.stat(follow_symlinks=False)
+            except OSError:
+                continue
+            snapshot[entry.path] = (is_dir, stat.st_mtime_ns, 0 if is_dir else stat.st_size)
+        return snapshot
+
+    def add_root(self, root: str) -> None:
+        snapshot = self._snapshot(root)
+        with self._lock:
+            self._snapshots[root] = snapshot
+
+    def remove_root(self, root: str) -> None:
+        with self._lock:
+            self._snapshots.pop(root, None)
+
+    def _poll_loop(self) -> None:
+        while not self._stop.wait(self.interval):
+            with self._lock:
+                roots = list(self._snapshots)
+            for root in roots:
+                new = self._snapshot(root)
+                with self._lock:
+                    if root not in self._snapshots:
+                        continue  # Unwatched meanwhile
+                    old, self._snapshots[root] = self._snapshots[root], new
+                for path, (is_dir, mtime_ns, size) in new.items():
+                    before = old.get(path)
+                    if before is None:
+                        self.emit("created", path, is_dir)
+                    elif not is_dir and before[1:] != (mtime_ns, size):
+                        self.emit("modified", path, is_dir)
+                for path, (is_dir, _, _) in old.items():
+                    if path not in new:
+                        self.emit("deleted", path, is_dir)
+
+    def close(self) -> None:
+        self._stop.set()
+        self._thread.join(timeout=5)
+
+
+class FileWatcher:
+    """
+    Watches directory trees and publishes coalesced change batches.
+    Uses inotify on Linux and falls back to polling elsewhere, or when the
+    kernel runs out of watches. Raw events are merged per path (create then
+    delete cancels out, repeated writes become one "modified") and delivered
+    once a burst has been quiet for debounce seconds, or after max_delay at
+    the latest. Subscribers are called on the dispatcher thread with a list
+    of FileChange and should return quickly.
+    """
+
+    def __init__(self, walker: Optional[FileWalker] = None, debounce: float = DEFAULT_DEBOUNCE,
+                 max_delay: float = DEFAULT_MAX_DELAY, poll_interval: float = DEFAULT_POLL_INTERVAL,
+                 use_inotify: bool = True):
+        self.walker = walker or FileWalker()
+        self.debounce = debounce
+        self.max_delay = max(max_delay, debounce)
+        self.poll_interval = poll_interval
+        self.use_inotify = use_inotify and sys.platform.startswith("linux")
+        self._lock = threading.Lock()
+        self._cond = threading.Condition()
+        self._pending: Dict[str, Tuple[str, bool]] = {}
+        self._first_at: Optional[float] = None
+        self._last_at = 0.0
+        self._subscribers: List[Callable[[List[FileChange]], None]] = []
+        self._roots: Dict[str, object] = {}  # root -> backend watching it
+        self._inotify: Optional[_InotifyBackend] = None
+        self._polling: Optional[_PollingBackend] = None
+        self._dispatcher: Optional[threading.Thread] = None
+        self._stopped = False
+        self.events = 0
+        self.batches = 0
+
+    def subscribe(self, callback: Callable[[List[FileChange]], None]) -> Callable[[], None]:
+        """Register callback for change batches; returns a function that unsubscribes it"""
+        with self._lock:
+            self._subscribers.append(callback)
+
+        def unsubscribe() -> None:
+            with self._lock:
+                if callback in self._subscribers:
+                    self._subscribers.remove(callback)
+        return unsubscribe
+
+    def watch(self, directory: str) -> str:
+        """Start watching a directory tree; returns the backend used"""
+        root = os.path.realpath(directory)
+        if not os.path.isdir(root):
+            raise FileNotFoundError(f"Directory not found: {directory}")
+        with self._lock:
+            if root in self._roots:
+                return self._roots[root].name
+            self._start_dispatcher()
+        backend = None
+        if self.use_inotify:
+            try:
+                backend = self._inotify_backend()
+                backend.add_root(root)
+            except (OSError, AttributeError):
+                backend = None  # No inotify, or out of watches
+        if backend is None:
+            backend = self._polling_backend()
+            backend.add_root(root)
+        with self._lock:
+            self._roots[root] = backend
+        return backend.name
+
+    def unwatch(self, directory: str) -> bool:
+        root = os.path.realpath(directory)
+        with self._lock:
+            backend = self._roots.pop(root, None)
+        if backend is None:
+            return False
+        backend.remove_root(root)
+        return True
+
+    def roots(self) -> Dict[str, str]:
+        """Watched roots and the backend watching each"""
+        with self._lock:
+            return {root: backend.name for root, backend in self._roots.items()}
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "roots": len(self._roots),
+                "inotify_watches": self._inotify.watches if self._inotify else 0,
+                "polled_roots": self._polling.watches if self._polling else 0,
+                "events": self.events,
+                "batches": self.batches,
+                "subscribers": len(self._subscribers),
+            }
+
+    def _inotify_backend(self) -> _InotifyBackend:
+        with self._lock:
+            if self._inotify is None:
+                self._inotify = _InotifyBackend(self._emit, self.walker)
+            return self._inotify
+
+    def _polling_backend(self) -> _PollingBackend:
+        with self._lock:
+            if self._polling is None:
+                self._polling = _PollingBackend(self._emit, self.walker, self.poll_interval)
+            return self._polling
+
+    def _emit(self, kind: str, path: str, is_dir: bool) -> None:
+        """Queue a raw event, merging it with any pending change to the same path"""
+        now = time.monotonic()
+        with self._cond:
+            self.events += 1
+            previous = self._pending.get(path)
+            if previous is not None and kind != "rescan":
+                kind = _MERGE.get((previous[0], kind), kind)
+            if kind is None:
+                del self._pending[path]
+            else:
+                self._pending[path] = (kind, is_dir)
+            if self._first_at is None:
+                self._first_at = now
+            self._last_at = now
+            self._cond.notify()
+
+    def _start_dispatcher(self) -> None:
+        if self._dispatcher is None:
+            self._dispatcher = threading.Thread(target=self._dispatch_loop,
+                                                name="fs-watcher-dispatch", daemon=True)
+            self._dispatcher.start()
+
+    def _dispatch_loop(self) -> None:
+        while True:
+            with self._cond:
+                while self._first_at is None and not self._stopped:
+                    self._cond.wait()
+                if self._stopped:
+                    return
+                while True:
+                    now = time.monotonic()
+                    wait = min(self._last_at + self.debounce, self._first_at + self.max_delay) - now
+                    if wait <= 0 or self._stopped:
+                        break
+                    self._cond.wait(wait)
+                batch = [FileChange(kind, path, is_dir)
+                         for path, (kind, is_dir) in self._pending.items()]
+                self._pending.clear()
+                self._first_at = None
+            if not batch:
+                continue  # Everything cancelled out
+            self.batches += 1
+            with self._lock:
+                subscribers = list(self._subscribers)
+            for callback in subscribers:
+                try:
+                    callback(batch)
+                except Exception as e:
+                    print(f"⚠️  File watcher subscriber failed: {e}")
+
+    def stop(self) -> None:
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+        for backend in (self._inotify, self._polling):
+            if backend is not None:
+                backend.close()
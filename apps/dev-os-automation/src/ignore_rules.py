@@ -0,0 +1,208 @@
+"""
+Ignore Rules - gitignore-style pruning for directory walks
+Requirement 1.5: Keep searches out of dependency, VCS and cache directories
+"""
+
+import os
+import re
+import threading
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+# Directories nobody wants search results from
+DEFAULT_EXCLUDES = [
+    ".git/",
+    ".hg/",
+    ".svn/",
+    "node_modules/",
+    "__pycache__/",
+    ".venv/",
+    "venv/",
+    ".tox/",
+    ".nox/",
+    ".mypy_cache/",
+    ".pytest_cache/",
+    ".ruff_cache/",
+    ".next/",
+    ".cache/",
+]
+
+IGNORE_FILE = ".gitignore"
+
+
+class IgnoreRule(NamedTuple):
+    """One compiled pattern; base is the directory the pattern is relative to"""
+    base: str
+    regex: "re.Pattern"
+    negate: bool
+    dir_only: bool
+    anchored: bool  # Matches the path relative to base rather than the bare name
+
+
+def _translate(pattern: str) -> str:
+    """Translate a gitignore glob (without leading "/" or trailing "/") to a regex"""
+    out = []
+    i = 0
+    n = len(pattern)
+    while i < n:
+        ch = pattern[i]
+        if pattern.startswith("**/", i):
+            out.append("(?:.*/)?")
+            i += 3
+        elif pattern.startswith("/**", i) and i + 3 == n:
+            out.append("/.*")
+            i += 3
+        elif pattern.startswith("**", i):
+            out.append(".*")
+            i += 2
+        elif ch == "*":
+            out.append("[^/]*")
+            i += 1
+        elif ch == "?":
+            out.append("[^/]")
+            i += 1
+        elif ch == "[":
+            close = pattern.find("]", i + 2 if pattern[i + 1:i + 2] in ("!", "^") else i + 1)
+            if close == -1:
+                out.append(re.escape(ch))
+                i += 1
+            else:
+                body = pattern[i + 1:close]
+                if body[:1] in ("!", "^"):
+                    body = "^" + body[1:]
+                out.append("[" + body.replace("\\", "\\\\") + "]")
+                i = close + 1
+        elif ch == "\\" and i + 1 < n:
+            out.append(re.escape(pattern[i + 1]))
+            i += 2
+        else:
+            out.append(re.escape(ch))
+            i += 1
+    return "".join(out) + r"\Z"
+
+
+def compile_pattern(line: str, base: str) -> Optional[IgnoreRule]:
+    """Compile one gitignore line; comments and blanks return None"""
+    line = line.rstrip("\n").rstrip()
+    if not line or line.startswith("#"):
+        return None
+    negate = line.startswith("!")
+    if negate:
+        line = line[1:]
+    elif line.startswith("\\"):
+        line = line[1:]  # "\#" and "\!" escape a leading special character
+    dir_only = line.endswith("/")
+    line = line.rstrip("/")
+    if not line:
+        return None
+    anchored = "/" in line
+    line = line.lstrip("/")
+    return IgnoreRule(base, re.compile(_translate(line)), negate, dir_only, anchored)
+
+
+def compile_patterns(lines: Iterable[str], base: str) -> List[IgnoreRule]:
+    return [rule for rule in (compile_pattern(line, base) for line in lines) if rule]
+
+
+_file_cache: Dict[str, Tuple[int, List[IgnoreRule]]] = {}
+_file_cache_lock = threading.Lock()
+# Shared result for directories without a .gitignore, so cache identity checks hit
+_NO_RULES: Tuple[IgnoreRule, ...] = ()
+
+
+def _load_ignore_file(directory: str) -> Sequence[IgnoreRule]:
+    """
+    Compiled rules from directory/.gitignore, cached until the file's mtime changes.
+    Returns the same object until then (_NO_RULES when there is no file).
+    """
+    path = os.path.join(directory, IGNORE_FILE)
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:
+        return _NO_RULES
+    with _file_cache_lock:
+        cached = _file_cache.get(path)
+    if cached and cached[0] == mtime_ns:
+        return cached[1]
+    try:
+        with open(path, encoding="utf-8", errors="replace") as f:
+            rules = compile_patterns(f, directory)
+    except OSError:
+        rules = []
+    with _file_cache_lock:
+        _file_cache[path] = (mtime_ns, rules)
+    return rules
+
+
+class IgnoreRules:
+    """
+    Ordered ignore rules for one root; like git, the last matching rule wins.
+    Nested .gitignore files are picked up per directory via for_directory().
+    """
+
+    _cache: Dict[tuple, Tuple[Sequence[IgnoreRule], "IgnoreRules"]] = {}
+    _cache_lock = threading.Lock()
+
+    def __init__(self, root: str, rules: List[IgnoreRule],
+                 overrides: Optional[List[IgnoreRule]] = None,
+                 max_depth: Optional[int] = None, use_gitignore: bool = True):
+        self.root = root
+        self.rules = rules + (overrides or [])
+        self.overrides = overrides or []
+        self.max_depth = max_depth
+        self.use_gitignore = use_gitignore
+        # Most defaults only apply to directories, so files skip them
+        self._file_rules = [rule for rule in self.rules if not rule.dir_only]
+
+    @classmethod
+    def for_root(cls, root: str, patterns: Optional[Iterable[str]] = None,
+                 use_defaults: bool = True, use_gitignore: bool = True,
+                 max_depth: Optional[int] = None) -> "IgnoreRules":
+        """Rules for a root, compiled once and cached until its .gitignore changes"""
+        root = os.path.abspath(root)
+        patterns = tuple(patterns or ())
+        key = (root, patterns, use_defaults, use_gitignore, max_depth)
+        gitignore = _load_ignore_file(root) if use_gitignore else _NO_RULES
+        with cls._cache_lock:
+            cached = cls._cache.get(key)
+        if cached is not None and cached[0] is gitignore:
+            return cached[1]
+
+        rules = compile_patterns(DEFAULT_EXCLUDES, root) if use_defaults else []
+        rules_obj = cls(root, rules + list(gitignore), compile_patterns(patterns, root),
+                        max_depth, use_gitignore)
+        with cls._cache_lock:
+            cls._cache[key] = (gitignore, rules_obj)
+        return rules_obj
+
+    def for_directory(self, directory: str, has_ignore_file: bool) -> "IgnoreRules":
+        """Rules in effect inside directory, adding its own .gitignore if present"""
+        if not (has_ignore_file and self.use_gitignore) or directory == self.root:
+            return self
+        nested = _load_ignore_file(directory)
+        if not nested:
+            return self
+        # Explicit patterns stay last so they keep precedence over any .gitignore
+        base_rules = self.rules[:len(self.rules) - len(self.overrides)]
+        return IgnoreRules(self.root, base_rules + list(nested), self.overrides,
+                           self.max_depth, self.use_gitignore)
+
+    def is_ignored(self, path: str, is_dir: bool) -> bool:
+        """True if path (absolute, below root) should be skipped"""
+        ignored = False
+        name = os.path.basename(path)
+        for rule in (self.rules if is_dir else self._file_rules):
+            if rule.anchored:
+                if not path.startswith(rule.base + os.sep):
+                    continue
+                target = path[len(rule.base) + 1:]
+                if os.sep != "/":
+                    target = target.replace(os.sep, "/")
+            else:
+                target = name
+            if rule.regex.match(target):
+                ignored = not rule.negate
+        return ignored
+
+    def depth_allowed(self, depth: int) -> bool:
+        """Whether a directory depth levels below the root may be entered"""
+        return self.max_depth is None or depth <= self.max_depth
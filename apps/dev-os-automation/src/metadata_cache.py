@@ -0,0 +1,65 @@
+"""
+Metadata Cache - LRU cache of serialized file metadata
+Requirement 1.5: Return search results without rebuilding per-file metadata
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Tuple
+
+
+class FileMetadataCache:
+    """
+    Bounded LRU of file dicts keyed by absolute path. An entry is valid while
+    the file's (mtime_ns, size, ctime_ns) match, which the caller checks with
+    a stat it already has, so a hit skips only the serialization work and
+    never serves stale data.
+    """
+
+    def __init__(self, max_entries: int = 50_000):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[tuple, dict]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_build(self, path: str, stat: os.stat_result,
+                     build: Callable[[], dict]) -> dict:
+        """Cached dict for path if stat still matches, else build() and store it"""
+        version = (stat.st_mtime_ns, stat.st_size, stat.st_ctime_ns)
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry[0] == version:
+                self._entries.move_to_end(path)
+                self.hits += 1
+                return dict(entry[1])
+            self.misses += 1
+
+        data = build()
+        with self._lock:
+            self._entries[path] = (version, data)
+            self._entries.move_to_end(path)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return dict(data)
+
+    def invalidate(self, path: str) -> None:
+        with self._lock:
+            self._entries.pop(path, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+            }
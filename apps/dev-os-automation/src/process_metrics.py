@@ -0,0 +1,177 @@
+"""
+Process Metrics - Sampled per-process CPU and memory with bounded history
+Requirement 2.4: Report resource usage of running applications
+"""
+
+import heapq
+import threading
+import time
+from array import array
+from typing import Dict, List, NamedTuple, Optional, Tuple
+from src.process_snapshot import ProcessSnapshotService
+
+DEFAULT_INTERVAL = 2.0  # Seconds between samples
+DEFAULT_HISTORY = 60  # Samples kept per process
+SORT_KEYS = ("cpu", "memory")
+
+
+class MetricSample(NamedTuple):
+    timestamp: float  # time.time()
+    cpu_percent: float  # Of one core, like psutil; may exceed 100 for multithreaded processes
+    memory_mb: float  # Resident set size
+
+
+class MetricHistory:
+    """
+    Fixed-size ring buffer of samples for one process, stored column-wise
+    in typed arrays (16 bytes per sample) rather than as tuples.
+    """
+
+    __slots__ = ("create_time", "cpu_time", "wall_time", "_times", "_cpu", "_memory",
+                 "_next", "_count")
+
+    def __init__(self, size: int, create_time: Optional[float]):
+        self.create_time = create_time
+        self.cpu_time: Optional[float] = None  # user + system seconds at the last sample
+        self.wall_time = 0.0  # time.monotonic() at the last sample
+        self._times = array("d", bytes(8 * size))
+        self._cpu = array("f", bytes(4 * size))
+        self._memory = array("f", bytes(4 * size))
+        self._next = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, sample: MetricSample) -> None:
+        i = self._next
+        self._times[i], self._cpu[i], self._memory[i] = sample
+        self._next = (i + 1) % len(self._times)
+        self._count = min(self._count + 1, len(self._times))
+
+    def latest(self) -> Optional[MetricSample]:
+        if not self._count:
+            return None
+        i = self._next - 1  # -1 wraps to the last slot
+        return MetricSample(self._times[i], self._cpu[i], self._memory[i])
+
+    def samples(self) -> List[MetricSample]:
+        """Samples oldest first"""
+        size = len(self._times)
+        start = (self._next - self._count) % size
+        return [MetricSample(self._times[i % size], self._cpu[i % size], self._memory[i % size])
+                for i in range(start, start + self._count)]
+
+
+class ProcessMetricsService:
+    """
+    Samples CPU and memory for every process in the current ProcessSnapshot
+    from a background thread. Each process is read once per sample inside
+    psutil's oneshot() so its stat files are parsed a single time, and CPU
+    percent comes from the change in CPU time since the previous sample
+    rather than a blocking measurement interval. The first sample of a
+    process reports its average since it started. Histories are keyed by
+    PID and dropped when the process exits, so memory stays bounded by
+    processes x history.
+    """
+
+    def __init__(self, processes: ProcessSnapshotService, interval: float = DEFAULT_INTERVAL,
+                 history: int = DEFAULT_HISTORY):
+        self.processes = processes
+        self.interval = interval
+        self.history = history
+        self._histories: Dict[int, MetricHistory] = {}
+        self._handles: Dict[int, object] = {}  # pid -> psutil.Process, reused between samples
+        self._sample_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.samples = 0
+        self.last_duration = 0.0  # Seconds the last sample took
+
+    def latest(self, pid: int) -> Optional[MetricSample]:
+        """Most recent sample for pid, starting the sampler on first use"""
+        self._ensure_started()
+        history = self._histories.get(pid)
+        return history.latest() if history is not None else None
+
+    def history_for(self, pid: int) -> List[MetricSample]:
+        self._ensure_started()
+        history = self._histories.get(pid)
+        return history.samples() if history is not None else []
+
+    def top(self, limit: int = 10, sort_by: str = "cpu") -> List[Tuple[int, MetricSample]]:
+        """The limit processes using the most CPU or memory in their latest sample"""
+        if sort_by not in SORT_KEYS:
+            raise ValueError(f"sort_by must be one of {', '.join(SORT_KEYS)}")
+        self._ensure_started()
+        field = 1 if sort_by == "cpu" else 2
+        latest = ((pid, history.latest()) for pid, history in list(self._histories.items()))
+        return heapq.nlargest(limit, ((pid, sample) for pid, sample in latest if sample is not None),
+                              key=lambda item: item[1][field])
+
+    def _ensure_started(self) -> None:
+        if self._thread is None:
+            if not self._histories:
+                self.refresh()
+            self.start()
+
+    def refresh(self) -> None:
+        """Sample every process now"""
+        import psutil
+
+        with self._sample_lock:
+            started = time.monotonic()
+            snapshot = self.processes.snapshot()
+            histories: Dict[int, MetricHistory] = {}
+            handles: Dict[int, object] = {}
+            for pid, info in snapshot.processes.items():
+                history = self._histories.get(pid)
+                handle = self._handles.get(pid)
+                if history is None or history.create_time != info.create_time:
+                    history = MetricHistory(self.history, info.create_time)  # New or reused PID
+                    handle = None
+                try:
+                    if handle is None:
+                        handle = psutil.Process(pid)
+                    with handle.oneshot():
+                        cpu_times = handle.cpu_times()
+                        rss = handle.memory_info().rss
+                except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                    continue
+                now, wall = time.time(), time.monotonic()
+                cpu_time = cpu_times.user + cpu_times.system
+                if history.cpu_time is not None:
+                    elapsed = wall - history.wall_time
+                    cpu = (cpu_time - history.cpu_time) / elapsed * 100 if elapsed > 0 else 0.0
+                else:
+                    lifetime = now - (info.create_time or now)
+                    cpu = cpu_time / lifetime * 100 if lifetime > 0 else 0.0
+                history.cpu_time, history.wall_time = cpu_time, wall
+                history.append(MetricSample(now, max(cpu, 0.0), rss / (1024 * 1024)))
+                histories[pid] = history
+                handles[pid] = handle
+            # Publish by swapping references; readers never see a half-built table
+            self._histories, self._handles = histories, handles
+            self.samples += 1
+            self.last_duration = time.monotonic() - started
+
+    def start(self) -> None:
+        with self._sample_lock:
+            if self._thread is not None:
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="process-metrics", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        thread, self._thread = self._thread, None
+        if thread is not None:
+            thread.join(timeout=5)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.refresh()
+            except Exception as e:
+                print(f"⚠️  Process metrics sampling failed: {e}")
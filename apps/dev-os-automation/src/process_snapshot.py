@@ -0,0 +1,146 @@
+"""
+Process Snapshot - Background-sampled table of running processes
+Requirement 2.4: List running applications without re-enumerating per call
+"""
+
+import threading
+import time
+from types import MappingProxyType
+from typing import Callable, Dict, List, Mapping, NamedTuple, Optional, Tuple
+
+DEFAULT_INTERVAL = 1.0  # Seconds between samples
+PROCESS_ATTRS = ["name", "ppid", "create_time"]
+
+
+class ProcessInfo(NamedTuple):
+    pid: int
+    name: Optional[str]
+    ppid: Optional[int]
+    create_time: Optional[float]
+
+
+class ProcessSnapshot(NamedTuple):
+    """Immutable view of the process table at one moment; safe to share between threads"""
+    taken_at: float  # time.monotonic()
+    processes: Mapping[int, ProcessInfo]
+    apps: Tuple[dict, ...]  # list_running_apps entries, ordered by pid; treat as read-only
+    sequence: int
+
+
+def _app_entry(info: ProcessInfo) -> dict:
+    return {"pid": info.pid, "name": info.name, "title": info.name}
+
+
+class ProcessSnapshotService:
+    """
+    Keeps a PID-keyed process table current from a background thread.
+    Each sample lists PIDs only (cheap) and looks up details just for
+    processes that started since the previous one; exited PIDs are dropped.
+    The result is published as a new immutable ProcessSnapshot by swapping
+    a single reference, so readers never take a lock and always see one
+    consistent table. A PID that exits and is reused between two samples
+    keeps its old entry until it exits again. Subscribers are told which
+    processes started and exited in each sample.
+    """
+
+    def __init__(self, interval: float = DEFAULT_INTERVAL):
+        self.interval = interval
+        self._snapshot: Optional[ProcessSnapshot] = None
+        self._sample_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._subscribers: List[Callable[[List[ProcessInfo], List[ProcessInfo]], None]] = []
+        self.samples = 0
+
+    def snapshot(self, max_age: Optional[float] = None) -> ProcessSnapshot:
+        """
+        Current snapshot. Starts the sampler on first use; pass max_age
+        (seconds) to re-sample synchronously when the snapshot is older.
+        """
+        snapshot = self._snapshot
+        if snapshot is None or (max_age is not None
+                                and time.monotonic() - snapshot.taken_at > max_age):
+            snapshot = self.refresh()
+        if self._thread is None:
+            self.start()
+        return snapshot
+
+    def subscribe(self, callback: Callable[[List[ProcessInfo], List[ProcessInfo]], None]) -> Callable[[], None]:
+        """
+        Register callback(started, exited), called from the sampling thread
+        after each sample that changed the table. Returns an unsubscribe function.
+        """
+        with self._sample_lock:
+            self._subscribers.append(callback)
+
+        def unsubscribe() -> None:
+            with self._sample_lock:
+                if callback in self._subscribers:
+                    self._subscribers.remove(callback)
+        return unsubscribe
+
+    def refresh(self) -> ProcessSnapshot:
+        """Sample now and publish the result"""
+        with self._sample_lock:
+            previous = self._snapshot
+            snapshot = self._snapshot = self._sample(previous)
+            self.samples += 1
+            subscribers = list(self._subscribers)
+        # The first sample is the baseline, not a burst of starts
+        if previous is not None and snapshot.sequence != previous.sequence and subscribers:
+            started = [info for pid, info in snapshot.processes.items() if pid not in previous.processes]
+            exited = [info for pid, info in previous.processes.items() if pid not in snapshot.processes]
+            for callback in subscribers:
+                try:
+                    callback(started, exited)
+                except Exception as e:
+                    print(f"⚠️  Process subscriber failed: {e}")
+        return snapshot
+
+    def start(self) -> None:
+        with self._sample_lock:
+            if self._thread is not None:
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="process-snapshot", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        thread, self._thread = self._thread, None
+        if thread is not None:
+            thread.join(timeout=5)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.refresh()
+            except Exception as e:
+                print(f"⚠️  Process sampling failed: {e}")
+
+    @staticmethod
+    def _sample(previous: Optional[ProcessSnapshot]) -> ProcessSnapshot:
+        import psutil
+
+        known = previous.processes if previous is not None else {}
+        current = set(psutil.pids())
+        started = current.difference(known)
+        exited = [pid for pid in known if pid not in current]
+        if previous is not None and not started and not exited:
+            return previous._replace(taken_at=time.monotonic())
+
+        processes: Dict[int, ProcessInfo] = {pid: info for pid, info in known.items()
+                                             if pid in current}
+        for pid in started:
+            try:
+                info = psutil.Process(pid).as_dict(PROCESS_ATTRS, ad_value=None)
+            except psutil.NoSuchProcess:
+                continue  # Already gone
+            processes[pid] = ProcessInfo(pid, info["name"], info["ppid"], info["create_time"])
+
+        return ProcessSnapshot(
+            taken_at=time.monotonic(),
+            processes=MappingProxyType(processes),
+            apps=tuple(_app_entry(processes[pid]) for pid in sorted(processes)),
+            sequence=previous.sequence + 1 if previous is not None else 0,
+        )
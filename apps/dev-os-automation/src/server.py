@@ -1,12 +1,19 @@
-from fastapi import FastAPI, HTTPException, WebSocket
+from fastapi import FastAPI, HTTPException, Query, WebSocket
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from typing import Dict, Any, Optional, Set
+from typing import Dict, Any, Iterable, List, Optional, Set, Tuple
 import uvicorn
 import sys
 import os
 import asyncio
 import json
+import math
+import string
+import subprocess
+import time
+import threading
+import uuid
 from datetime import datetime
 
 # Add parent directory to path so 'src' can be imported
@@ -14,17 +21,18 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.main import initialize_os_automation, example_app_operations
 from src.models import Action, ActionSeverity
+from src.async_file_controller import AsyncFileController
+from src.ws_fanout import WebSocketFanout
+from src.event_bus import TOPICS, EventBus
+from src.system_status import DEFAULT_STATUS, TELEMETRY_METRICS, SystemStatusSampler, changed_metrics
 
 # System control libraries
-import psutil
 try:
     from pycaw.pycaw import AudioUtilities, IAudioEndpointVolume
+    import comtypes
     from comtypes import CLSCTX_ALL
     from ctypes import cast, POINTER
     import screen_brightness_control as sbc
-    import subprocess
-    import string
-    import math
 except ImportError:
     print("⚠️  Warning: System control libraries not found. Some features will be mocked.")
 
@@ -45,9 +53,52 @@ file_controller = components['file_controller']
 app_controller = components['app_controller']
 guard_agent = components['guard_agent']
 
+# Blocking file I/O runs on its own bounded pool so the event loop stays responsive
+async_files = AsyncFileController(
+    file_controller,
+    max_workers=int(os.getenv("FILE_IO_WORKERS", "8")),
+    max_pending=int(os.getenv("FILE_IO_MAX_PENDING", "64"))
+)
+
+# Process list is sampled in the background; reads are served from the latest snapshot
+app_controller.processes.interval = float(os.getenv("PROCESS_SAMPLE_INTERVAL", "1.0"))
+app_controller.metrics.interval = float(os.getenv("METRICS_SAMPLE_INTERVAL", "2.0"))
+
+# /system/status is served from a cache refreshed on a fixed cadence
+STATUS_SAMPLE_INTERVAL = float(os.getenv("STATUS_SAMPLE_INTERVAL", "1.0"))
+status_sampler = SystemStatusSampler(
+    interval=STATUS_SAMPLE_INTERVAL,
+    read_volume=lambda: read_volume(),
+    read_brightness=lambda: read_brightness()
+)
+
 # WebSocket connections store
 active_connections: Set[WebSocket] = set()
 
+# Outgoing /ws messages: one bounded queue and writer task per connection
+fanout = WebSocketFanout(
+    max_queue=int(os.getenv("WS_QUEUE_SIZE", "256")),
+    policy=os.getenv("WS_SLOW_CLIENT_POLICY", "drop_oldest")
+)
+
+# Topic routing for broadcasts; connections start subscribed to every topic but "process"
+event_bus = EventBus(fanout)
+
+# Background copy jobs: job_id -> cancel event
+copy_jobs: Dict[str, threading.Event] = {}
+
+# Running background job tasks; the event loop only keeps weak references to tasks
+background_tasks: Set[asyncio.Task] = set()
+
+# Background compress/extract jobs: job_id -> cancel event
+archive_jobs: Dict[str, threading.Event] = {}
+
+# Process topic name filters per WebSocket client (lowercase; absent or empty: all processes)
+process_filters: Dict[WebSocket, Tuple[str, ...]] = {}
+
+# WebSocket clients subscribed to telemetry -> (streaming task, interval)
+telemetry_subscribers: Dict[WebSocket, Tuple[asyncio.Task, float]] = {}
+
 class ExecuteRequest(BaseModel):
     action: str  # e.g., "open_app", "create_file"
     params: Dict[str, Any] = {}
@@ -65,61 +116,28 @@ def health_check():
     return {"status": "online", "service": "Dev OS Automation"}
 
 @app.get("/system/status")
-def get_system_status():
-    """Get real-time system status"""
-    try:
-        cpu = psutil.cpu_percent()
-        mem = psutil.virtual_memory().percent
-        
-        # Real Volume
-        current_volume = 50
+async def get_system_status():
+    """Get real-time system status, served from the background sampler"""
+    status = status_sampler.latest()
+    if status is None:
         try:
-            devices = AudioUtilities.GetSpeakers()
-            interface = devices.Activate(IAudioEndpointVolume._iid_, CLSCTX_ALL, None)
-            volume = cast(interface, POINTER(IAudioEndpointVolume))
-            current_volume = int(volume.GetMasterVolumeLevelScalar() * 100)
-        except: pass
-
-        # Real Brightness
-        current_brightness = 70
-        try:
-            current_brightness = sbc.get_brightness()[0]
-        except: pass
-        
-        return {
-            "volume": current_volume,
-            "brightness": current_brightness,
-            "wifi": {
-                "connected": True,
-                "name": "Dev-Network"
-            },
-            "network": "Connected",
-            "cpu_usage": cpu,
-            "memory_usage": mem,
-            "disk_usage": psutil.disk_usage('C:').percent if os.name == 'nt' else psutil.disk_usage('/').percent
-        }
-    except Exception as e:
-        print(f"❌ Error getting system status: {e}")
-        return {
-            "volume": 50,
-            "brightness": 75,
-            "wifi": {"connected": True, "name": "Unknown"},
-            "network": "Online",
-            "cpu_usage": 0,
-            "memory_usage": 0,
-            "disk_usage": 0
-        }
-    except Exception as e:
-        print(f"❌ Error getting system status: {e}")
-        return {
-            "volume": 50,
-            "brightness": 75,
-            "wifi": {"connected": True, "name": "Unknown"},
-            "network": "Online",
-            "cpu_usage": 0,
-            "memory_usage": 0,
-            "disk_usage": 0
-        }
+            # Cold start: concurrent first requests share one sample
+            status = await asyncio.to_thread(status_sampler.snapshot)
+        except Exception as e:
+            print(f"❌ Error getting system status: {e}")
+            return dict(DEFAULT_STATUS)
+    return status
+
+def read_volume() -> int:
+    """Master volume percent via the Windows audio endpoint"""
+    comtypes.CoInitialize()  # COM is per thread; the sampler runs on its own
+    devices = AudioUtilities.GetSpeakers()
+    interface = devices.Activate(IAudioEndpointVolume._iid_, CLSCTX_ALL, None)
+    volume = cast(interface, POINTER(IAudioEndpointVolume))
+    return int(volume.GetMasterVolumeLevelScalar() * 100)
+
+def read_brightness() -> int:
+    return sbc.get_brightness()[0]
 
 @app.get("/history")
 def get_command_history():
@@ -177,8 +195,10 @@ async def execute_command(req: ExecuteRequest):
             }
             
             target = apps_map.get(app_name.lower(), app_name)
-            # Use Popen for non-blocking launch
-            subprocess.Popen(f'start "" "{target}"', shell=True)
+            # Resolved through the executable index and spawned without a shell
+            result = await asyncio.to_thread(app_controller.launch, target)
+            if not result.success:
+                return ExecuteResponse(success=False, message=result.message)
             
             # Broadcast activity to WebSocket clients
             await broadcast_activity({
@@ -240,7 +260,7 @@ async def execute_command(req: ExecuteRequest):
                     "type": "warning" if mute_status else "success",
                     "title": "Mic Status",
                     "message": f"System microphone(s) {state}"
-                })
+                }, topic="voice")
                 
                 return ExecuteResponse(success=True, message=f"{state.capitalize()} {muted_count} active microphone(s)")
             except Exception as e:
@@ -276,7 +296,7 @@ async def execute_command(req: ExecuteRequest):
                     "type": "success",
                     "title": "Recycle Bin",
                     "message": "Successfully emptied the recycle bin"
-                })
+                }, topic="system")
                 
                 return ExecuteResponse(success=True, message="Recycle bin cleared")
             except Exception as e:
@@ -307,6 +327,165 @@ async def execute_command(req: ExecuteRequest):
             result = app_controller.list_running_apps()
             return ExecuteResponse(success=result.success, message=result.message, data=result.output)
 
+        elif req.action == "top_processes":
+            result = app_controller.top_processes(
+                limit=int(req.params.get("limit", 10)),
+                sort_by=req.params.get("sort_by", "cpu"),
+                history=bool_param(req.params, "history")
+            )
+            return ExecuteResponse(success=result.success, message=result.message, data=result.output)
+
+        elif req.action == "batch_files":
+            operations = req.params.get("operations")
+            if not operations:
+                raise ValueError("operations is required")
+
+            # Security Check - deletes need the (stricter) delete permission
+            has_delete = any(op.get("op") == "delete" for op in operations)
+            action_obj = Action("batch_files", "delete" if has_delete else "write", "file", req.params,
+                                ActionSeverity.HIGH if has_delete else ActionSeverity.MEDIUM)
+            valid, reason = guard_agent.validate(action_obj)
+            if not valid:
+                return ExecuteResponse(success=False, message=f"Permission Denied: {reason}")
+
+            loop = asyncio.get_running_loop()
+            batch_progress = make_progress_broadcaster(loop, "File Batch", "operations")
+            result = await async_files.batch_operations(
+                operations,
+                max_workers=int(req.params.get("max_workers", 8)),
+                atomic=bool_param(req.params, "atomic"),
+                progress_callback=batch_progress)
+
+            await broadcast_activity({
+                "type": "success" if result.success else "warning",
+                "title": "File Batch",
+                "message": result.message
+            }, topic="file")
+            return ExecuteResponse(success=result.success, message=result.message, data=result.output)
+
+        elif req.action == "copy_file":
+            source = req.params.get("source")
+            destination = req.params.get("destination")
+            if not source or not destination:
+                raise ValueError("source and destination are required")
+
+            action_obj = Action("copy_file", "write", "file", req.params, ActionSeverity.MEDIUM)
+            valid, reason = guard_agent.validate(action_obj)
+            if not valid:
+                return ExecuteResponse(success=False, message=f"Permission Denied: {reason}")
+
+            # Runs in the background; progress and completion are pushed over /ws
+            job_id = uuid.uuid4().hex[:12]
+            cancel_event = copy_jobs[job_id] = threading.Event()
+            start_background_task(run_copy_job(job_id, source, destination, cancel_event))
+            return ExecuteResponse(success=True, message=f"Copy started: {source} -> {destination}",
+                                   data={"job_id": job_id})
+
+        elif req.action == "cancel_copy":
+            job_id = req.params.get("job_id")
+            cancel_event = copy_jobs.get(job_id)
+            if cancel_event is None:
+                return ExecuteResponse(success=False, message=f"No running copy job: {job_id}")
+            cancel_event.set()
+            return ExecuteResponse(success=True, message=f"Cancelling copy job {job_id}")
+
+        elif req.action in ("compress", "extract"):
+            source = req.params.get("source") or req.params.get("sources")
+            destination = req.params.get("destination")
+            if not source or not destination:
+                raise ValueError("source and destination are required")
+
+            action_obj = Action(req.action, "write", "file", req.params, ActionSeverity.MEDIUM)
+            valid, reason = guard_agent.validate(action_obj)
+            if not valid:
+                return ExecuteResponse(success=False, message=f"Permission Denied: {reason}")
+
+            # Runs in the background; progress, throughput and completion are pushed over /ws
+            job_id = uuid.uuid4().hex[:12]
+            cancel_event = archive_jobs[job_id] = threading.Event()
+            start_background_task(run_archive_job(job_id, req.action, source, destination,
+                                                  req.params, cancel_event))
+            verb = "Compression" if req.action == "compress" else "Extraction"
+            return ExecuteResponse(success=True, message=f"{verb} started: {source} -> {destination}",
+                                   data={"job_id": job_id})
+
+        elif req.action == "cancel_archive":
+            job_id = req.params.get("job_id")
+            cancel_event = archive_jobs.get(job_id)
+            if cancel_event is None:
+                return ExecuteResponse(success=False, message=f"No running archive job: {job_id}")
+            cancel_event.set()
+            return ExecuteResponse(success=True, message=f"Cancelling archive job {job_id}")
+
+        elif req.action == "find_duplicates":
+            roots = req.params.get("roots") or req.params.get("directory")
+            if not roots:
+                raise ValueError("roots is required")
+
+            action_obj = Action("find_duplicates", "read", "file", req.params, ActionSeverity.LOW)
+            valid, reason = guard_agent.validate(action_obj)
+            if not valid:
+                return ExecuteResponse(success=False, message=f"Permission Denied: {reason}")
+
+            result = await async_files.find_duplicates(roots, int(req.params.get("min_size", 1)),
+                                                       bool_param(req.params, "respect_ignore"))
+            return ExecuteResponse(success=result.success, message=result.message, data=result.output)
+
+        elif req.action == "list_directory":
+            directory = req.params.get("directory")
+            if not directory:
+                raise ValueError("directory is required")
+
+            action_obj = Action("list_directory", "read", "file", req.params, ActionSeverity.LOW)
+            valid, reason = guard_agent.validate(action_obj)
+            if not valid:
+                return ExecuteResponse(success=False, message=f"Permission Denied: {reason}")
+
+            result = await async_files.list_directory(directory)
+            return ExecuteResponse(success=result.success, message=result.message, data=result.output)
+
+        elif req.action == "ws_stats":
+            return ExecuteResponse(success=True, message="WebSocket fan-out statistics",
+                                   data={**fanout.stats(), "bus": event_bus.stats()})
+
+        elif req.action == "launch_stats":
+            result = app_controller.launch_stats()
+            return ExecuteResponse(success=result.success, message=result.message, data=result.output)
+
+        elif req.action == "file_cache_stats":
+            result = file_controller.metadata_cache_stats()
+            return ExecuteResponse(success=result.success, message=result.message, data=result.output)
+
+        elif req.action in ("watch_directory", "unwatch_directory"):
+            directory = req.params.get("directory")
+            if not directory:
+                raise ValueError("directory is required")
+
+            action_obj = Action(req.action, "read", "file", req.params, ActionSeverity.LOW)
+            valid, reason = guard_agent.validate(action_obj)
+            if not valid:
+                return ExecuteResponse(success=False, message=f"Permission Denied: {reason}")
+
+            # Changes under watched directories are pushed over /ws as "fs_change" activity
+            if req.action == "watch_directory":
+                result = await async_files.watch_directory(directory)
+            else:
+                result = file_controller.unwatch_directory(directory)
+            return ExecuteResponse(success=result.success, message=result.message, data=result.output)
+
+        elif req.action == "index_directory":
+            directory = req.params.get("directory")
+            if not directory:
+                raise ValueError("directory is required")
+
+            action_obj = Action("index_directory", "read", "file", req.params, ActionSeverity.LOW)
+            valid, reason = guard_agent.validate(action_obj)
+            if not valid:
+                return ExecuteResponse(success=False, message=f"Permission Denied: {reason}")
+
+            result = await async_files.index_directory(directory)
+            return ExecuteResponse(success=result.success, message=result.message, data=result.output)
+
         else:
             return ExecuteResponse(success=False, message=f"Unknown action: {req.action}")
 
@@ -314,6 +493,75 @@ async def execute_command(req: ExecuteRequest):
         print(f"❌ Error: {e}")
         return ExecuteResponse(success=False, message=str(e))
 
+@app.get("/files/search")
+async def stream_file_search(directory: str, pattern: List[str] = Query(["*"]),
+                             search_type: str = "name", regex: bool = False,
+                             limit: Optional[int] = None, offset: int = 0,
+                             cursor: Optional[str] = None):
+    """
+    Stream search results as NDJSON, one match per line as it is found.
+    The last line is a "done" record carrying next_cursor when more results remain.
+    Content searches take pattern several times to match any of them.
+    """
+    action_obj = Action("search_files", "read", "file", {"directory": directory}, ActionSeverity.LOW)
+    valid, reason = guard_agent.validate(action_obj)
+    if not valid:
+        raise HTTPException(status_code=403, detail=f"Permission Denied: {reason}")
+    if not os.path.isdir(directory):
+        raise HTTPException(status_code=404, detail=f"Directory not found: {directory}")
+    pattern = pattern[0] if len(pattern) == 1 else pattern
+    if cursor:
+        try:
+            offset = file_controller.decode_search_cursor(cursor, directory, pattern, search_type,
+                                                          regex)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+    async def generate():
+        count = 0
+        next_cursor = None
+        results = async_files.iter_search(directory, pattern, search_type, offset, regex)
+        try:
+            async for item in results:
+                if limit is not None and count >= limit:
+                    next_cursor = file_controller.encode_search_cursor(
+                        directory, pattern, search_type, offset + limit, regex)
+                    break
+                count += 1
+                yield json.dumps({"type": "result", "file": item}) + "\n"
+            yield json.dumps({"type": "done", "count": count, "next_cursor": next_cursor}) + "\n"
+        except Exception as e:
+            yield json.dumps({"type": "error", "message": str(e)}) + "\n"
+        finally:
+            await results.aclose()  # Stops the walk if the client went away
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+@app.get("/files/disk-usage")
+async def stream_disk_usage(directory: str, top_n: int = 20, full: bool = False):
+    """
+    Stream a du-style scan as NDJSON: "progress" lines while walking,
+    then a "result" line with the largest directories and files.
+    """
+    action_obj = Action("disk_usage", "read", "file", {"directory": directory}, ActionSeverity.LOW)
+    valid, reason = guard_agent.validate(action_obj)
+    if not valid:
+        raise HTTPException(status_code=403, detail=f"Permission Denied: {reason}")
+    if not os.path.isdir(directory):
+        raise HTTPException(status_code=404, detail=f"Directory not found: {directory}")
+
+    async def generate():
+        events = async_files.iter_disk_usage(directory, top_n, full)
+        try:
+            async for event in events:
+                yield json.dumps(event) + "\n"
+        except Exception as e:
+            yield json.dumps({"type": "error", "message": str(e)}) + "\n"
+        finally:
+            await events.aclose()
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
 @app.post("/command")
 async def handle_command(req: CommandRequest):
     """Handle voice/text commands"""
@@ -358,18 +606,103 @@ def execute_system_command(req: CommandRequest):
     except Exception as e:
         return {"success": False, "message": str(e)}
 
+@app.on_event("startup")
+async def start_file_watcher():
+    """Push watcher change batches to /ws clients"""
+    file_controller.watcher.subscribe(make_change_broadcaster(asyncio.get_running_loop()))
+
+@app.on_event("startup")
+async def start_process_events():
+    """Push process starts and exits to /ws clients subscribed to the "process" topic"""
+    app_controller.processes.subscribe(make_process_event_broadcaster(
+        asyncio.get_running_loop(), min_interval=float(os.getenv("PROCESS_EVENT_INTERVAL", "1.0"))))
+
+@app.on_event("shutdown")
+def stop_background_services():
+    file_controller.watcher.stop()
+    app_controller.metrics.stop()
+    app_controller.processes.stop()
+    app_controller.spawner.stop()
+    status_sampler.stop()
+
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
     await websocket.accept()
     active_connections.add(websocket)
+    fanout.register(websocket)  # All sends go through its queue, in order
+    event_bus.connect(websocket)
     
     try:
         while True:
             data = await websocket.receive_text()
-            message = json.loads(data)
+            try:
+                message = json.loads(data)
+            except ValueError:
+                message = None
+            if not isinstance(message, dict):
+                fanout.send(websocket, {"type": "error", "message": "Messages must be JSON objects"})
+                continue
+
+            # {"type": "subscribe", "topics": [...], "batch_ms": 50, "process_names": [...]}
+            # sets which broadcasts arrive
+            if message.get("type") in ("subscribe", "unsubscribe"):
+                try:
+                    if message["type"] == "subscribe":
+                        # Checked before subscribe(), which validates the rest before changing anything
+                        names = message.get("process_names", [])
+                        if not isinstance(names, list) or not all(isinstance(n, str) for n in names):
+                            raise ValueError("process_names must be a list of names")
+                        topics = event_bus.subscribe(websocket, message.get("topics", TOPICS),
+                                                     batch_ms=message.get("batch_ms"))
+                        process_filters[websocket] = tuple(name.lower() for name in names)
+                    else:
+                        topics = event_bus.unsubscribe(websocket, message.get("topics"))
+                except (ValueError, TypeError) as e:
+                    fanout.send(websocket, {"type": "error", "message": str(e)})
+                    continue
+                if "process" in topics:
+                    await asyncio.to_thread(app_controller.processes.snapshot)  # Starts the sampler
+                fanout.send(websocket, {
+                    "type": "ack",
+                    "message": f"Subscribed to {', '.join(topics) or 'no topics'}",
+                    "topics": topics
+                })
+                continue
+            # {"type": "subscribe_telemetry", "interval": 0.5, "metrics": [...], "threshold": 1.0}
+            elif message.get("type") == "subscribe_telemetry":
+                try:
+                    interval = float(message.get("interval", 1.0))
+                    threshold = float(message.get("threshold", 0.5))
+                    if not (math.isfinite(interval) and math.isfinite(threshold)):
+                        raise ValueError("interval and threshold must be finite numbers")
+                except (TypeError, ValueError) as e:
+                    fanout.send(websocket, {"type": "error", "message": str(e)})
+                    continue
+                interval = min(max(interval, 0.1), 60.0)
+                threshold = max(threshold, 0.0)
+                metrics = [m for m in message.get("metrics") or TELEMETRY_METRICS if m in TELEMETRY_METRICS]
+                stop_telemetry(websocket)
+                task = asyncio.create_task(stream_telemetry(websocket, interval, metrics, threshold))
+                telemetry_subscribers[websocket] = (task, interval)
+                update_status_interval()
+                fanout.send(websocket, {
+                    "type": "ack",
+                    "message": "Subscribed to telemetry",
+                    "interval": interval,
+                    "metrics": metrics,
+                    "threshold": threshold
+                })
+                continue
+            elif message.get("type") == "unsubscribe_telemetry":
+                stop_telemetry(websocket)
+                fanout.send(websocket, {
+                    "type": "ack",
+                    "message": "Unsubscribed from telemetry"
+                })
+                continue
             
             # Echo back acknowledgment
-            await websocket.send_json({
+            fanout.send(websocket, {
                 "type": "ack",
                 "message": "Message received"
             })
@@ -379,21 +712,208 @@ async def websocket_endpoint(websocket: WebSocket):
     
     finally:
         active_connections.discard(websocket)
+        process_filters.pop(websocket, None)
+        stop_telemetry(websocket)
+        event_bus.disconnect(websocket)
+        fanout.unregister(websocket)
+
+async def stream_telemetry(websocket: WebSocket, interval: float, metrics: List[str], threshold: float):
+    """
+    Push the status metrics that changed by at least threshold, batched into one
+    "telemetry" frame per interval on the "system" topic; nothing is sent while
+    the values hold steady, or while the client is not subscribed to the topic.
+    """
+    last_sent: Dict[str, Any] = {}
+    while websocket in fanout.channels:  # Closed connections are cleaned up by the receive loop
+        status = status_sampler.latest()
+        if status is not None:
+            changed = changed_metrics(status, last_sent, metrics, threshold)
+            if changed and event_bus.publish("system", {
+                "type": "telemetry",
+                "timestamp": time.time(),
+                "values": changed
+            }, connections=[websocket]):
+                last_sent.update(changed)
+        await asyncio.sleep(interval)
+
+def stop_telemetry(websocket: WebSocket):
+    subscription = telemetry_subscribers.pop(websocket, None)
+    if subscription is not None:
+        subscription[0].cancel()
+        update_status_interval()
+
+def update_status_interval():
+    """Sample as often as the fastest telemetry subscriber wants, but never slower than configured"""
+    intervals = [interval for _, interval in telemetry_subscribers.values()]
+    status_sampler.interval = min([STATUS_SAMPLE_INTERVAL] + intervals)
+
+def bool_param(params: Dict[str, Any], name: str, default: bool = False) -> bool:
+    """JSON boolean, or a "true"/"false"/"1"/"0" string, from request params"""
+    value = params.get(name, default)
+    if isinstance(value, bool):
+        return value
+    text = str(value).strip().lower() if isinstance(value, (int, str)) else None
+    if text in ("1", "true", "yes", "on"):
+        return True
+    if text in ("0", "false", "no", "off", ""):
+        return False
+    raise ValueError(f"{name} must be a boolean, got {value!r}")
+
+def start_background_task(coro) -> asyncio.Task:
+    """Run coro as a task that stays referenced until it finishes"""
+    task = asyncio.create_task(coro)
+    background_tasks.add(task)
+    task.add_done_callback(background_tasks.discard)
+    return task
+
+async def run_copy_job(job_id: str, source: str, destination: str, cancel_event: threading.Event):
+    """Run a (possibly multi-GB) copy off the event loop and report the outcome over /ws"""
+    loop = asyncio.get_running_loop()
+    try:
+        result = await async_files.copy_file(
+            source, destination,
+            progress_callback=make_progress_broadcaster(loop, "File Copy", "bytes", min_interval=0.5),
+            cancel_event=cancel_event)
+    finally:
+        copy_jobs.pop(job_id, None)
+    await broadcast_activity({
+        "type": "success" if result.success else "warning",
+        "title": "File Copy",
+        "message": result.message,
+        "job_id": job_id
+    }, topic="file")
+
+async def run_archive_job(job_id: str, action: str, source, destination: str,
+                          params: Dict[str, Any], cancel_event: threading.Event):
+    """Compress or extract off the event loop and report the outcome over /ws"""
+    loop = asyncio.get_running_loop()
+    title = "Compress" if action == "compress" else "Extract"
+    progress = make_progress_broadcaster(loop, title, "bytes", min_interval=0.5)
+    try:
+        if action == "compress":
+            result = await async_files.compress(
+                source, destination, archive_format=params.get("format"),
+                exclude=params.get("exclude"), progress_callback=progress, cancel_event=cancel_event)
+        else:
+            result = await async_files.extract(
+                source, destination, progress_callback=progress, cancel_event=cancel_event)
+    finally:
+        archive_jobs.pop(job_id, None)
+    await broadcast_activity({
+        "type": "success" if result.success else "warning",
+        "title": title,
+        "message": result.message,
+        "job_id": job_id,
+        "result": result.output
+    }, topic="file")
+
+def make_progress_broadcaster(loop: asyncio.AbstractEventLoop, title: str, unit: str,
+                              min_interval: float = 0.1):
+    """
+    Progress callback for worker threads that forwards events to /ws clients.
+    Events are throttled to one per min_interval; the final one is always sent.
+    """
+    lock = threading.Lock()
+    last_sent = [0.0]
+
+    def on_progress(event: Dict[str, Any]):
+        now = time.monotonic()
+        with lock:
+            if event["completed"] < event["total"] and now - last_sent[0] < min_interval:
+                return
+            last_sent[0] = now
+        asyncio.run_coroutine_threadsafe(broadcast_activity({
+            "type": "progress",
+            "title": title,
+            "message": f"{event['completed']}/{event['total']} {unit}",
+            "progress": event
+        }, topic="file"), loop)
+
+    return on_progress
+
+def make_change_broadcaster(loop: asyncio.AbstractEventLoop, max_changes: int = 200):
+    """
+    Watcher subscriber that forwards each change batch as one /ws message.
+    Batches larger than max_changes are truncated; "truncated" tells clients to re-list.
+    """
+    def on_changes(changes):
+        asyncio.run_coroutine_threadsafe(broadcast_activity({
+            "type": "fs_change",
+            "title": "Files Changed",
+            "message": f"{len(changes)} file changes",
+            "changes": [change._asdict() for change in changes[:max_changes]],
+            "truncated": max(0, len(changes) - max_changes)
+        }, topic="file"), loop)
+
+    return on_changes
 
-async def broadcast_activity(activity: Dict[str, Any]):
-    """Broadcast activity to all connected WebSocket clients"""
+def make_process_event_broadcaster(loop: asyncio.AbstractEventLoop, min_interval: float = 1.0,
+                                   max_events: int = 200):
+    """
+    Process snapshot subscriber that pushes lifecycle events on the "process" topic.
+    Events are coalesced and flushed at most once per min_interval; a process that
+    starts and exits between two flushes is not reported. Each client receives
+    only events whose process name contains one of its filters; clients with the
+    same filters share one message.
+    """
+    lock = threading.Lock()
+    pending: Dict[tuple, Dict[str, Any]] = {}  # (pid, create_time) -> event
+    state = {"scheduled": False, "last_flush": 0.0}
+
+    def event(kind: str, info) -> Dict[str, Any]:
+        return {"event": kind, "pid": info.pid, "name": info.name, "ppid": info.ppid}
+
+    def on_processes(started, exited):
+        if not event_bus.subscribers["process"]:
+            return
+        with lock:
+            for info in started:
+                pending[(info.pid, info.create_time)] = event("process_started", info)
+            for info in exited:
+                if pending.pop((info.pid, info.create_time), None) is None:
+                    pending[(info.pid, info.create_time)] = event("process_exited", info)
+            if not pending or state["scheduled"]:
+                return
+            state["scheduled"] = True
+            delay = max(0.0, state["last_flush"] + min_interval - time.monotonic())
+        loop.call_soon_threadsafe(loop.call_later, delay, lambda: asyncio.ensure_future(flush()))
+
+    async def flush():
+        with lock:
+            events = list(pending.values())
+            pending.clear()
+            state["scheduled"] = False
+            state["last_flush"] = time.monotonic()
+        by_filter: Dict[Tuple[str, ...], List[WebSocket]] = {}
+        for connection in list(event_bus.subscribers["process"]):
+            by_filter.setdefault(process_filters.get(connection, ()), []).append(connection)
+        for names, connections in by_filter.items():
+            matching = [e for e in events
+                        if not names or any(name in (e["name"] or "").lower() for name in names)]
+            if not matching:
+                continue
+            started = sum(1 for e in matching if e["event"] == "process_started")
+            await broadcast_activity({
+                "type": "process_events",
+                "title": "Processes",
+                "message": f"{started} started, {len(matching) - started} exited",
+                "events": matching[:max_events],
+                "truncated": max(0, len(matching) - max_events)
+            }, connections=connections, topic="process")
+
+    return on_processes
+
+async def broadcast_activity(activity: Dict[str, Any], connections: Optional[Iterable[WebSocket]] = None,
+                             topic: str = "activity"):
+    """Broadcast activity to the WebSocket clients subscribed to topic, or only to connections"""
     message = {
         "type": "activity",
         "timestamp": datetime.now().strftime("%I:%M %p"),
         **activity
     }
     
-    for connection in list(active_connections):
-        try:
-            await connection.send_json(message)
-        except:
-            # Connection might be closed
-            active_connections.discard(connection)
+    # Queued per client and encoded once; slow clients never hold up the caller
+    event_bus.publish(topic, message, connections)
 
 if __name__ == "__main__":
     print("🚀 Starting OS Automation Server on port 8000...")
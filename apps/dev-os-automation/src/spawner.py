@@ -0,0 +1,213 @@
+"""
+Spawner - Launch detached apps and reap them when they exit
+Requirement 2.1: Launch the application by name or path
+"""
+
+import os
+import select
+import subprocess
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional
+
+DEFAULT_POLL_INTERVAL = 0.5  # Seconds between exit checks when pidfds are unavailable
+DEFAULT_HISTORY = 100  # Exited processes kept for inspection
+LATENCY_SAMPLES = 256
+
+
+class SpawnedProcess:
+    """One launched process; exit_code is set once it has been reaped"""
+
+    __slots__ = ("pid", "argv", "started_at", "spawn_ms", "exit_code", "exited_at", "_popen")
+
+    def __init__(self, pid: int, argv: List[str], spawn_ms: float, popen=None):
+        self.pid = pid
+        self.argv = argv
+        self.started_at = time.time()
+        self.spawn_ms = spawn_ms  # From the spawn call until the new program was running
+        self.exit_code: Optional[int] = None
+        self.exited_at: Optional[float] = None
+        self._popen = popen  # Only where posix_spawn is unavailable
+
+    @property
+    def running(self) -> bool:
+        return self.exited_at is None
+
+    def to_dict(self) -> dict:
+        return {
+            "pid": self.pid,
+            "argv": self.argv,
+            "started_at": self.started_at,
+            "spawn_ms": round(self.spawn_ms, 3),
+            "running": self.running,
+            "exit_code": self.exit_code,
+            "exited_at": self.exited_at
+        }
+
+
+class ProcessSpawner:
+    """
+    Starts apps with posix_spawn (no shell, no fork of the server's address
+    space), each in its own session with stdio on /dev/null, and reaps them
+    from a background thread so no launch is left behind as a zombie. On
+    Linux the reaper sleeps on a pidfd per child and wakes only when one
+    exits; elsewhere it sweeps the tracked PIDs with a non-blocking waitpid.
+    Only PIDs spawned here are ever waited on, so other subprocess users
+    keep their exit codes.
+    """
+
+    def __init__(self, poll_interval: float = DEFAULT_POLL_INTERVAL, history: int = DEFAULT_HISTORY):
+        self.poll_interval = poll_interval
+        self.use_posix_spawn = hasattr(os, "posix_spawnp")
+        self.use_pidfd = hasattr(os, "pidfd_open")
+        self._running: Dict[int, SpawnedProcess] = {}
+        self._exited: Deque[SpawnedProcess] = deque(maxlen=history)
+        self._pidfds: Dict[int, int] = {}  # pidfd -> pid
+        self._latencies: Deque[float] = deque(maxlen=LATENCY_SAMPLES)
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._wake_r = self._wake_w = None
+        self._stopped = False
+        self.spawned = 0
+        self.reaped = 0
+
+    def spawn(self, argv: List[str]) -> SpawnedProcess:
+        """Start argv detached; raises FileNotFoundError/OSError if it cannot be started"""
+        started = time.perf_counter()
+        if self.use_posix_spawn:
+            devnull = os.devnull
+            # Returns once the child has exec'd the new program (or failed to)
+            pid = os.posix_spawnp(argv[0], argv, os.environ, setsid=True, file_actions=[
+                (os.POSIX_SPAWN_OPEN, 0, devnull, os.O_RDONLY, 0),
+                (os.POSIX_SPAWN_OPEN, 1, devnull, os.O_WRONLY, 0),
+                (os.POSIX_SPAWN_OPEN, 2, devnull, os.O_WRONLY, 0),
+            ])
+            popen = None
+        else:
+            popen = subprocess.Popen(argv, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                                     stderr=subprocess.DEVNULL, start_new_session=True)
+            pid = popen.pid
+        spawn_ms = (time.perf_counter() - started) * 1000
+
+        process = SpawnedProcess(pid, list(argv), spawn_ms, popen)
+        pidfd = None
+        if self.use_pidfd and popen is None:
+            try:
+                pidfd = os.pidfd_open(pid)
+            except OSError:
+                self.use_pidfd = False  # Kernel older than 5.3; sweep instead
+        with self._lock:
+            self._running[pid] = process
+            self._latencies.append(spawn_ms)
+            self.spawned += 1
+            if pidfd is not None:
+                self._pidfds[pidfd] = pid
+        self._ensure_reaper()
+        return process
+
+    def get(self, pid: int) -> Optional[SpawnedProcess]:
+        with self._lock:
+            process = self._running.get(pid)
+            if process is None:
+                process = next((p for p in self._exited if p.pid == pid), None)
+            return process
+
+    def running(self) -> List[SpawnedProcess]:
+        with self._lock:
+            return list(self._running.values())
+
+    def stats(self) -> dict:
+        with self._lock:
+            latencies = sorted(self._latencies)
+            running, exited = len(self._running), len(self._exited)
+
+        def percentile(p: float) -> Optional[float]:
+            if not latencies:
+                return None
+            return round(latencies[min(len(latencies) - 1, int(p * len(latencies)))], 3)
+
+        return {
+            "spawned": self.spawned,
+            "running": running,
+            "reaped": self.reaped,
+            "recent_exited": exited,
+            "reaper": "pidfd" if self.use_pidfd else "waitpid",
+            "spawn_ms_p50": percentile(0.5),
+            "spawn_ms_p95": percentile(0.95),
+            "spawn_ms_max": round(latencies[-1], 3) if latencies else None
+        }
+
+    def _ensure_reaper(self) -> None:
+        with self._lock:
+            if self._thread is None and not self._stopped:
+                if self.use_pidfd:
+                    self._wake_r, self._wake_w = os.pipe()
+                    os.set_blocking(self._wake_w, False)
+                self._thread = threading.Thread(target=self._reap_loop, name="process-reaper", daemon=True)
+                self._thread.start()
+            elif self._wake_w is not None:
+                self._wake()  # Pick up the new pidfd
+
+    def _reap_loop(self) -> None:
+        while not self._stopped:
+            if not self.use_pidfd:
+                time.sleep(self.poll_interval)
+                with self._lock:
+                    pids = list(self._running)
+                for pid in pids:
+                    self._reap(pid)
+                continue
+            poller = select.poll()
+            poller.register(self._wake_r, select.POLLIN)
+            with self._lock:
+                for fd in self._pidfds:
+                    poller.register(fd, select.POLLIN)
+            ready = [fd for fd, _ in poller.poll()]
+            if self._wake_r in ready:
+                os.read(self._wake_r, 4096)
+            with self._lock:
+                exited = [(fd, self._pidfds.pop(fd)) for fd in ready if fd in self._pidfds]
+            for fd, pid in exited:
+                os.close(fd)
+                self._reap(pid)
+
+    def _reap(self, pid: int) -> None:
+        """Collect pid's exit status if it has exited; no-op while it runs"""
+        with self._lock:
+            process = self._running.get(pid)
+        if process is None:
+            return
+        if process._popen is not None:
+            code = process._popen.poll()
+            if code is None:
+                return
+        else:
+            try:
+                waited, status = os.waitpid(pid, os.WNOHANG)
+            except ChildProcessError:
+                waited, status = pid, None  # Reaped elsewhere (e.g. psutil.wait_procs)
+            if waited == 0:
+                return
+            code = os.waitstatus_to_exitcode(status) if status is not None else None
+        with self._lock:
+            process.exit_code = code
+            process.exited_at = time.time()
+            self._running.pop(pid, None)
+            self._exited.append(process)
+            self.reaped += 1
+
+    def _wake(self) -> None:
+        try:
+            os.write(self._wake_w, b"\0")
+        except BlockingIOError:
+            pass  # Already has wake-ups pending
+
+    def stop(self) -> None:
+        """Stop reaping; launched apps keep running"""
+        self._stopped = True
+        if self._wake_w is not None:
+            self._wake()
+        thread, self._thread = self._thread, None
+        if thread is not None:
+            thread.join(timeout=5)
@@ -0,0 +1,138 @@
+"""
+System Status - Background-sampled CPU, memory, disk, volume and brightness
+Requirement 3.1: Report system status without blocking the caller
+"""
+
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+DEFAULT_INTERVAL = 1.0  # Seconds between samples; also the CPU measurement window
+DEFAULT_STATUS = {
+    "volume": 50,
+    "brightness": 75,
+    "wifi": {"connected": True, "name": "Unknown"},
+    "network": "Online",
+    "cpu_usage": 0,
+    "memory_usage": 0,
+    "disk_usage": 0
+}
+
+TELEMETRY_METRICS = ("cpu_usage", "memory_usage", "disk_usage", "volume", "brightness")
+
+
+def changed_metrics(status: Dict[str, Any], previous: Dict[str, Any], metrics, threshold: float) -> Dict[str, Any]:
+    """Metrics whose value moved by at least threshold since previous (all of them if never sent)"""
+    changed = {}
+    for key in metrics:
+        value = status.get(key)
+        if value is None:
+            continue
+        if key not in previous or (value != previous[key] and abs(value - previous[key]) >= threshold):
+            changed[key] = value
+    return changed
+
+
+class SystemStatusSampler:
+    """
+    Keeps a system status dict current from a background thread, so readers
+    get the cached value without touching psutil, COM or the display driver.
+    CPU percent is measured across the sampling interval rather than since
+    whichever request happened to call last. Synchronous refreshes are
+    coalesced: callers arriving while a sample is in flight wait for that
+    sample instead of starting their own.
+    """
+
+    def __init__(self, interval: float = DEFAULT_INTERVAL,
+                 read_volume: Optional[Callable[[], int]] = None,
+                 read_brightness: Optional[Callable[[], int]] = None):
+        self.interval = interval
+        self.read_volume = read_volume
+        self.read_brightness = read_brightness
+        self._status: Optional[Dict[str, Any]] = None
+        self._sampled_at = 0.0
+        self._cond = threading.Condition()
+        self._in_flight = False
+        self._generation = 0  # Bumped when a sample finishes, successfully or not
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.samples = 0
+        self.coalesced = 0  # Refreshes that waited on another caller's sample
+        self.last_duration = 0.0
+
+    def latest(self) -> Optional[Dict[str, Any]]:
+        """Cached status without blocking; None until the first sample. Treat as read-only."""
+        if self._thread is None:
+            self.start()
+        return self._status
+
+    def snapshot(self, max_age: Optional[float] = None) -> Dict[str, Any]:
+        """Cached status, sampling first when there is none or it is older than max_age"""
+        status = self.latest()
+        if status is None or (max_age is not None and time.monotonic() - self._sampled_at > max_age):
+            status = self.refresh()
+        return status
+
+    def refresh(self) -> Dict[str, Any]:
+        """Sample now, or share the sample another caller already has in flight"""
+        with self._cond:
+            if self._in_flight:
+                self.coalesced += 1
+                generation = self._generation
+                self._cond.wait_for(lambda: self._generation != generation)
+                return self._status or dict(DEFAULT_STATUS)
+            self._in_flight = True
+        status = None
+        try:
+            status = self._sample()
+        finally:
+            with self._cond:
+                if status is not None:
+                    self._status, self._sampled_at = status, time.monotonic()
+                    self.samples += 1
+                self._in_flight = False
+                self._generation += 1
+                self._cond.notify_all()
+        return status
+
+    def _sample(self) -> Dict[str, Any]:
+        import psutil
+
+        started = time.monotonic()
+        status = dict(DEFAULT_STATUS)
+        status["wifi"] = {"connected": True, "name": "Dev-Network"}
+        status["network"] = "Connected"
+        # Percent since the previous sample; the first one measures a short window instead
+        status["cpu_usage"] = psutil.cpu_percent(interval=None if self.samples else 0.1)
+        status["memory_usage"] = psutil.virtual_memory().percent
+        status["disk_usage"] = psutil.disk_usage("C:" if os.name == "nt" else "/").percent
+        for key, read in (("volume", self.read_volume), ("brightness", self.read_brightness)):
+            if read is not None:
+                try:
+                    status[key] = read()
+                except Exception:
+                    pass  # Keep the default; hardware controls are optional
+        self.last_duration = time.monotonic() - started
+        return status
+
+    def start(self) -> None:
+        with self._cond:
+            if self._thread is not None:
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="system-status", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        thread, self._thread = self._thread, None
+        if thread is not None:
+            thread.join(timeout=5)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.refresh()
+            except Exception as e:
+                print(f"⚠️  System status sampling failed: {e}")
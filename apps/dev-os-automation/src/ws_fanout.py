@@ -0,0 +1,142 @@
+"""
+WebSocket Fan-out - Per-client outgoing queues for /ws broadcasts
+Requirement 3.3: Push activity to connected clients without blocking on them
+"""
+
+import asyncio
+import json
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, Optional
+
+DEFAULT_MAX_QUEUE = 256  # Messages buffered per client
+POLICIES = ("drop_oldest", "disconnect")
+
+
+def encode(message: Dict[str, Any]) -> str:
+    """Same encoding as WebSocket.send_json, compact so encoded messages can be spliced together"""
+    return json.dumps(message, separators=(",", ":"), ensure_ascii=False)
+
+
+class ClientChannel:
+    """Bounded queue of encoded messages for one connection, drained by its own writer task"""
+
+    def __init__(self, websocket, max_queue: int):
+        self.websocket = websocket
+        self.max_queue = max_queue
+        self.queue: Deque[str] = deque()
+        self.ready = asyncio.Event()
+        self.closed = False
+        self.sent = 0
+        self.dropped = 0
+        self.max_depth = 0
+        self.task: Optional[asyncio.Task] = None
+
+    async def run(self) -> None:
+        try:
+            while not self.closed:
+                if not self.queue:
+                    self.ready.clear()
+                    await self.ready.wait()
+                    continue
+                await self.websocket.send_text(self.queue.popleft())
+                self.sent += 1
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.closed = True  # Dead connection; the /ws handler unregisters it
+            self.queue.clear()
+
+
+class WebSocketFanout:
+    """
+    Sends to /ws clients through per-client bounded queues, each drained by
+    its own writer task, so one slow or half-dead client never delays the
+    others or the caller. publish() encodes a message once, enqueues it for
+    every target and returns immediately; publish_text() takes a message
+    that was encoded already. When a client's queue is full the
+    policy either drops its oldest queued message or disconnects it.
+    """
+
+    def __init__(self, max_queue: int = DEFAULT_MAX_QUEUE, policy: str = "drop_oldest"):
+        if policy not in POLICIES:
+            raise ValueError(f"policy must be one of {', '.join(POLICIES)}")
+        self.max_queue = max_queue
+        self.policy = policy
+        self.channels: Dict[Any, ClientChannel] = {}
+        self.published = 0
+        self.dropped = 0
+        self.disconnected = 0
+
+    def register(self, websocket) -> ClientChannel:
+        """Start a writer for websocket; call from the event loop after accept()"""
+        channel = ClientChannel(websocket, self.max_queue)
+        channel.task = asyncio.get_running_loop().create_task(channel.run())
+        self.channels[websocket] = channel
+        return channel
+
+    def unregister(self, websocket) -> None:
+        channel = self.channels.pop(websocket, None)
+        if channel is not None:
+            channel.closed = True
+            channel.task.cancel()
+
+    def publish(self, message: Dict[str, Any], connections: Optional[Iterable[Any]] = None) -> int:
+        """Queue message for connections (default: all); returns how many clients it was queued for"""
+        return self.publish_text(encode(message), connections)
+
+    def publish_text(self, text: str, connections: Optional[Iterable[Any]] = None) -> int:
+        """Queue an already encoded message, shared as-is by every target"""
+        targets = self.channels.values() if connections is None else \
+            [self.channels[ws] for ws in connections if ws in self.channels]
+        targets = [channel for channel in targets if not channel.closed]
+        if not targets:
+            return 0
+        self.published += 1
+        for channel in targets:
+            self._enqueue(channel, text)
+        return len(targets)
+
+    def send(self, websocket, message: Dict[str, Any]) -> bool:
+        """Queue message for a single client; False if it is not connected"""
+        return self.publish(message, [websocket]) == 1
+
+    def _enqueue(self, channel: ClientChannel, text: str) -> None:
+        if len(channel.queue) >= channel.max_queue:
+            if self.policy == "disconnect":
+                channel.closed = True
+                channel.queue.clear()
+                channel.task.cancel()  # Its send may be stuck on the dead socket
+                self.disconnected += 1
+                asyncio.get_running_loop().create_task(self._close(channel.websocket))
+                return
+            channel.queue.popleft()
+            channel.dropped += 1
+            self.dropped += 1
+        channel.queue.append(text)
+        channel.max_depth = max(channel.max_depth, len(channel.queue))
+        channel.ready.set()
+
+    @staticmethod
+    async def _close(websocket) -> None:
+        try:
+            await websocket.close(code=1008, reason="Client too slow")
+        except Exception:
+            pass
+
+    def stats(self) -> Dict[str, Any]:
+        clients = [{
+            "client": f"{ws.client.host}:{ws.client.port}" if getattr(ws, "client", None) else None,
+            "queued": len(channel.queue),
+            "max_depth": channel.max_depth,
+            "sent": channel.sent,
+            "dropped": channel.dropped
+        } for ws, channel in self.channels.items()]
+        return {
+            "policy": self.policy,
+            "max_queue": self.max_queue,
+            "connections": len(clients),
+            "published": self.published,
+            "dropped": self.dropped,
+            "disconnected": self.disconnected,
+            "clients": clients
+        }
@@ -0,0 +1,58 @@
+import os
+import shutil
+import subprocess
+import time
+
+import pytest
+
+from src import app_controller as app_controller_module
+from src.app_controller import AppController
+from src.process_snapshot import ProcessSnapshotService
+
+pytestmark = [
+    pytest.mark.skipif(os.name == "nt", reason="starts POSIX processes to close"),
+    pytest.mark.skipif(shutil.which("sleep") is None, reason="needs the 'sleep' executable"),
+]
+
+
+@pytest.fixture
+def app(tmp_path):
+    """A running process with a name of its own, and a controller that sees it"""
+    executable = tmp_path / "closetestapp"
+    shutil.copy(shutil.which("sleep"), executable)
+    proc = subprocess.Popen([str(executable), "60"])
+    processes = ProcessSnapshotService()
+    deadline = time.monotonic() + 5
+    while proc.pid not in processes.refresh().processes and time.monotonic() < deadline:
+        time.sleep(0.05)
+    yield AppController(processes=processes), proc
+    processes.stop()
+    if proc.poll() is None:
+        proc.kill()
+    proc.wait()
+
+
+def test_graceful_close_terminates_before_killing(app):
+    controller, proc = app
+
+    result = controller.close("closetestapp", graceful=True, timeout=5)
+
+    assert result.success
+    assert [(p["pid"], p["outcome"]) for p in result.output["processes"]] == [(proc.pid, "terminated")]
+
+
+def test_graceful_close_on_windows_asks_with_taskkill_then_kills(app, monkeypatch):
+    controller, proc = app
+    controller.os_type = "Windows"
+    commands = []
+    monkeypatch.setattr(app_controller_module.subprocess, "run",
+                        lambda argv, **kwargs: commands.append(argv))
+
+    started = time.monotonic()
+    result = controller.close("closetestapp", graceful=True, timeout=0.5)
+
+    # taskkill without /F only asks; sleep has no window, so it is killed after the timeout
+    assert commands == [["taskkill", "/PID", str(proc.pid)]]
+    assert time.monotonic() - started >= 0.5
+    assert result.success
+    assert [(p["pid"], p["outcome"]) for p in result.output["processes"]] == [(proc.pid, "killed")]
@@ -0,0 +1,34 @@
+import threading
+import time
+
+from src import app_index
+from src.app_index import AppMatcher
+
+
+def test_stale_window_list_is_refreshed_off_the_lookup_path(monkeypatch):
+    calls = []
+    release = threading.Event()
+
+    def slow_window_owner_pids():
+        calls.append(None)
+        if len(calls) == 1:
+            return {1}
+        release.wait(timeout=5)  # wmctrl taking its time
+        return {2}
+
+    monkeypatch.setattr(app_index, "window_owner_pids", slow_window_owner_pids)
+    matcher = AppMatcher()
+    assert matcher.window_pids() == {1}
+
+    monkeypatch.setattr(app_index, "WINDOW_CACHE_SECONDS", 0.0)
+    started = time.monotonic()
+    assert matcher.window_pids() == {1}  # Stale, but returned without waiting
+    assert matcher.window_pids() == {1}
+    assert time.monotonic() - started < 1
+    assert len(calls) <= 2  # One refresh at a time
+
+    release.set()
+    deadline = time.monotonic() + 5
+    while matcher.window_pids() != {2} and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert matcher.window_pids() == {2}
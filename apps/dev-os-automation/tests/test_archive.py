@@ -0,0 +1,124 @@
+import gzip
+import io
+import os
+import random
+import tarfile
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.archive import GZIP_WINDOW, Archiver, ParallelGzipWriter
+from src.file_controller import FileController
+from src.file_index import FileIndex
+
+
+def gzip_with(chunks, block_size=GZIP_WINDOW * 2, max_pending=2):
+    out = io.BytesIO()
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        writer = ParallelGzipWriter(out, executor, block_size=block_size, max_pending=max_pending)
+        for chunk in chunks:
+            writer.write(chunk)
+        writer.close()
+    return out.getvalue()
+
+
+def compressible(size, seed=0):
+    rng = random.Random(seed)
+    words = [bytes(rng.choice(b"abcdefgh") for _ in range(rng.randint(2, 9))) for _ in range(200)]
+    data = bytearray()
+    while len(data) < size:
+        data += rng.choice(words) + b" "
+    return bytes(data[:size])
+
+
+@pytest.mark.parametrize("data", [
+    b"",
+    b"x",
+    compressible(GZIP_WINDOW * 2),  # Exactly one block
+    compressible(GZIP_WINDOW * 9 + 17, seed=1),
+    os.urandom(GZIP_WINDOW * 5 + 3),
+], ids=["empty", "one-byte", "one-block", "many-blocks", "random"])
+def test_parallel_gzip_round_trip(data):
+    assert gzip.decompress(gzip_with([data])) == data
+
+
+def test_parallel_gzip_round_trip_with_uneven_writes():
+    data = compressible(GZIP_WINDOW * 7, seed=2)
+    rng = random.Random(3)
+    chunks, i = [], 0
+    while i < len(data):
+        step = rng.randint(1, GZIP_WINDOW)
+        chunks.append(data[i:i + step])
+        i += step
+    assert gzip.decompress(gzip_with(chunks)) == data
+
+
+def test_parallel_gzip_matches_across_block_sizes():
+    data = compressible(GZIP_WINDOW * 6, seed=4)
+    for block_size in (1024, GZIP_WINDOW, GZIP_WINDOW * 3):
+        assert gzip.decompress(gzip_with([data], block_size=block_size)) == data
+
+
+def test_close_is_idempotent():
+    out = io.BytesIO()
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        writer = ParallelGzipWriter(out, executor)
+        writer.write(b"hello")
+        writer.close()
+        writer.close()
+    assert gzip.decompress(out.getvalue()) == b"hello"
+
+
+def test_tar_gz_archive_round_trip(tmp_path):
+    source = tmp_path / "project"
+    (source / "pkg").mkdir(parents=True)
+    (source / "pkg" / "mod.py").write_bytes(compressible(300_000, seed=5))
+    (source / "README").write_text("readme")
+    archive = tmp_path / "project.tar.gz"
+
+    Archiver(block_size=64 * 1024).compress(str(source), str(archive))
+
+    with tarfile.open(archive) as tar:
+        assert tar.extractfile("project/pkg/mod.py").read() == (source / "pkg" / "mod.py").read_bytes()
+        assert tar.extractfile("project/README").read() == b"readme"
+
+
+def test_string_exclude_is_one_pattern(tmp_path):
+    source = tmp_path / "src"
+    source.mkdir()
+    (source / "app.log").write_text("log")
+    (source / "logic.py").write_text("code")
+    archive = tmp_path / "out.tar"
+
+    result = FileController(index=FileIndex(str(tmp_path / "index"))).compress(
+        str(source), str(archive), exclude="*.log")
+
+    assert result.success
+    with tarfile.open(archive) as tar:
+        assert sorted(tar.getnames()) == ["src", "src/logic.py"]
+
+
+def test_zip_archive_round_trip_with_parallel_members(tmp_path):
+    source = tmp_path / "project"
+    (source / "pkg" / "empty_dir").mkdir(parents=True)
+    files = {f"pkg/mod{i}.py": compressible(5_000 + i * 997, seed=i) for i in range(40)}
+    files["big.bin"] = compressible(GZIP_WINDOW * 9 + 5, seed=99) + os.urandom(GZIP_WINDOW)
+    files["empty.txt"] = b""
+    for name, data in files.items():
+        (source / name).write_bytes(data)
+    archive = tmp_path / "project.zip"
+
+    result = Archiver(max_workers=4, block_size=GZIP_WINDOW * 2).compress(str(source), str(archive))
+
+    assert result["files"] == len(files)
+    with zipfile.ZipFile(archive) as zf:
+        assert zf.testzip() is None
+        names = zf.namelist()
+        assert names == sorted(names, key=lambda name: name.rstrip("/").split("/"))
+        assert "project/pkg/empty_dir/" in names
+        for name, data in files.items():
+            info = zf.getinfo(f"project/{name}")
+            assert info.compress_type == zipfile.ZIP_DEFLATED
+            assert zf.read(info) == data
+    assert result["bytes_out"] < sum(len(data) for data in files.values())
@@ -0,0 +1,39 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from src import async_file_controller
+from src.async_file_controller import AsyncFileController
+
+
+def test_cancelling_the_consumer_stops_the_walk_in_the_worker(monkeypatch):
+    # One long batch, so only the stop check can end the walk early
+    monkeypatch.setattr(async_file_controller, "SEARCH_BATCH_SIZE", 1000)
+    monkeypatch.setattr(async_file_controller, "SEARCH_BATCH_SECONDS", 60)
+    produced = []
+    closed = threading.Event()
+
+    def slow_walk():
+        try:
+            for i in range(1000):
+                time.sleep(0.005)
+                produced.append(i)
+                yield {"path": str(i)}
+        finally:
+            closed.set()
+
+    async def cancel_mid_batch():
+        stream = AsyncFileController(max_workers=2)._iterate(slow_walk())
+        task = asyncio.ensure_future(stream.__anext__())
+        await asyncio.sleep(0.1)  # The worker is filling the first batch
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(cancel_mid_batch())
+    assert closed.wait(timeout=1)
+    count = len(produced)
+    time.sleep(0.05)
+    assert len(produced) == count < 1000
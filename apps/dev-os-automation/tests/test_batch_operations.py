@@ -0,0 +1,160 @@
+import pytest
+
+from src.file_controller import FileController, _group_conflicting
+from src.file_index import FileIndex
+
+
+@pytest.fixture
+def controller(tmp_path):
+    return FileController(index=FileIndex(str(tmp_path / "index")))
+
+
+def groups_of(operations):
+    return sorted(sorted(group) for group in _group_conflicting(operations))
+
+
+def test_independent_operations_get_their_own_groups():
+    operations = [
+        {"op": "copy", "source": "/data/a.txt", "destination": "/backup/a.txt"},
+        {"op": "move", "source": "/data/b.txt", "destination": "/archive/b.txt"},
+        {"op": "delete", "source": "/data/c.txt"},
+    ]
+    assert groups_of(operations) == [[0], [1], [2]]
+
+
+def test_shared_paths_are_grouped_in_order():
+    operations = [
+        {"op": "move", "source": "/data/a.txt", "destination": "/data/b.txt"},
+        {"op": "copy", "source": "/other/x", "destination": "/other/y"},
+        {"op": "move", "source": "/data/b.txt", "destination": "/data/c.txt"},
+        {"op": "delete", "source": "/data/c.txt"},
+    ]
+    groups = _group_conflicting(operations)
+    assert sorted(groups) == [[0, 2, 3], [1]]
+
+
+def test_nested_paths_conflict():
+    operations = [
+        {"op": "move", "source": "/data/dir", "destination": "/moved/dir"},
+        {"op": "delete", "source": "/data/dir/inner/file.txt"},
+        {"op": "copy", "source": "/data/dirt.txt", "destination": "/copy/dirt.txt"},
+    ]
+    assert groups_of(operations) == [[0, 1], [2]]
+
+
+def test_transitive_conflicts_merge_groups():
+    operations = [
+        {"op": "copy", "source": "/a", "destination": "/b"},
+        {"op": "copy", "source": "/c", "destination": "/d"},
+        {"op": "move", "source": "/b", "destination": "/c"},
+    ]
+    assert groups_of(operations) == [[0, 1, 2]]
+
+
+def test_relative_and_absolute_paths_are_compared_resolved(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    operations = [
+        {"op": "delete", "source": "file.txt"},
+        {"op": "copy", "source": str(tmp_path / "file.txt"), "destination": "copy.txt"},
+    ]
+    assert groups_of(operations) == [[0, 1]]
+
+
+def test_empty_batch():
+    assert _group_conflicting([]) == []
+
+
+def test_atomic_batch_rolls_back_completed_moves(controller, tmp_path):
+    for name in ("a", "b"):
+        (tmp_path / f"{name}.txt").write_text(name)
+    operations = [
+        {"op": "move", "source": str(tmp_path / "a.txt"), "destination": str(tmp_path / "out" / "a.txt")},
+        {"op": "move", "source": str(tmp_path / "b.txt"), "destination": str(tmp_path / "out" / "b.txt")},
+        {"op": "move", "source": str(tmp_path / "missing.txt"), "destination": str(tmp_path / "out" / "m.txt")},
+    ]
+    result = controller.batch_operations(operations, atomic=True)
+
+    assert not result.success
+    assert result.output["rolled_back"]
+    assert result.output["succeeded"] == 0
+    statuses = [item["status"] for item in result.output["results"]]
+    assert statuses[2] == "failed"
+    # Moves that ran before the failure are undone; ones that had not started are skipped
+    assert set(statuses[:2]) <= {"rolled_back", "skipped"}
+    assert (tmp_path / "a.txt").read_text() == "a"
+    assert (tmp_path / "b.txt").read_text() == "b"
+    assert not (tmp_path / "out" / "a.txt").exists()
+    assert not (tmp_path / "out" / "b.txt").exists()
+
+
+def test_atomic_rollback_unwinds_chained_moves(controller, tmp_path):
+    (tmp_path / "a.txt").write_text("original")
+    operations = [
+        {"op": "move", "source": str(tmp_path / "a.txt"), "destination": str(tmp_path / "b.txt")},
+        {"op": "move", "source": str(tmp_path / "b.txt"), "destination": str(tmp_path / "c.txt")},
+        {"op": "move", "source": str(tmp_path / "c.txt"), "destination": str(tmp_path / "d.txt")},
+        {"op": "move", "source": str(tmp_path / "gone.txt"), "destination": str(tmp_path / "c.txt")},
+    ]
+    result = controller.batch_operations(operations, max_workers=1, atomic=True)
+
+    assert not result.success
+    assert [item["status"] for item in result.output["results"]] == \
+        ["rolled_back", "rolled_back", "rolled_back", "failed"]
+    assert (tmp_path / "a.txt").read_text() == "original"
+    assert not any((tmp_path / name).exists() for name in ("b.txt", "c.txt", "d.txt"))
+
+
+def test_atomic_batch_rejects_non_moves(controller, tmp_path):
+    result = controller.batch_operations(
+        [{"op": "copy", "source": str(tmp_path / "a"), "destination": str(tmp_path / "b")}],
+        atomic=True)
+    assert not result.success
+    assert result.error == "InvalidOperationError"
+
+
+def test_non_atomic_batch_keeps_successful_moves(controller, tmp_path):
+    (tmp_path / "a.txt").write_text("a")
+    operations = [
+        {"op": "move", "source": str(tmp_path / "a.txt"), "destination": str(tmp_path / "out" / "a.txt")},
+        {"op": "move", "source": str(tmp_path / "missing.txt"), "destination": str(tmp_path / "out" / "m.txt")},
+    ]
+    result = controller.batch_operations(operations)
+
+    assert not result.success
+    assert not result.output["rolled_back"]
+    assert [item["status"] for item in result.output["results"]] == ["done", "failed"]
+    assert (tmp_path / "out" / "a.txt").read_text() == "a"
+
+
+def test_atomic_batch_refuses_to_replace_an_existing_destination(controller, tmp_path):
+    (tmp_path / "a.txt").write_text("new")
+    (tmp_path / "b.txt").write_text("b")
+    (tmp_path / "keep.txt").write_text("existing")
+    operations = [
+        {"op": "move", "source": str(tmp_path / "a.txt"), "destination": str(tmp_path / "out.txt")},
+        {"op": "move", "source": str(tmp_path / "b.txt"), "destination": str(tmp_path / "keep.txt")},
+    ]
+    result = controller.batch_operations(operations, max_workers=1, atomic=True)
+
+    assert not result.success
+    assert result.output["rolled_back"]
+    assert [item["status"] for item in result.output["results"]] == ["rolled_back", "failed"]
+    assert result.output["results"][1]["error"] == "FileExistsError"
+    assert (tmp_path / "keep.txt").read_text() == "existing"
+    assert (tmp_path / "a.txt").read_text() == "new"
+    assert (tmp_path / "b.txt").read_text() == "b"
+
+
+def test_atomic_batch_allows_moves_onto_paths_vacated_earlier(controller, tmp_path):
+    (tmp_path / "a.txt").write_text("a")
+    (tmp_path / "b.txt").write_text("b")
+    operations = [
+        {"op": "move", "source": str(tmp_path / "a.txt"), "destination": str(tmp_path / "tmp.txt")},
+        {"op": "move", "source": str(tmp_path / "b.txt"), "destination": str(tmp_path / "a.txt")},
+        {"op": "move", "source": str(tmp_path / "tmp.txt"), "destination": str(tmp_path / "b.txt")},
+    ]
+    result = controller.batch_operations(operations, atomic=True)
+
+    assert result.success
+    assert (tmp_path / "a.txt").read_text() == "b"
+    assert (tmp_path / "b.txt").read_text() == "a"
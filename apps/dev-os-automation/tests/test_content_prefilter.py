@@ -0,0 +1,87 @@
+import re
+
+import pytest
+from hypothesis import HealthCheck, assume, given, settings, strategies as st
+
+from src.content_search import ContentQuery, _required_literals
+
+ALPHABET = "abcxyz"
+
+
+@pytest.mark.parametrize("pattern, expected", [
+    ("hello", [["hello"]]),
+    ("foo.*bar", [["foo"], ["bar"]]),
+    ("def \\w+\\(self", [["(self"], ["def "]]),
+    ("(?:error|warning): disk", [[": disk"], ["error", "warning"]]),
+    ("(ab)+cd", [["ab"], ["cd"]]),
+    ("x(?:ab)?y", [["x"], ["y"]]),
+    ("todo|fixme", [["fixme", "todo"]]),
+])
+def test_required_literals(pattern, expected):
+    assert _required_literals(pattern) == expected
+
+
+@pytest.mark.parametrize("pattern", [
+    ".*",
+    "\\d+",
+    "[a-z]+",
+    "(?i)hello",
+    "a*",
+    "todo|\\d+",  # One branch has no literal, so nothing is required
+    "(unclosed",
+])
+def test_no_required_literals(pattern):
+    assert _required_literals(pattern) is None
+
+
+def test_case_insensitive_group_contributes_nothing():
+    assert _required_literals("(?i:abc)def") == [["def"]]
+
+
+def test_at_most_three_longest_sets_are_kept():
+    assert _required_literals("a.bb.ccc.dddd") == [["dddd"], ["ccc"], ["bb"]]
+
+
+def test_literal_query_checks_raw_bytes():
+    query = ContentQuery("needle")
+    assert query.may_match(b"hay needle hay", "utf-8")
+    assert not query.may_match(b"just hay", "utf-8")
+    assert query.may_match("needle".encode("utf-16-le"), "utf-16-le")
+
+
+def test_any_pattern_may_match():
+    query = ContentQuery(["alpha", "beta"])
+    assert query.may_match(b"...beta...", "utf-8")
+    assert not query.may_match(b"gamma", "utf-8")
+
+
+def regexes():
+    """Small regexes over a tiny alphabet mixing literals, classes, groups, alternation and repeats"""
+    atom = st.one_of(
+        st.text(ALPHABET, min_size=1, max_size=4).map(re.escape),
+        st.sampled_from([".", "[ab]", "[^c]", "\\w", "\\d", "\\s"]),
+    )
+
+    def extend(inner):
+        return st.one_of(
+            st.lists(inner, min_size=2, max_size=4).map("".join),
+            st.lists(inner, min_size=2, max_size=3).map(lambda parts: "(?:" + "|".join(parts) + ")"),
+            inner.map(lambda body: "(" + body + ")"),
+            inner.map(lambda body: "(?i:" + body + ")"),
+            st.tuples(inner, st.sampled_from(["*", "+", "?", "{2}", "{1,3}", "{0,2}", "+?", "*?"]))
+            .map(lambda t: "(?:" + t[0] + ")" + t[1]),
+        )
+
+    return st.recursive(atom, extend, max_leaves=8)
+
+
+@settings(max_examples=300, suppress_health_check=[HealthCheck.too_slow, HealthCheck.filter_too_much])
+@given(data=st.data(), pattern=regexes())
+def test_prefilter_never_rejects_a_match(data, pattern):
+    text = data.draw(st.from_regex(pattern, fullmatch=False).filter(lambda s: len(s) < 200))
+    match = re.search(pattern, text)
+    assume(match is not None)
+    required = _required_literals(pattern) or []
+    for alternatives in required:
+        assert any(literal in match.group(0) for literal in alternatives), (pattern, text, required)
+    assert ContentQuery(pattern, regex=True).may_match(text.encode("utf-8"), "utf-8")
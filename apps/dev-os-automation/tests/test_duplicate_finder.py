@@ -0,0 +1,29 @@
+from src.duplicate_finder import DuplicateFinder
+
+
+def duplicate_paths(groups):
+    return sorted(sorted(entry.path for entry in entries) for _, entries in groups)
+
+
+def test_duplicates_inside_ignored_trees_are_found_by_default(tmp_path):
+    (tmp_path / ".gitignore").write_text("build/\n")
+    for directory in ("node_modules", "build", "src"):
+        (tmp_path / directory).mkdir()
+        (tmp_path / directory / "lib.js").write_text("same content")
+
+    groups = DuplicateFinder().find(str(tmp_path))
+
+    assert duplicate_paths(groups) == [sorted(
+        str(tmp_path / directory / "lib.js") for directory in ("build", "node_modules", "src"))]
+
+
+def test_respect_ignore_skips_ignored_trees(tmp_path):
+    (tmp_path / ".gitignore").write_text("build/\n")
+    for directory in ("node_modules", "build", "src", "docs"):
+        (tmp_path / directory).mkdir()
+        (tmp_path / directory / "lib.js").write_text("same content")
+
+    groups = DuplicateFinder().find(str(tmp_path), respect_ignore=True)
+
+    assert duplicate_paths(groups) == [[str(tmp_path / "docs" / "lib.js"),
+                                        str(tmp_path / "src" / "lib.js")]]
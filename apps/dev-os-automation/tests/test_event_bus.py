@@ -0,0 +1,114 @@
+import asyncio
+import json
+
+import pytest
+
+from src.event_bus import DEFAULT_TOPICS, EventBus
+
+
+class RecordingFanout:
+    def __init__(self):
+        self.sent = []  # (decoded message, recipients)
+
+    def publish_text(self, text, connections):
+        self.sent.append((json.loads(text), sorted(connections)))
+        return len(connections)
+
+
+@pytest.fixture
+def bus():
+    return EventBus(RecordingFanout())
+
+
+def test_connections_start_on_default_topics(bus):
+    bus.connect("a")
+    assert bus.topics_for("a") == list(DEFAULT_TOPICS)
+    assert bus.publish("process", {"n": 1}) == 0
+    assert bus.publish("file", {"n": 2}) == 1
+    assert bus.fanout.sent == [({"n": 2, "topic": "file"}, ["a"])]
+
+
+def test_subscribe_replaces_topics_and_rejects_unknown(bus):
+    bus.connect("a")
+    assert bus.subscribe("a", ["process"]) == ["process"]
+    with pytest.raises(ValueError, match="Unknown topics: nope"):
+        bus.subscribe("a", ["nope"])
+    assert bus.unsubscribe("a") == []
+
+
+def test_empty_topic_list_subscribes_to_nothing(bus):
+    bus.connect("a")
+    assert bus.subscribe("a", []) == []
+    assert bus.publish("file", {"n": 1}) == 0
+
+
+@pytest.mark.parametrize("topics, batch_ms", [
+    ("file", None),  # A bare string is not a list of topics
+    (["file", "nope"], None),
+    (["process"], "fast"),
+    (["process"], -1),
+    (["process"], float("nan")),
+    (["process"], True),
+])
+def test_rejected_subscribe_changes_nothing(bus, topics, batch_ms):
+    bus.connect("a")
+    bus.subscribe("a", ["activity"], batch_ms=20)
+    with pytest.raises(ValueError):
+        bus.subscribe("a", topics, batch_ms=batch_ms)
+    assert bus.topics_for("a") == ["activity"]
+    assert bus.batch_windows == {"a": 0.02}
+
+
+def test_publish_to_selected_connections(bus):
+    for ws in "abc":
+        bus.connect(ws)
+    bus.publish("activity", {"n": 1}, connections=["a", "c", "unknown"])
+    assert bus.fanout.sent == [({"n": 1, "topic": "activity"}, ["a", "c"])]
+
+
+def test_batched_frames_are_shared_per_window():
+    async def scenario():
+        bus = EventBus(RecordingFanout())
+        for ws in "abc":
+            bus.connect(ws)
+            bus.subscribe(ws, ["activity", "file"] if ws != "c" else ["activity"], batch_ms=10)
+        bus.publish("activity", {"n": 1})
+        bus.publish("file", {"n": 2})
+        await asyncio.sleep(0.05)
+        return bus
+
+    bus = asyncio.run(scenario())
+    frames = sorted(bus.fanout.sent, key=lambda sent: sent[1])  # One frame per distinct event list
+    assert frames == [
+        ({"type": "batch", "events": [{"n": 1, "topic": "activity"}, {"n": 2, "topic": "file"}]}, ["a", "b"]),
+        ({"n": 1, "topic": "activity"}, ["c"]),
+    ]
+    assert bus.batches == 1
+
+
+def test_full_batch_is_flushed_early():
+    async def scenario():
+        bus = EventBus(RecordingFanout(), max_batch=3)
+        bus.connect("a")
+        bus.subscribe("a", ["activity"], batch_ms=1000)
+        for n in range(3):
+            bus.publish("activity", {"n": n})
+        return bus
+
+    bus = asyncio.run(scenario())
+    assert [len(message["events"]) for message, _ in bus.fanout.sent] == [3]
+
+
+def test_turning_batching_off_delivers_held_events():
+    async def scenario():
+        bus = EventBus(RecordingFanout())
+        bus.connect("a")
+        bus.subscribe("a", ["activity"], batch_ms=1000)
+        bus.publish("activity", {"n": 1})
+        bus.subscribe("a", ["activity"], batch_ms=0)
+        bus.publish("activity", {"n": 2})
+        return bus
+
+    bus = asyncio.run(scenario())
+    assert [message for message, _ in bus.fanout.sent] == [
+        {"n": 1, "topic": "activity"}, {"n": 2, "topic": "activity"}]
@@ -0,0 +1,69 @@
+import os
+import threading
+
+import pytest
+
+from src.file_copy import PART_SUFFIX, SOURCE_SUFFIX, ChunkedCopier, CopyCancelled, SourceChanged
+
+CHUNK = 4096
+
+
+@pytest.fixture(params=[True, False], ids=["kernel", "buffered"])
+def copier(request):
+    return ChunkedCopier(buffer_size=CHUNK, use_kernel_copy=request.param)
+
+
+def cancel_after_first_chunk():
+    cancel = threading.Event()
+    return cancel, lambda progress: cancel.set()
+
+
+def test_cancelled_copy_resumes_from_the_partial_file(copier, tmp_path):
+    source, destination = tmp_path / "src.bin", tmp_path / "dst.bin"
+    source.write_bytes(os.urandom(CHUNK * 4))
+    cancel, progress = cancel_after_first_chunk()
+    with pytest.raises(CopyCancelled):
+        copier.copy(str(source), str(destination), progress, cancel)
+
+    result = copier.copy(str(source), str(destination))
+
+    assert result["resumed_from"] == CHUNK
+    assert destination.read_bytes() == source.read_bytes()
+    assert not os.path.exists(str(destination) + PART_SUFFIX)
+    assert not os.path.exists(str(destination) + PART_SUFFIX + SOURCE_SUFFIX)
+
+
+def test_partial_from_a_replaced_source_is_not_resumed(copier, tmp_path):
+    source, destination = tmp_path / "src.bin", tmp_path / "dst.bin"
+    head = os.urandom(CHUNK)
+    source.write_bytes(head + b"a" * CHUNK * 3)
+    cancel, progress = cancel_after_first_chunk()
+    with pytest.raises(CopyCancelled):
+        copier.copy(str(source), str(destination), progress, cancel)
+
+    # Same size and the same bytes as far as the partial copy got, but a different file
+    replacement = tmp_path / "new.bin"
+    replacement.write_bytes(head + b"b" * CHUNK * 3)
+    os.replace(replacement, source)
+    result = copier.copy(str(source), str(destination))
+
+    assert result["resumed_from"] == 0
+    assert destination.read_bytes() == source.read_bytes()
+
+
+def test_source_that_shrinks_mid_copy_keeps_the_partial_file(copier, tmp_path):
+    source, destination = tmp_path / "src.bin", tmp_path / "dst.bin"
+    source.write_bytes(os.urandom(CHUNK * 4))
+
+    def shrink(progress):
+        if progress["completed"] == CHUNK:
+            os.truncate(source, CHUNK * 2)
+
+    with pytest.raises(SourceChanged):
+        copier.copy(str(source), str(destination), shrink)
+
+    assert not destination.exists()
+    assert os.path.getsize(str(destination) + PART_SUFFIX) == CHUNK * 2
+    result = copier.copy(str(source), str(destination))
+    assert result["resumed_from"] == 0
+    assert destination.read_bytes() == source.read_bytes()
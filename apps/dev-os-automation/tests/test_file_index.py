@@ -0,0 +1,99 @@
+import os
+
+import pytest
+
+from src import file_index
+from src.file_controller import FileController
+from src.file_index import FileIndex
+
+
+@pytest.fixture
+def controller(tmp_path):
+    return FileController(index=FileIndex(str(tmp_path / "index")))
+
+
+@pytest.fixture
+def tree(tmp_path):
+    root = tmp_path / "tree"
+    (root / "pkg" / "sub").mkdir(parents=True)
+    for i in range(25):
+        (root / "pkg" / f"mod{i:02}.py").write_text("")
+    (root / "notes.txt").write_text("")
+    return root
+
+
+def names(result):
+    return [os.path.basename(item["path"]) for item in result.output["results"]]
+
+
+def test_file_created_after_indexing_is_found(controller, tree):
+    controller.index_directory(str(tree))
+    (tree / "pkg" / "sub" / "fresh.py").write_text("")
+
+    assert names(controller.search_files(str(tree), "fresh*")) == ["fresh.py"]
+    assert "fresh.py" in names(controller.search_files(str(tree / "pkg"), "py", search_type="type"))
+
+
+def test_change_in_settled_directory_is_found(controller, tree, monkeypatch):
+    monkeypatch.setattr(file_index, "RACY_WINDOW_NS", 0)  # Trust listings immediately
+    controller.index_directory(str(tree))
+    sub = tree / "pkg" / "sub"
+    (sub / "late.py").write_text("")
+    os.utime(sub, ns=(1, 1))  # A distinct mtime, as a later clock tick would give
+
+    assert names(controller.search_files(str(sub), "late*")) == ["late.py"]
+    assert names(controller.search_files(str(tree), "late*")) == ["late.py"]
+
+
+def test_deleted_file_is_not_returned(controller, tree):
+    controller.index_directory(str(tree))
+    (tree / "notes.txt").unlink()
+
+    assert names(controller.search_files(str(tree), "notes*")) == []
+
+
+def test_pages_do_not_overlap(controller, tree):
+    controller.index_directory(str(tree))
+    first = controller.search_files(str(tree), "*.py", limit=10)
+    second = controller.search_files(str(tree), "*.py", limit=10, cursor=first.output["next_cursor"])
+    third = controller.search_files(str(tree), "*.py", limit=10, cursor=second.output["next_cursor"])
+
+    pages = [names(first), names(second), names(third)]
+    assert [len(page) for page in pages] == [10, 10, 5]
+    assert len(set().union(*pages)) == 25
+    assert third.output["next_cursor"] is None
+
+
+def test_index_results_are_sorted(tree, tmp_path):
+    index = FileIndex(str(tmp_path / "index"))
+    index.add_root(str(tree))
+    results = index.search_extension(str(tree), ".py")
+    assert results == sorted(results)
+
+
+def test_pruned_directory_falls_back_to_live_walk(controller, tree):
+    (tree / "node_modules" / "lib").mkdir(parents=True)
+    (tree / "node_modules" / "lib" / "index.js").write_text("")
+    controller.index_directory(str(tree))
+
+    assert controller.index.search_name(str(tree / "node_modules"), "*.js") is None
+    assert names(controller.search_files(str(tree / "node_modules"), "*.js")) == ["index.js"]
+
+
+def test_gitignore_edit_applies_to_cached_listings(tree, tmp_path):
+    index = FileIndex(str(tmp_path / "index"))
+    (tree / ".gitignore").write_text("sub/\n")
+    (tree / "pkg" / "sub" / "hidden.py").write_text("")
+    index.add_root(str(tree))
+    assert index.search_name(str(tree), "hidden*") == []
+
+    (tree / ".gitignore").write_text("# nothing ignored\n")
+    os.utime(tree / ".gitignore", ns=(1, 1))  # Distinct mtime even on coarse clocks
+    assert index.search_name(str(tree), "hidden*") == [str(tree / "pkg" / "sub" / "hidden.py")]
+
+
+def test_index_persists_between_instances(tree, tmp_path):
+    FileIndex(str(tmp_path / "index")).add_root(str(tree))
+    reloaded = FileIndex(str(tmp_path / "index"))
+    assert reloaded.roots() == [str(tree.resolve())]
+    assert len(reloaded.search_extension(str(tree), ".py")) == 25
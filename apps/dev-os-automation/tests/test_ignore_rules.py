@@ -0,0 +1,135 @@
+import os
+import re
+
+import pytest
+
+from src.ignore_rules import IgnoreRules, _translate, compile_pattern, compile_patterns
+
+ROOT = os.path.abspath(os.sep + "repo")
+
+
+def matches(pattern, target):
+    return re.match(_translate(pattern), target) is not None
+
+
+def rules(*lines):
+    return IgnoreRules(ROOT, compile_patterns(lines, ROOT))
+
+
+def path(relative):
+    return os.path.join(ROOT, *relative.split("/"))
+
+
+@pytest.mark.parametrize("pattern, target, expected", [
+    ("*.log", "debug.log", True),
+    ("*.log", "debug.log.txt", False),
+    ("*.log", "logs/debug.log", False),  # "*" stops at "/"
+    ("file?.txt", "file1.txt", True),
+    ("file?.txt", "file10.txt", False),
+    ("file?.txt", "file/.txt", False),
+    ("[abc].py", "b.py", True),
+    ("[!abc].py", "d.py", True),
+    ("[!abc].py", "a.py", False),
+    ("[^abc].py", "a.py", False),
+    ("[a-c]x", "bx", True),
+    ("[unclosed", "[unclosed", True),
+    ("\\*.txt", "*.txt", True),
+    ("\\*.txt", "a.txt", False),
+    ("a+b(c).txt", "a+b(c).txt", True),
+])
+def test_translate_basic_globs(pattern, target, expected):
+    assert matches(pattern, target) is expected
+
+
+@pytest.mark.parametrize("pattern, target, expected", [
+    ("**/build", "build", True),
+    ("**/build", "a/b/build", True),
+    ("**/build", "a/rebuild", False),
+    ("docs/**", "docs/a", True),
+    ("docs/**", "docs/a/b/c.md", True),
+    ("docs/**", "docs", False),
+    ("a/**/b", "a/b", True),
+    ("a/**/b", "a/x/y/b", True),
+    ("a/**/b", "a/x/yb", False),
+])
+def test_translate_double_star(pattern, target, expected):
+    assert matches(pattern, target) is expected
+
+
+def test_comments_blanks_and_escapes():
+    assert compile_pattern("# comment", ROOT) is None
+    assert compile_pattern("   ", ROOT) is None
+    assert compile_pattern("/", ROOT) is None
+    hashed = compile_pattern("\\#notes", ROOT)
+    assert hashed.regex.match("#notes") and not hashed.negate
+    bang = compile_pattern("\\!important", ROOT)
+    assert bang.regex.match("!important") and not bang.negate
+
+
+def test_unanchored_pattern_matches_name_at_any_depth():
+    r = rules("*.pyc")
+    assert r.is_ignored(path("a.pyc"), False)
+    assert r.is_ignored(path("pkg/sub/a.pyc"), False)
+    assert not r.is_ignored(path("pkg/a.py"), False)
+
+
+def test_anchored_patterns_match_relative_to_base():
+    r = rules("/build", "src/gen")
+    assert r.is_ignored(path("build"), True)
+    assert not r.is_ignored(path("lib/build"), True)
+    assert r.is_ignored(path("src/gen"), True)
+    assert not r.is_ignored(path("other/src/gen"), True)
+    assert not r.is_ignored(os.path.abspath(os.sep + "elsewhere/build"), True)
+
+
+def test_directory_only_patterns_skip_files():
+    r = rules("cache/")
+    assert r.is_ignored(path("cache"), True)
+    assert r.is_ignored(path("a/cache"), True)
+    assert not r.is_ignored(path("cache"), False)
+
+
+def test_negation_last_match_wins():
+    r = rules("*.log", "!keep.log")
+    assert r.is_ignored(path("debug.log"), False)
+    assert not r.is_ignored(path("keep.log"), False)
+    assert rules("!keep.log", "*.log").is_ignored(path("keep.log"), False)
+
+
+def test_negated_directory_only_pattern():
+    r = rules("out*", "!output/")
+    assert not r.is_ignored(path("output"), True)
+    assert r.is_ignored(path("output"), False)
+    assert r.is_ignored(path("out1"), True)
+
+
+def test_overrides_take_precedence_over_gitignore(tmp_path):
+    (tmp_path / ".gitignore").write_text("!*.tmp\n")
+    r = IgnoreRules.for_root(str(tmp_path), patterns=["*.tmp"], use_defaults=False)
+    assert r.is_ignored(str(tmp_path / "a.tmp"), False)
+
+
+def test_nested_gitignore_applies_below_its_directory(tmp_path):
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / ".gitignore").write_text("/generated\n*.out\n")
+    root = IgnoreRules.for_root(str(tmp_path), use_defaults=False)
+    nested = root.for_directory(str(tmp_path / "pkg"), has_ignore_file=True)
+    assert nested.is_ignored(str(tmp_path / "pkg" / "generated"), True)
+    assert nested.is_ignored(str(tmp_path / "pkg" / "deep" / "x.out"), False)
+    assert not root.is_ignored(str(tmp_path / "generated"), True)
+
+
+def test_default_excludes():
+    r = IgnoreRules.for_root(ROOT, use_gitignore=False)
+    assert r.is_ignored(path("web/node_modules"), True)
+    assert r.is_ignored(path(".git"), True)
+    assert not r.is_ignored(path("node_modules"), False)
+
+
+def test_rules_are_cached_per_root(tmp_path):
+    root = str(tmp_path)
+    assert IgnoreRules.for_root(root) is IgnoreRules.for_root(root)
+    (tmp_path / ".gitignore").write_text("*.log\n")
+    with_file = IgnoreRules.for_root(root)
+    assert with_file.is_ignored(str(tmp_path / "a.log"), False)
+    assert with_file is IgnoreRules.for_root(root)
@@ -0,0 +1,36 @@
+import pytest
+
+from src.file_controller import FileController
+
+
+@pytest.mark.parametrize("directory, pattern, search_type, regex", [
+    ("/tmp/project", "*.py", "name", False),
+    (["/srv/a", "/srv/b"], ["TODO", "FIXME"], "content", True),
+    ("/tmp/ünïcode dir", "résumé*", "name", False),
+])
+def test_cursor_round_trip(directory, pattern, search_type, regex):
+    cursor = FileController.encode_search_cursor(directory, pattern, search_type, 150, regex)
+    assert FileController.decode_search_cursor(cursor, directory, pattern, search_type, regex) == 150
+
+
+def test_cursor_is_url_safe():
+    cursor = FileController.encode_search_cursor("/tmp/?&=+/", "*", "name", 10)
+    assert all(ch.isalnum() or ch in "-_=" for ch in cursor)
+
+
+@pytest.mark.parametrize("other", [
+    ("/tmp/other", "*.py", "name", False),
+    ("/tmp/project", "*.txt", "name", False),
+    ("/tmp/project", "*.py", "type", False),
+    ("/tmp/project", "*.py", "name", True),
+])
+def test_cursor_rejects_other_search(other):
+    cursor = FileController.encode_search_cursor("/tmp/project", "*.py", "name", 50)
+    with pytest.raises(ValueError, match="does not belong"):
+        FileController.decode_search_cursor(cursor, *other)
+
+
+@pytest.mark.parametrize("cursor", ["not base64!", "bm90IGpzb24=", "e30="])
+def test_malformed_cursor(cursor):
+    with pytest.raises(ValueError, match="Malformed cursor"):
+        FileController.decode_search_cursor(cursor, "/tmp/project", "*.py", "name")
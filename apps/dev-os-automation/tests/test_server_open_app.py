@@ -0,0 +1,59 @@
+import asyncio
+import os
+import shutil
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src import server
+from src.models import ActionResult
+
+pytestmark = pytest.mark.skipif(os.name == "nt", reason="exercises the POSIX launch path")
+
+
+@pytest.fixture
+def client():
+    return TestClient(server.app)
+
+
+@pytest.mark.skipif(shutil.which("true") is None, reason="needs the 'true' executable on PATH")
+def test_open_app_launches_without_a_shell(client):
+    spawned = server.app_controller.spawner.spawned
+
+    response = client.post("/execute", json={"action": "open_app", "params": {"app_name": "true."}})
+
+    assert response.status_code == 200
+    assert response.json() == {"success": True, "message": "Launched true", "data": None}
+    assert server.app_controller.spawner.spawned == spawned + 1
+
+
+def test_open_app_reports_unknown_apps(client):
+    response = client.post("/execute", json={
+        "action": "open_app", "params": {"app_name": "no-such-app-4f1c2b"}})
+
+    assert response.json()["success"] is False
+    assert response.json()["message"] == "Application not found: no-such-app-4f1c2b"
+
+
+def test_open_app_requires_a_name(client):
+    response = client.post("/execute", json={"action": "open_app", "params": {}})
+
+    assert response.json() == {"success": False, "message": "app_name is required", "data": None}
+
+
+def test_open_app_launches_off_the_event_loop(client, monkeypatch):
+    on_loop = []
+
+    def launch(target, app_path=None):
+        try:
+            asyncio.get_running_loop()
+            on_loop.append(True)
+        except RuntimeError:
+            on_loop.append(False)
+        return ActionResult(success=True, action="launch_app", message=f"Launched {target}")
+
+    monkeypatch.setattr(server.app_controller, "launch", launch)
+    response = client.post("/execute", json={"action": "open_app", "params": {"app_name": "vs code"}})
+
+    assert response.json()["message"] == "Launched code"
+    assert on_loop == [False]
@@ -0,0 +1,56 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from src import server
+
+
+@pytest.fixture
+def ws():
+    with TestClient(server.app) as client, client.websocket_connect("/ws") as websocket:
+        yield websocket
+
+
+@pytest.mark.parametrize("text", ["[1, 2]", '"x"', "42", "null", "{not json"])
+def test_non_object_messages_get_an_error_frame(ws, text):
+    ws.send_text(text)
+    assert ws.receive_json() == {"type": "error", "message": "Messages must be JSON objects"}
+
+    ws.send_json({"type": "hello"})  # The connection stays usable
+    assert ws.receive_json() == {"type": "ack", "message": "Message received"}
+
+
+@pytest.mark.parametrize("field, value", [
+    ("interval", "fast"), ("interval", None), ("interval", [1]),
+    ("threshold", "big"), ("threshold", {}), ("threshold", "nan"),
+])
+def test_bad_telemetry_numbers_get_an_error_frame(ws, field, value):
+    ws.send_json({"type": "subscribe_telemetry", field: value})
+    reply = ws.receive_json()
+    assert reply["type"] == "error"
+
+    ws.send_json({"type": "subscribe_telemetry", "interval": 0.5})
+    assert ws.receive_json()["type"] == "ack"
+    ws.send_json({"type": "unsubscribe_telemetry"})
+
+
+def current_topics(ws):
+    ws.send_json({"type": "unsubscribe", "topics": []})
+    return ws.receive_json()["topics"]
+
+
+def test_explicit_empty_topics_are_not_all_topics(ws):
+    ws.send_json({"type": "subscribe", "topics": []})
+    assert ws.receive_json() == {"type": "ack", "message": "Subscribed to no topics", "topics": []}
+
+
+@pytest.mark.parametrize("message", [
+    {"process_names": "chrome"},
+    {"process_names": [1, 2]},
+    {"batch_ms": "fast"},
+    {"topics": "file"},
+])
+def test_invalid_subscribe_leaves_the_subscription_alone(ws, message):
+    before = current_topics(ws)
+    ws.send_json({"type": "subscribe", "topics": ["file"], **message})
+    assert ws.receive_json()["type"] == "error"
+    assert current_topics(ws) == before